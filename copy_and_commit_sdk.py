@@ -2,18 +2,28 @@
 
 import os
 import sys
-import shutil
+import json
+import hashlib
+import tempfile
 import subprocess
 import argparse
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Tuple, Optional
-import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from codegen_ignore import compile_patterns, read_ignore_file, walk_tree  # noqa: E402
+from fast_copy import LINK_MODES, CopyStats, clone_file, file_digest  # noqa: E402
+from sync_profiler import profiler  # noqa: E402
 
 # ============================================================================
 # DEFAULT IGNORE PATTERNS
 # These patterns are used if no .codegenignore file is found
 # Add file patterns here that should not be overwritten in the destination
-# Supports wildcards: *.md, docs/*, etc.
+# Uses gitignore semantics: *.md, docs/, /uv.lock, **/tests, !keep.md, etc.
 # ============================================================================
 DEFAULT_IGNORE_PATTERNS = [
     "*.md",
@@ -25,6 +35,11 @@ DEFAULT_IGNORE_PATTERNS = [
     # Add more patterns here as needed
 ]
 
+# Name of the manifest written to the destination directory by --incremental.
+# It maps each copied file's relative path to the size, mtime and SHA-256 digest
+# last seen in the destination, so unchanged files don't need to be re-hashed.
+MANIFEST_FILENAME = ".codegen-manifest.json"
+
 
 # ANSI color codes
 class Colors:
@@ -118,19 +133,8 @@ def load_ignore_patterns(ignore_file: Optional[Path]) -> List[str]:
         Logger.warn("No codegen ignore file found - using default patterns")
         return DEFAULT_IGNORE_PATTERNS
 
-    patterns = []
     try:
-        with open(ignore_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Strip whitespace
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-
-                patterns.append(line)
-
+        patterns = read_ignore_file(ignore_file)
         Logger.info(f"Loaded {len(patterns)} pattern(s) from {ignore_file}")
         return patterns
 
@@ -148,6 +152,9 @@ def should_ignore_file(file_path: Path, dest_dir: Path, patterns: List[str]) ->
     """
     Check if a file should be ignored based on patterns
 
+    Patterns use gitignore semantics and are compiled once per pattern list,
+    so repeated calls only cost a few regex matches.
+
     Args:
         file_path: The destination file path to check
         dest_dir: The destination directory root
@@ -163,39 +170,261 @@ def should_ignore_file(file_path: Path, dest_dir: Path, patterns: List[str]) ->
         # If file_path is not relative to dest_dir, don't ignore
         return False
 
-    rel_path_str = str(rel_path)
-    filename = file_path.name
+    return compile_patterns(tuple(patterns)).is_ignored(rel_path.as_posix())
 
-    # Check against ignore patterns
-    for pattern in patterns:
-        if not pattern:
-            continue
 
-        # Check if the relative path matches the pattern
-        if fnmatch.fnmatch(rel_path_str, pattern):
-            return True
+def load_only_paths(only_paths_file: Path) -> List[str]:
+    """
+    Load the patterns that restrict which source files are copied
+
+    The file uses the same syntax as .codegenignore (e.g. the output of
+    scripts/spec_impact.py --paths-file). An empty file restricts the copy to
+    nothing.
+
+    Args:
+        only_paths_file: Path to the patterns file
+
+    Returns:
+        List of patterns
+    """
+    try:
+        patterns = read_ignore_file(only_paths_file)
+    except OSError as e:
+        Logger.error(f"Could not read --only-paths file {only_paths_file}: {e}")
+        sys.exit(1)
+    Logger.info(f"Restricting copy to {len(patterns)} path pattern(s) from {only_paths_file}")
+    return patterns
+
+
+def load_manifest(dest_dir: Path) -> Dict[str, dict]:
+    """
+    Load the incremental sync manifest from the destination directory
+
+    Args:
+        dest_dir: Destination directory root
+
+    Returns:
+        Mapping of relative path to recorded {size, mtime_ns, sha256} entry.
+        An empty mapping is returned if the manifest is missing or unreadable.
+    """
+    manifest_path = dest_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (IOError, ValueError) as e:
+        Logger.warn(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+    files = data.get('files') if isinstance(data, dict) else None
+    return files if isinstance(files, dict) else {}
+
+
+def save_manifest(dest_dir: Path, manifest: Dict[str, dict]):
+    """
+    Atomically write the incremental sync manifest to the destination directory
+
+    Args:
+        dest_dir: Destination directory root
+        manifest: Mapping of relative path to {size, mtime_ns, sha256} entry
+    """
+    manifest_path = dest_dir / MANIFEST_FILENAME
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'files': manifest}, f, sort_keys=True, separators=(',', ':'))
+    os.replace(tmp_path, manifest_path)
+
+
+def classify_file(src_file: Path, dest_file: Path, entry: Optional[dict]) -> Tuple[str, Optional[str]]:
+    """
+    Decide whether a source file differs from its destination copy
+
+    Sizes are compared first, then mtimes (shutil.copy2 preserves them, so an
+    identical size and mtime means the file was copied by a previous run), and
+    finally SHA-256 digests. The destination digest is taken from the manifest
+    entry when the entry still matches the destination's size and mtime.
+
+    Args:
+        src_file: Source file path
+        dest_file: Destination file path
+        entry: Manifest entry recorded for the destination file, if any
+
+    Returns:
+        Tuple of (status, source_digest) where status is NEW, CHANGED or
+        UNCHANGED and source_digest is the SHA-256 digest if it was computed
+    """
+    if not dest_file.exists():
+        return 'NEW', None
+
+    src_stat = src_file.stat()
+    dest_stat = dest_file.stat()
+
+    if src_stat.st_size != dest_stat.st_size:
+        return 'CHANGED', None
+
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return 'UNCHANGED', None
 
-        # Also check just the filename for patterns like "*.md"
-        if fnmatch.fnmatch(filename, pattern):
-            return True
+    if (entry and entry.get('sha256')
+            and entry.get('size') == dest_stat.st_size
+            and entry.get('mtime_ns') == dest_stat.st_mtime_ns):
+        dest_digest = entry['sha256']
+    else:
+        dest_digest = file_digest(dest_file)
+
+    src_digest = file_digest(src_file)
+    return ('UNCHANGED' if src_digest == dest_digest else 'CHANGED'), src_digest
+
+
+def manifest_entry(dest_file: Path, digest: Optional[str]) -> dict:
+    """Build a manifest entry from the destination file's current state"""
+    dest_stat = dest_file.stat()
+    entry = {'size': dest_stat.st_size, 'mtime_ns': dest_stat.st_mtime_ns}
+    if digest:
+        entry['sha256'] = digest
+    return entry
+
+
+def sync_file(
+        src_file: Path,
+        dest_file: Path,
+        entry: Optional[dict],
+        pretend_mode: bool,
+        incremental: bool,
+        link_mode: str = 'copy',
+        copy_stats: Optional[CopyStats] = None
+) -> Tuple[str, Optional[dict]]:
+    """
+    Classify and (unless in pretend mode) copy a single file
+
+    The destination's parent directory must already exist. This function is
+    safe to run concurrently for different files.
+
+    Args:
+        src_file: Source file path
+        dest_file: Destination file path
+        entry: Manifest entry recorded for the destination file, if any
+        pretend_mode: If True, only classify the file
+        incremental: If True, skip files whose contents are unchanged
+        link_mode: Copy strategy passed to fast_copy.clone_file
+        copy_stats: Optional tally of the copy strategies used
+
+    Returns:
+        Tuple of (status, new_manifest_entry). The manifest entry is only
+        produced for incremental, non-pretend runs.
+    """
+    digest = None
+    if incremental:
+        status, digest = classify_file(src_file, dest_file, entry)
+    elif pretend_mode:
+        status = 'OVERWRITE' if dest_file.exists() else 'NEW'
+    else:
+        status = 'COPIED'
 
-        # Handle directory patterns like "docs/*"
-        if '/' in pattern:
-            if fnmatch.fnmatch(rel_path_str, pattern):
-                return True
+    if pretend_mode:
+        return status, None
+
+    if status != 'UNCHANGED':
+        strategy = clone_file(src_file, dest_file, link_mode)
+        size = dest_file.stat().st_size
+        profiler.count('bytes_copied', size)
+        profiler.count(f'files_{strategy}')
+        if copy_stats is not None:
+            copy_stats.record(strategy, size)
+        if incremental:
+            # Record the digest so the next run can trust size+mtime
+            digest = digest or file_digest(src_file)
+    elif digest is None and entry:
+        digest = entry.get('sha256')
 
-    return False
+    return status, (manifest_entry(dest_file, digest) if incremental else None)
 
 
-def copy_files(src_dir: Path, dest_dir: Path, patterns: List[str], pretend_mode: bool) -> Tuple[int, int]:
+def run_ordered(func: Callable, items: List[tuple], jobs: int) -> Iterator:
+    """
+    Apply func to each argument tuple, yielding results in input order
+
+    With jobs > 1 the calls run on a bounded thread pool, with at most
+    2 * jobs submitted ahead of the result being waited for. As soon as any
+    call raises, calls that haven't started yet are skipped, so no new work
+    starts after the first failure; calls already running finish, and the
+    exception propagates when its item is reached in input order.
+
+    Args:
+        func: Function to call
+        items: List of argument tuples
+        jobs: Maximum number of concurrent calls
+
+    Yields:
+        Tuple of (args, result) for each item, in input order
+    """
+    if jobs <= 1:
+        for args in items:
+            yield args, func(*args)
+        return
+
+    failed = threading.Event()
+
+    def call(*args):
+        if failed.is_set():
+            # Only items after the failing one get here: the pool starts work in submission order
+            return None
+        try:
+            return func(*args)
+        except BaseException:
+            failed.set()
+            raise
+
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    pending: deque = deque()
+    remaining = iter(items)
+    try:
+        while True:
+            while len(pending) < 2 * jobs and not failed.is_set():
+                args = next(remaining, None)
+                if args is None:
+                    break
+                pending.append((args, executor.submit(call, *args)))
+            if not pending:
+                break
+            args, future = pending.popleft()
+            yield args, future.result()
+    finally:
+        failed.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def copy_files(
+        src_dir: Path,
+        dest_dir: Path,
+        patterns: List[str],
+        pretend_mode: bool,
+        incremental: bool = False,
+        jobs: int = 1,
+        link_mode: str = 'copy',
+        only_paths: Optional[List[str]] = None
+) -> Tuple[int, int]:
     """
     Recursively copy files from source to destination
 
+    The source tree is walked once, without descending into ignored
+    directories, to build a sorted copy plan; directory
+    creation and file copies then run on up to `jobs` worker threads. Output
+    and counts are reported in plan order, so they don't depend on `jobs`.
+
     Args:
         src_dir: Source directory
         dest_dir: Destination directory
         patterns: List of ignore patterns
         pretend_mode: If True, only show what would be done
+        incremental: If True, only copy files whose contents differ from the
+            destination and record the results in the destination manifest
+        jobs: Number of worker threads used for mkdir/copy operations
+        link_mode: Copy strategy (copy, reflink, hardlink or auto); see fast_copy
+        only_paths: If given, only files matching one of these patterns are
+            copied; other files are left alone in the destination
 
     Returns:
         Tuple of (copied_count, skipped_count)
@@ -204,6 +433,11 @@ def copy_files(src_dir: Path, dest_dir: Path, patterns: List[str], pretend_mode:
 
     copied_count = 0
     skipped_count = 0
+    status_counts = {'NEW': 0, 'CHANGED': 0, 'UNCHANGED': 0}
+
+    old_manifest = load_manifest(dest_dir) if incremental else {}
+    new_manifest: Dict[str, dict] = {}
+    copy_stats = CopyStats()
 
     if pretend_mode:
         Logger.pretend(f"Would create destination directory if needed: {dest_dir}")
@@ -219,48 +453,119 @@ def copy_files(src_dir: Path, dest_dir: Path, patterns: List[str], pretend_mode:
         # Create destination directory if it doesn't exist
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-    # Walk through all files in source directory
-    for src_file in src_dir.rglob('*'):
-        if src_file.is_file():
-            # Calculate relative path and destination file path
-            rel_path = src_file.relative_to(src_dir)
-            dest_file = dest_dir / rel_path
-
-            # Check if file should be ignored
-            if should_ignore_file(dest_file, dest_dir, patterns):
-                if pretend_mode:
-                    Logger.pretend(f"  [SKIP] {rel_path} (matches ignore pattern)")
-                else:
-                    Logger.warn(f"Skipping ignored file: {rel_path}")
-                skipped_count += 1
-                continue
+    # Walk the source directory once, pruning ignored directories, to build the copy plan
+    matcher = compile_patterns(tuple(patterns))
+    only_matcher = compile_patterns(tuple(only_paths)) if only_paths is not None else None
+    plan = []
+    skipped_dir_count = 0
+    outside_count = 0
+    for action, rel_key in walk_tree(src_dir, matcher):
+        rel_path = Path(rel_key)
 
+        if action == 'skip-dir':
             if pretend_mode:
-                # Show if file exists and would be overwritten
-                if dest_file.exists():
-                    Logger.pretend(f"  [OVERWRITE] {rel_path}")
-                else:
-                    Logger.pretend(f"  [NEW] {rel_path}")
+                Logger.pretend(f"  [SKIP] {rel_path}/ (directory matches ignore pattern)")
             else:
-                # Create parent directory if needed
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
+                Logger.warn(f"Skipping ignored directory: {rel_path}/")
+            skipped_dir_count += 1
+            continue
 
-                # Copy the file
-                shutil.copy2(src_file, dest_file)
+        if action == 'skip':
+            if pretend_mode:
+                Logger.pretend(f"  [SKIP] {rel_path} (matches ignore pattern)")
+            else:
+                Logger.warn(f"Skipping ignored file: {rel_path}")
+            skipped_count += 1
+            continue
+
+        if only_matcher is not None and not only_matcher.is_ignored(rel_key):
+            # Not affected by this change; keep its manifest entry for the next run
+            if rel_key in old_manifest:
+                new_manifest[rel_key] = old_manifest[rel_key]
+            outside_count += 1
+            continue
+
+        src_file = src_dir / rel_path
+        dest_file = dest_dir / rel_path
+        plan.append((
+            src_file, dest_file, old_manifest.get(rel_key), pretend_mode, incremental, link_mode, copy_stats
+        ))
+
+    try:
+        if not pretend_mode:
+            # os.makedirs(exist_ok=True) tolerates workers racing on shared parents
+            parent_dirs = sorted({item[1].parent for item in plan} - {dest_dir})
+            for _ in run_ordered(os.makedirs, [(d, 0o777, True) for d in parent_dirs], jobs):
+                pass
+
+        for (src_file, dest_file, *_), (status, entry) in run_ordered(sync_file, plan, jobs):
+            rel_path = dest_file.relative_to(dest_dir)
+
+            if incremental:
+                status_counts[status] += 1
+                if entry is not None:
+                    new_manifest[rel_path.as_posix()] = entry
+
+            if pretend_mode:
+                Logger.pretend(f"  [{status}] {rel_path}")
+
+            if status != 'UNCHANGED':
+                copied_count += 1
 
-            copied_count += 1
+    except OSError as e:
+        Logger.error(f"Failed to copy {e.filename or ''}: {e.strerror or e}")
+        if link_mode == 'reflink':
+            Logger.error("Use --link-mode auto to fall back when the filesystem can't clone files")
+        Logger.error("Stopped copying after the first failure; destination may be partially updated")
+        sys.exit(1)
+
+    if incremental and not pretend_mode:
+        save_manifest(dest_dir, new_manifest)
+
+    profiler.count('files_walked', len(plan) + skipped_count + outside_count)
+    profiler.count('files_copied', 0 if pretend_mode else copied_count)
+    profiler.count('files_skipped', skipped_count)
+    profiler.count('dirs_pruned', skipped_dir_count)
+    profiler.count('bytes_avoided', copy_stats.bytes_avoided)
+
+    counts_summary = (
+        f"new: {status_counts['NEW']}, changed: {status_counts['CHANGED']}, "
+        f"unchanged: {status_counts['UNCHANGED']}"
+    )
 
     if pretend_mode:
         print()
-        Logger.pretend(f"Summary: Would copy {copied_count} file(s), skip {skipped_count} file(s)")
+        Logger.pretend(
+            f"Summary: Would copy {copied_count} file(s), skip {skipped_count} file(s) "
+            f"and {skipped_dir_count} director(y/ies)"
+        )
+        if incremental:
+            Logger.pretend(f"Incremental: {counts_summary}")
+        if only_matcher is not None:
+            Logger.pretend(f"Only paths: {outside_count} file(s) outside --only-paths left alone")
+        Logger.pretend(f"Link mode: {link_mode}")
         print()
     else:
-        Logger.info(f"Copied {copied_count} file(s), skipped {skipped_count} file(s)")
+        Logger.info(
+            f"Copied {copied_count} file(s), skipped {skipped_count} file(s) "
+            f"and {skipped_dir_count} director(y/ies)"
+        )
+        if incremental:
+            Logger.info(f"Incremental: {counts_summary}")
+        if only_matcher is not None:
+            Logger.info(f"Only paths: {outside_count} file(s) outside --only-paths left alone")
+        Logger.info(f"Copy strategies ({link_mode} mode): {copy_stats.summary()}")
 
     return copied_count, skipped_count
 
 
-def run_git_command(git_root: Path, command: List[str], check: bool = True) -> subprocess.CompletedProcess:
+def run_git_command(
+        git_root: Path,
+        command: List[str],
+        check: bool = True,
+        input: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None
+) -> subprocess.CompletedProcess:
     """
     Run a git command in the specified directory
 
@@ -268,16 +573,21 @@ def run_git_command(git_root: Path, command: List[str], check: bool = True) -> s
         git_root: Git repository root directory
         command: Git command as list of strings
         check: If True, raise exception on non-zero exit code
+        input: Optional text written to the command's stdin
+        env: Optional environment variables added to the current environment
 
     Returns:
         CompletedProcess instance
     """
     full_command = ['git', '-C', str(git_root)] + command
+    profiler.count('subprocesses')
     return subprocess.run(
         full_command,
         capture_output=True,
         text=True,
-        check=check
+        check=check,
+        input=input,
+        env={**os.environ, **env} if env else None
     )
 
 
@@ -305,6 +615,7 @@ def check_git_repo(dest_dir: Path, pretend_mode: bool):
         sys.exit(1)
 
 
+@lru_cache(maxsize=None)
 def get_git_root(dest_dir: Path) -> Path:
     """Get the root directory of the git repository"""
     result = run_git_command(dest_dir, ['rev-parse', '--show-toplevel'])
@@ -385,11 +696,16 @@ def has_changes(git_root: Path) -> bool:
     return result_diff.returncode != 0 or result_cached.returncode != 0
 
 
+def manifest_exclude_pathspec(path: Path) -> str:
+    """Build a pathspec that excludes the incremental sync manifest under path"""
+    return f":(exclude){(path / MANIFEST_FILENAME).as_posix()}"
+
+
 def get_status_porcelain(git_root: Path, path: Path) -> str:
     """Get git status in porcelain format for a specific path"""
     result = run_git_command(
         git_root,
-        ['status', '--porcelain', str(path)],
+        ['status', '--porcelain', '--', str(path), manifest_exclude_pathspec(path)],
         check=False
     )
     return result.stdout
@@ -454,7 +770,7 @@ def commit_and_push(dest_dir: Path, branch_name: str, pretend_mode: bool):
 
         # Stage all changes in destination directory
         Logger.info(f"Staging changes in {rel_dest_dir}")
-        run_git_command(git_root, ['add', str(rel_dest_dir)])
+        run_git_command(git_root, ['add', '--', str(rel_dest_dir), manifest_exclude_pathspec(rel_dest_dir)])
 
         # Commit changes
         commit_msg = f"Update SDK files in {rel_dest_dir}"
@@ -468,6 +784,241 @@ def commit_and_push(dest_dir: Path, branch_name: str, pretend_mode: bool):
         Logger.info(f"Successfully pushed changes to remote branch: {branch_name}")
 
 
+def git_blob_id(path: Path) -> str:
+    """Compute the git blob object id of a file without writing it to the object store"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def git_file_mode(path: Path) -> str:
+    """Return the git tree entry mode for a regular file"""
+    return '100755' if os.access(path, os.X_OK) else '100644'
+
+
+def resolve_plumbing_parent(git_root: Path, branch_name: str) -> Tuple[Optional[str], bool]:
+    """
+    Find the commit a plumbing-mode commit should be built on
+
+    Only local refs are consulted, so no network round trip is needed. The
+    local branch is preferred, then the remote-tracking branch, then HEAD.
+
+    Args:
+        git_root: Git repository root directory
+        branch_name: Target branch name
+
+    Returns:
+        Tuple of (parent_commit, local_branch_exists). parent_commit is None
+        in a repository without any commits.
+    """
+    candidates = [
+        (f'refs/heads/{branch_name}', True),
+        (f'refs/remotes/origin/{branch_name}', False),
+        ('HEAD', False),
+    ]
+    for ref, is_local in candidates:
+        result = run_git_command(git_root, ['rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}'], check=False)
+        if result.returncode == 0:
+            return result.stdout.strip(), is_local
+    return None, False
+
+
+def branch_worktree(git_root: Path, branch_name: str) -> Optional[Path]:
+    """
+    Find the worktree that has a branch checked out
+
+    Args:
+        git_root: Git repository root directory
+        branch_name: Branch name
+
+    Returns:
+        Path of the (main or linked) worktree whose HEAD is the branch, or
+        None if it isn't checked out anywhere
+    """
+    result = run_git_command(git_root, ['worktree', 'list', '--porcelain'])
+    worktree = None
+    for line in result.stdout.splitlines():
+        if line.startswith('worktree '):
+            worktree = Path(line[len('worktree '):])
+        elif line == f'branch refs/heads/{branch_name}':
+            return worktree
+    return None
+
+
+def read_tree_entries(git_root: Path, commit: Optional[str], prefix: str) -> Dict[str, Tuple[str, str]]:
+    """
+    List the blobs under a path prefix in a commit's tree
+
+    Args:
+        git_root: Git repository root directory
+        commit: Commit to read, or None for an empty tree
+        prefix: Repository-relative directory prefix ('' for the whole tree)
+
+    Returns:
+        Mapping of repository-relative path to (mode, object_id)
+    """
+    if commit is None:
+        return {}
+
+    command = ['ls-tree', '-r', '-z', '--full-tree', commit]
+    if prefix:
+        command += ['--', prefix]
+    result = run_git_command(git_root, command)
+
+    entries = {}
+    for record in result.stdout.split('\0'):
+        if not record:
+            continue
+        info, path = record.split('\t', 1)
+        mode, _, object_id = info.split(' ')
+        entries[path] = (mode, object_id)
+    return entries
+
+
+def plumbing_commit(
+        src_dir: Path,
+        dest_dir: Path,
+        branch_name: str,
+        patterns: List[str],
+        pretend_mode: bool,
+        push: bool,
+        jobs: int = 1,
+        only_paths: Optional[List[str]] = None
+):
+    """
+    Commit the source directory onto a branch without touching the worktree
+
+    The new tree is built in a temporary index from the branch's current
+    tree. Only blobs whose ids differ from that tree are written, using one
+    hash-object, update-index, write-tree and commit-tree process each. The
+    branch ref is updated with a compare-and-swap, so concurrent runs against
+    different branches (or a racing run on the same branch) are safe.
+
+    A branch checked out in any worktree is refused when committing: moving
+    its ref would leave that worktree's index and files at the old tree, so
+    `git status` would show the new commit reverted.
+
+    Args:
+        src_dir: Source directory
+        dest_dir: Destination directory inside the git repository
+        branch_name: Branch to commit to
+        patterns: List of ignore patterns
+        pretend_mode: If True, only show what would be committed
+        push: If True, write the commit and push the branch to origin
+        jobs: Number of worker threads used to hash source files
+        only_paths: If given, only files matching one of these patterns are
+            committed; the branch keeps its current version of other files
+    """
+    Logger.action(f"Building commit for {branch_name} from {src_dir} using git plumbing", pretend_mode)
+
+    git_root = get_git_root(dest_dir)
+    rel_dest_dir = dest_dir.relative_to(git_root)
+    prefix = '' if rel_dest_dir == Path('.') else rel_dest_dir.as_posix() + '/'
+
+    checked_out_in = branch_worktree(git_root, branch_name)
+    if checked_out_in is not None:
+        message = (f"Branch {branch_name} is checked out in {checked_out_in}; --plumbing can't commit to it "
+                   f"without leaving that worktree behind. Run without --plumbing, or use another branch.")
+        if push and not pretend_mode:
+            Logger.error(message)
+            sys.exit(1)
+        Logger.warn(message)
+
+    parent, local_exists = resolve_plumbing_parent(git_root, branch_name)
+    Logger.info(f"Base commit: {parent[:12] if parent else '(none)'}")
+    existing = read_tree_entries(git_root, parent, prefix.rstrip('/'))
+
+    # Walk the source once and compute blob ids for every non-ignored file
+    matcher = compile_patterns(tuple(patterns))
+    only_matcher = compile_patterns(tuple(only_paths)) if only_paths is not None else None
+    files = []
+    skipped_count = 0
+    for action, rel_key in walk_tree(src_dir, matcher):
+        if action != 'copy':
+            skipped_count += 1
+        elif only_matcher is None or only_matcher.is_ignored(rel_key):
+            files.append((src_dir / rel_key,))
+
+    profiler.count('files_walked', len(files) + skipped_count)
+    profiler.count('files_skipped', skipped_count)
+
+    changes = []
+    for (src_file,), object_id in run_ordered(git_blob_id, files, jobs):
+        repo_path = prefix + src_file.relative_to(src_dir).as_posix()
+        mode = git_file_mode(src_file)
+        if existing.get(repo_path) != (mode, object_id):
+            status = 'CHANGED' if repo_path in existing else 'NEW'
+            changes.append((status, mode, object_id, repo_path, src_file))
+
+    for status, _, _, repo_path, _ in changes:
+        if pretend_mode:
+            Logger.pretend(f"  [{status}] {repo_path}")
+        else:
+            Logger.info(f"  [{status}] {repo_path}")
+
+    Logger.info(
+        f"{len(changes)} of {len(files)} file(s) changed, "
+        f"{skipped_count} ignored source entr(y/ies) skipped"
+    )
+
+    if not changes:
+        Logger.info("No changes to commit")
+        return
+
+    commit_msg = f"Update SDK files in {rel_dest_dir}"
+    if pretend_mode or not push:
+        Logger.action(f'Would commit {len(changes)} file(s) to {branch_name}: "{commit_msg}"', True)
+        if not pretend_mode:
+            Logger.info("Skipping commit and push (use --commit to enable)")
+        return
+
+    # Write only the changed blobs, in one hash-object process
+    stdin_paths = ''.join(f"{src_file}\n" for _, _, _, _, src_file in changes)
+    written = run_git_command(
+        git_root, ['hash-object', '-w', '--no-filters', '--stdin-paths'], input=stdin_paths
+    ).stdout.split()
+    profiler.count('files_copied', len(changes))
+    profiler.count('bytes_copied', sum(src_file.stat().st_size for _, _, _, _, src_file in changes))
+    for change, written_id in zip(changes, written):
+        if change[2] != written_id:
+            raise RuntimeError(f"Blob id mismatch for {change[3]}: {change[2]} != {written_id}")
+
+    fd, index_path = tempfile.mkstemp(prefix='codegen-index-')
+    os.close(fd)
+    os.unlink(index_path)
+    index_env = {'GIT_INDEX_FILE': index_path}
+    try:
+        if parent:
+            run_git_command(git_root, ['read-tree', parent], env=index_env)
+        else:
+            run_git_command(git_root, ['read-tree', '--empty'], env=index_env)
+
+        index_info = ''.join(
+            f"{mode} {object_id}\t{repo_path}\n" for _, mode, object_id, repo_path, _ in changes
+        )
+        run_git_command(git_root, ['update-index', '--index-info'], input=index_info, env=index_env)
+        tree = run_git_command(git_root, ['write-tree'], env=index_env).stdout.strip()
+    finally:
+        if os.path.exists(index_path):
+            os.unlink(index_path)
+
+    commit_command = ['commit-tree', tree, '-m', commit_msg]
+    if parent:
+        commit_command += ['-p', parent]
+    commit = run_git_command(git_root, commit_command).stdout.strip()
+
+    # Compare-and-swap: fail if the branch moved (or appeared) since we read it
+    old_value = parent if local_exists else '0' * 40
+    Logger.info(f"Committing changes: {commit_msg} ({commit[:12]})")
+    run_git_command(git_root, ['update-ref', '-m', commit_msg, f'refs/heads/{branch_name}', commit, old_value])
+
+    Logger.info(f"Pushing branch {branch_name} to remote")
+    run_git_command(git_root, ['push', 'origin', f'refs/heads/{branch_name}:refs/heads/{branch_name}'])
+
+    Logger.info(f"Successfully pushed changes to remote branch: {branch_name}")
+
+
 def print_banner(pretend_mode: bool):
     """Print the pretend mode banner"""
     if pretend_mode:
@@ -511,6 +1062,42 @@ When --pretend is specified, the script will:
 
 By default, the script will NOT commit and push changes. Use --commit to enable.
 
+When --incremental is specified, files are compared by size and mtime, then by
+SHA-256 digest, and only files whose contents changed are copied. Results are
+recorded in a .codegen-manifest.json file in the destination directory, which
+is never staged by --commit.
+
+--plumbing builds the new tree directly from the source directory with git
+plumbing commands (hash-object, update-index, write-tree, commit-tree) and
+updates the branch ref without checking it out or copying any files. Only
+blobs that differ from the branch's current tree are written. The base is the
+local branch, then origin/<branch>, then HEAD; no ls-remote call is made.
+Combine with --commit to write the commit and push it. A branch that is
+checked out in any worktree of the repository is refused, since moving its
+ref would leave that worktree's index and files behind; run without
+--plumbing for it, or commit to another branch.
+
+--profile PATH writes a JSON report with the wall time, file counts, bytes
+copied and git subprocess count of each phase (ignore_file_discovery,
+branch_setup, copy_files, status, commit_and_push / plumbing_commit).
+--cprofile PATH additionally writes a cProfile dump for snakeviz/pstats.
+
+--link-mode controls how files are copied. 'copy' uses shutil.copy2. 'reflink'
+clones files with FICLONE and fails on filesystems that can't. 'auto' tries
+FICLONE, then os.copy_file_range, then a plain copy. 'hardlink' makes the
+destination share the source's inode (opt-in; edits to either affect both),
+falling back to 'auto' across filesystems. The strategies used and the bytes
+that didn't need copying are reported after the copy.
+
+--only-paths FILE restricts the copy (or --plumbing commit) to source files
+matching the patterns in FILE, which uses .codegenignore syntax. Other files
+in the destination are left as they are. scripts/spec_impact.py --paths-file
+writes such a file listing the SDK files affected by a spec change.
+
+--jobs N copies files on N worker threads. The source tree is still walked once
+and output is reported in sorted path order, so logs and counts are the same for
+any N. The run stops at the first file that fails to copy.
+
 The --output-status flag will print the git status output to the console after
 copying files, which is useful for reviewing changes before committing.
         """
@@ -554,6 +1141,53 @@ copying files, which is useful for reviewing changes before committing.
         help='Commit and push changes to remote (default: False)'
     )
 
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only copy files whose contents differ from the destination'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of worker threads used to copy files (default: 1)'
+    )
+
+    parser.add_argument(
+        '--link-mode',
+        choices=LINK_MODES,
+        default='copy',
+        help='How files are copied: copy, reflink, hardlink or auto (default: copy)'
+    )
+
+    parser.add_argument(
+        '--only-paths',
+        type=Path,
+        metavar='FILE',
+        help='Only copy source files matching the patterns in FILE (.codegenignore syntax)'
+    )
+
+    parser.add_argument(
+        '--plumbing',
+        action='store_true',
+        help='Build the commit with git plumbing without checking out the branch or copying files'
+    )
+
+    parser.add_argument(
+        '--profile',
+        metavar='PATH',
+        help="Write a JSON phase timing report to PATH ('-' for stdout)"
+    )
+
+    parser.add_argument(
+        '--cprofile',
+        type=Path,
+        metavar='PATH',
+        help='Write a cProfile (pstats) dump of the run to PATH'
+    )
+
     parser.add_argument(
         '--output-status',
         action='store_true',
@@ -562,6 +1196,18 @@ copying files, which is useful for reviewing changes before committing.
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    profiler.start(args.profile, args.cprofile)
+    try:
+        run_sync(args)
+    finally:
+        profiler.finish()
+
+
+def run_sync(args: argparse.Namespace):
+    """Run the copy/commit workflow for parsed command line arguments"""
     # Show pretend mode banner
     print_banner(args.pretend)
 
@@ -579,35 +1225,60 @@ copying files, which is useful for reviewing changes before committing.
     destination_dir = args.destination_dir.resolve()
 
     # Find and load ignore patterns
-    ignore_file = find_codegen_ignore_file(args.codegen_ignore_file)
-    ignore_patterns = load_ignore_patterns(ignore_file)
+    with profiler.phase('ignore_file_discovery'):
+        ignore_file = find_codegen_ignore_file(args.codegen_ignore_file)
+        ignore_patterns = load_ignore_patterns(ignore_file)
+        only_paths = load_only_paths(args.only_paths) if args.only_paths else None
 
     if args.pretend:
         Logger.pretend("Configuration:")
         Logger.pretend(f"  Source directory: {source_dir}")
         Logger.pretend(f"  Destination directory: {destination_dir}")
         Logger.pretend(f"  Branch name: {args.branch}")
+        Logger.pretend(f"  Incremental: {args.incremental}")
+        Logger.pretend(f"  Copy jobs: {args.jobs}")
+        Logger.pretend(f"  Link mode: {args.link_mode}")
         Logger.pretend(f"  Ignore patterns: {len(ignore_patterns)} pattern(s) configured")
         if ignore_file:
             Logger.pretend(f"  Ignore file: {ignore_file}")
+        if only_paths is not None:
+            Logger.pretend(f"  Only paths: {len(only_paths)} pattern(s) from {args.only_paths}")
         print()
 
     # Check if destination is in a git repository
-    check_git_repo(destination_dir, args.pretend)
+    with profiler.phase('branch_setup'):
+        check_git_repo(destination_dir, args.pretend)
+
+    if args.plumbing:
+        # Build the commit straight from the source directory; the checkout is never touched
+        with profiler.phase('plumbing_commit'):
+            plumbing_commit(
+                source_dir, destination_dir, args.branch, ignore_patterns,
+                args.pretend, args.commit, args.jobs, only_paths
+            )
+        print_footer(args.pretend)
+        return
 
     # Setup git branch
-    setup_git_branch(destination_dir, args.branch, args.pretend)
+    with profiler.phase('branch_setup'):
+        setup_git_branch(destination_dir, args.branch, args.pretend)
 
     # Copy files
-    copy_files(source_dir, destination_dir, ignore_patterns, args.pretend)
+    with profiler.phase('copy_files'):
+        copy_files(
+                source_dir, destination_dir, ignore_patterns, args.pretend,
+                args.incremental, args.jobs, args.link_mode, only_paths
+            )
 
     # Output git status if requested
     if args.output_status:
-        output_git_status(destination_dir)
+        with profiler.phase('status'):
+            output_git_status(destination_dir)
 
     # Commit and push changes (only if --commit flag is passed)
     if args.commit:
-        commit_and_push(destination_dir, args.branch, args.pretend)
+        with profiler.phase('commit_and_push'):
+            commit_and_push(destination_dir, args.branch, args.pretend)
     else:
         if not args.pretend:
             Logger.info("Skipping commit and push (use --commit to enable)")
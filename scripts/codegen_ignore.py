@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Compiled .codegenignore matcher shared by the SDK copy scripts.
+
+Patterns follow gitignore semantics:
+    - A pattern without a slash (e.g. "*.md") matches at any depth
+    - A pattern containing a slash (e.g. "src/griddy/nfl/sdk.py", "/uv.lock")
+      is anchored to the root of the tree
+    - A trailing slash (e.g. "docs/") only matches directories
+    - "**" matches across directories ("**/tests", "docs/**", "a/**/b")
+    - A leading "!" re-includes paths excluded by an earlier pattern
+    - Files inside an ignored directory are ignored and cannot be re-included
+
+The whole pattern list is compiled into one regex per run of same-sign
+patterns, so each path is checked with a handful of regex matches instead of
+several fnmatch calls per pattern. The tree walk prunes ignored directories
+without descending into them.
+
+Usage:
+    python codegen_ignore.py walk <source_dir> [--ignore-file FILE] [--pattern PATTERN ...]
+
+The walk command prints one NUL-terminated "<action>\\t<relative path>" record
+per entry, where action is "copy", "skip" (ignored file) or "skip-dir"
+(ignored directory that was not descended into).
+"""
+import os
+import re
+import sys
+import argparse
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+def read_ignore_file(ignore_file: Path) -> List[str]:
+    """
+    Read patterns from an ignore file.
+
+    Args:
+        ignore_file: Path to the .codegenignore file
+
+    Returns:
+        List of patterns (comments and empty lines removed)
+    """
+    patterns = []
+
+    with open(ignore_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Strip whitespace
+            line = line.strip()
+
+            # Skip empty lines and comments
+            if not line or line.startswith('#'):
+                continue
+
+            patterns.append(line)
+
+    return patterns
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate the body of a gitignore pattern into a regex fragment.
+
+    Args:
+        pattern: Pattern with negation, anchoring and trailing slash removed
+
+    Returns:
+        Regex fragment matching a full relative path (without ^/$ anchors)
+    """
+    segments = pattern.split('/')
+    parts = []
+
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+
+        if segment == '**':
+            if is_last:
+                # "docs/**" matches everything inside docs
+                parts.append('.*')
+            else:
+                # "**/x" and "a/**/b" match zero or more directories
+                parts.append('(?:.*/)?')
+            continue
+
+        regex = ''
+        i = 0
+        while i < len(segment):
+            char = segment[i]
+            if char == '*':
+                regex += '[^/]*'
+            elif char == '?':
+                regex += '[^/]'
+            elif char == '[':
+                end = segment.find(']', i + 1)
+                if end == -1:
+                    regex += re.escape(char)
+                else:
+                    body = segment[i + 1:end]
+                    if body.startswith('!'):
+                        body = '^' + body[1:]
+                    regex += f'[{body}]'
+                    i = end
+            elif char == '\\' and i + 1 < len(segment):
+                i += 1
+                regex += re.escape(segment[i])
+            else:
+                regex += re.escape(char)
+            i += 1
+
+        parts.append(regex if is_last else regex + '/')
+
+    return ''.join(parts)
+
+
+class _Pattern:
+    """A single parsed gitignore pattern"""
+
+    def __init__(self, raw: str):
+        pattern = raw
+        self.negate = False
+        if pattern.startswith('!'):
+            self.negate = True
+            pattern = pattern[1:]
+        elif pattern.startswith('\\'):
+            # "\!foo" and "\#foo" match literal names
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        # Any slash other than a trailing one anchors the pattern to the root
+        self.anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        self.body = pattern
+        prefix = '' if self.anchored else '(?:.*/)?'
+        self.regex = prefix + _translate(pattern)
+
+        # "docs/*" and "docs/**" ignore every child of docs, so a directory
+        # matching "docs" can be pruned (unless a negation could re-include)
+        self.subtree_regex = None
+        head, _, tail = pattern.rpartition('/')
+        if head and tail in ('*', '**') and not self.negate and not self.dir_only:
+            self.subtree_regex = prefix + _translate(head)
+
+    def literal_prefix(self) -> Optional[List[str]]:
+        """Leading wildcard-free segments of an anchored pattern, else None"""
+        if not self.anchored:
+            return None
+        prefix = []
+        for segment in self.body.split('/'):
+            if any(char in segment for char in '*?[\\'):
+                break
+            prefix.append(segment)
+        return prefix
+
+
+def _compile(regexes: Sequence[str]) -> Optional['re.Pattern']:
+    """Combine regex fragments into one anchored alternation"""
+    if not regexes:
+        return None
+    return re.compile('^(?:' + '|'.join(regexes) + ')$', re.DOTALL)
+
+
+class IgnoreMatcher:
+    """Matches relative paths against a compiled list of gitignore-style patterns"""
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = [p for p in patterns if p]
+        parsed = [_Pattern(p) for p in self.patterns]
+
+        # Group consecutive patterns of the same sign; the last matching
+        # group decides, which preserves gitignore's last-match-wins order
+        self._runs: List[Tuple[bool, Optional['re.Pattern'], Optional['re.Pattern']]] = []
+        run: List[_Pattern] = []
+        for pattern in parsed + [None]:
+            if run and (pattern is None or pattern.negate != run[0].negate):
+                self._runs.append((
+                    run[0].negate,
+                    _compile([p.regex for p in run if not p.dir_only]),
+                    _compile([p.regex for p in run if p.dir_only]),
+                ))
+                run = []
+            if pattern is not None:
+                run.append(pattern)
+
+        self._subtree = _compile([p.subtree_regex for p in parsed if p.subtree_regex])
+        self._negations = [p for p in parsed if p.negate]
+
+    def _match(self, rel_path: str, is_dir: bool) -> bool:
+        """Check a path against the patterns, ignoring its parent directories"""
+        for negate, any_regex, dir_regex in reversed(self._runs):
+            if any_regex is not None and any_regex.match(rel_path):
+                return not negate
+            if is_dir and dir_regex is not None and dir_regex.match(rel_path):
+                return not negate
+        return False
+
+    def _negation_could_match_under(self, rel_dir: str) -> bool:
+        """Conservatively check whether any negation could apply inside rel_dir"""
+        dir_segments = rel_dir.split('/')
+        for pattern in self._negations:
+            prefix = pattern.literal_prefix()
+            if prefix is None:
+                return True
+            common = min(len(prefix), len(dir_segments))
+            if prefix[:common] == dir_segments[:common]:
+                return True
+        return False
+
+    def prunes(self, rel_dir: str) -> bool:
+        """
+        Check whether a directory can be skipped without descending into it.
+
+        Args:
+            rel_dir: Directory path relative to the tree root, using "/" separators
+
+        Returns:
+            True if the directory and everything inside it is ignored
+        """
+        if self._match(rel_dir, True):
+            return True
+        if self._subtree is not None and self._subtree.match(rel_dir):
+            return not self._negation_could_match_under(rel_dir)
+        return False
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored, including via an ignored parent directory.
+
+        Args:
+            rel_path: Path relative to the tree root, using "/" separators
+            is_dir: True if the path is a directory
+
+        Returns:
+            True if the path should be ignored
+        """
+        parts = rel_path.split('/')
+        for depth in range(1, len(parts)):
+            if self.prunes('/'.join(parts[:depth])):
+                return True
+        return self._match(rel_path, is_dir)
+
+
+@lru_cache(maxsize=8)
+def compile_patterns(patterns: Tuple[str, ...]) -> IgnoreMatcher:
+    """Compile a pattern list once and reuse the matcher for identical lists"""
+    return IgnoreMatcher(patterns)
+
+
+def walk_tree(root: Path, matcher: IgnoreMatcher) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory tree in sorted path order, pruning ignored directories.
+
+    Args:
+        root: Directory to walk
+        matcher: Compiled ignore patterns
+
+    Yields:
+        Tuples of (action, relative_path) where action is "copy" for files to
+        copy, "skip" for ignored files and "skip-dir" for ignored directories
+    """
+    def _walk(directory: Path, rel_prefix: str) -> Iterator[Tuple[str, str]]:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        for entry in entries:
+            rel_path = rel_prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if matcher.prunes(rel_path):
+                    yield 'skip-dir', rel_path
+                else:
+                    yield from _walk(Path(entry.path), rel_path + '/')
+            elif entry.is_file():
+                if matcher._match(rel_path, False):
+                    yield 'skip', rel_path
+                else:
+                    yield 'copy', rel_path
+
+    yield from _walk(root, '')
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Walk a directory and classify entries using .codegenignore patterns'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    walk_parser = subparsers.add_parser(
+        'walk',
+        help='Print NUL-terminated "<action>\\t<path>" records for a directory tree'
+    )
+    walk_parser.add_argument('source_dir', type=Path, help='Directory to walk')
+    walk_parser.add_argument('--ignore-file', type=Path, help='Path to a .codegenignore file')
+    walk_parser.add_argument(
+        '--pattern',
+        action='append',
+        default=[],
+        help='Ignore pattern (may be repeated; appended after --ignore-file patterns)'
+    )
+
+    args = parser.parse_args()
+
+    patterns = read_ignore_file(args.ignore_file) if args.ignore_file else []
+    patterns.extend(args.pattern)
+    matcher = compile_patterns(tuple(patterns))
+
+    out = sys.stdout.buffer
+    for action, rel_path in walk_tree(args.source_dir, matcher):
+        out.write(f"{action}\t{rel_path}\0".encode('utf-8', 'surrogateescape'))
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Derive column layouts for the paginated stats operations from the spec.
+
+griddy.nfl.columnar decodes stats pages straight into Arrow record batches or
+NumPy structured arrays. To do that without building model objects it needs,
+per operation, the array holding the rows and a flat list of typed columns.
+This script derives both from openapi/nfl-com-api.yaml and writes them as a
+Python module into the SDK overlay:
+
+    - The rows are the `x-speakeasy-pagination` results array (see
+      fix_pagination.py), e.g. `passers` for getPlayerPassingStatsBySeason
+    - Scalar properties of a row become columns; nested objects are flattened
+      into dotted names (`player.displayName`), down to MAX_DEPTH levels
+    - Free-form objects (`type: object` with no properties, such as the
+      `stats` of /football/v2/stats/players/season) are listed as maps; their
+      keys become columns when the first page is decoded
+    - Arrays inside rows are left out
+    - integer -> int64, number -> float64, boolean -> bool, anything else
+      (strings, enums, dates) -> string
+
+Usage:
+    python columnar_schemas.py <openapi-file.yaml> [--output FILE | --check FILE]
+"""
+import sys
+import pprint
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fix_pagination import EXTENSION, SchemaProperties, response_schema
+from spec_cache import load_spec
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent.parent / 'sdk-overlays/python/src/griddy/nfl/_columnar_schemas.py'
+
+MAX_DEPTH = 3
+
+TYPES = {'integer': 'int64', 'number': 'float64', 'boolean': 'bool'}
+
+HEADER = '''"""
+Column layouts of the paginated stats operations, for griddy.nfl.columnar.
+
+Generated from openapi/nfl-com-api.yaml by scripts/columnar_schemas.py in
+griddy-sdk-sources; do not edit by hand.
+
+Each entry maps an operationId to:
+
+    results   the response field holding the rows
+    total     key path of the total row count, when the response has one
+    columns   (name, key path, type), type one of int64, float64, bool, string
+    maps      key paths of free-form objects whose keys become columns
+"""
+'''
+
+Column = Tuple[str, Tuple[str, ...], str]
+
+
+def flatten(
+        schemas: SchemaProperties,
+        schema: Dict,
+        prefix: Tuple[str, ...] = (),
+        maps: Optional[List[Tuple[str, ...]]] = None,
+) -> List[Column]:
+    """
+    List the scalar columns of an object schema.
+
+    Args:
+        schemas: Property resolver for the spec
+        schema: The row (or nested object) schema
+        prefix: Key path of the object within the row
+        maps: Collects the key paths of free-form objects
+
+    Returns:
+        (name, key path, type) for every scalar property, nested ones flattened
+    """
+    columns: List[Column] = []
+    for name, prop in schemas.properties(schema).items():
+        path = prefix + (name,)
+        # `allOf: [$ref: SomeEnum]` (used to make a shared enum nullable) is a scalar, not an object
+        parts = [schemas.resolve(part) for part in prop.get('allOf') or []]
+        if len(parts) == 1 and not schemas.is_object(parts[0]):
+            prop = parts[0]
+        if schemas.is_object(prop):
+            if not schemas.properties(prop):
+                if maps is not None:
+                    maps.append(path)
+            elif len(path) < MAX_DEPTH:
+                columns.extend(flatten(schemas, prop, path, maps))
+            continue
+        kind = prop.get('type')
+        if kind == 'array' or (kind is None and 'enum' not in prop):
+            continue
+        columns.append(('.'.join(path), path, TYPES.get(kind, 'string')))
+    return columns
+
+
+def total_path(schemas: SchemaProperties, schema: Dict) -> Optional[Tuple[str, ...]]:
+    """Key path of the total row count (`total`, or `total` one object down as in `pagination.total`)"""
+    properties = schemas.properties(schema)
+    if properties.get('total', {}).get('type') == 'integer':
+        return ('total',)
+    for name, prop in properties.items():
+        if schemas.is_object(prop) and schemas.properties(prop).get('total', {}).get('type') == 'integer':
+            return name, 'total'
+    return None
+
+
+def results_field(operation: Dict) -> Optional[str]:
+    """The rows field of a paginated operation (from its pagination extension)"""
+    results = ((operation.get(EXTENSION) or {}).get('outputs') or {}).get('results', '')
+    return results[2:] if results.startswith('$.') and '.' not in results[2:] else None
+
+
+def build_layouts(spec: Dict) -> Dict[str, Dict]:
+    """Column layouts for every operation whose pagination results are an array of objects"""
+    schemas = SchemaProperties(spec)
+    layouts = {}
+    for item in (spec.get('paths') or {}).values():
+        for operation in item.values():
+            if not isinstance(operation, dict) or 'operationId' not in operation:
+                continue
+            field = results_field(operation)
+            schema = response_schema(operation)
+            if field is None or schema is None:
+                continue
+            rows = schemas.properties(schema).get(field, {})
+            maps: List[Tuple[str, ...]] = []
+            columns = flatten(schemas, rows.get('items', {}), maps=maps)
+            if columns or maps:
+                layouts[operation['operationId']] = {
+                    'results': field,
+                    'total': total_path(schemas, schema),
+                    'columns': columns,
+                    'maps': maps,
+                }
+    return dict(sorted(layouts.items()))
+
+
+def render(layouts: Dict[str, Dict]) -> str:
+    return f"{HEADER}\nCOLUMNAR_SCHEMAS = {pprint.pformat(layouts, width=110, sort_dicts=False)}\n"
+
+
+def main():
+    """Main entry point for the script"""
+    parser = argparse.ArgumentParser(description='Generate column layouts for the paginated stats operations')
+    parser.add_argument('file', type=Path, help='Path to the OpenAPI YAML file')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--output', type=Path, default=DEFAULT_OUTPUT,
+                       help='Module to write (default: the Python SDK overlay)')
+    group.add_argument('--check', type=Path, metavar='FILE',
+                       help='Exit with status 1 if FILE is out of date instead of writing')
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f"Error: File '{args.file}' not found")
+        sys.exit(1)
+
+    layouts = build_layouts(load_spec(args.file))
+    content = render(layouts)
+    if args.check:
+        current = args.check.read_text() if args.check.exists() else ''
+        if current != content:
+            print(f"{args.check} is out of date; run scripts/columnar_schemas.py {args.file}")
+            sys.exit(1)
+        print(f"{args.check} is up to date ({len(layouts)} operations)")
+        return
+
+    args.output.write_text(content)
+    print(f"Wrote {len(layouts)} column layouts to {args.output}")
+    for operation_id, layout in layouts.items():
+        maps = f", maps {', '.join('.'.join(path) for path in layout['maps'])}" if layout['maps'] else ''
+        print(f"  {operation_id}: {layout['results']} ({len(layout['columns'])} columns{maps})")
+
+
+if __name__ == '__main__':
+    main()
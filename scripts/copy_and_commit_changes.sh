@@ -5,8 +5,9 @@ set -o pipefail  # Exit on pipe failure
 
 # ============================================================================
 # HARDCODED IGNORE PATTERNS
+# These patterns are used if no .codegenignore file is found
 # Add file patterns here that should not be overwritten in the destination
-# Supports wildcards: *.md, docs/*, etc.
+# Uses gitignore semantics: *.md, docs/, /uv.lock, **/tests, !keep.md, etc.
 # ============================================================================
 IGNORE_PATTERNS=(
     ".claude/*"
@@ -35,6 +36,12 @@ NC='\033[0m' # No Color
 # Global variable for pretend mode
 PRETEND_MODE=false
 
+# Ignore file shared with copy_and_commit_sdk.py (empty = use IGNORE_PATTERNS)
+CODEGEN_IGNORE_FILE=""
+
+# Directory containing this script and the codegen_ignore.py matcher
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
 # Function to print colored messages
 log_info() {
     echo -e "${GREEN}[INFO]${NC} $1"
@@ -71,11 +78,20 @@ Required arguments:
 
 Optional arguments:
     --branch <name>             Git branch name (default: sdk-updates)
+    --codegen-ignore-file <path>
+                                Path to codegen ignore file
     --pretend                   Dry-run mode - show what would be done without doing it
     -h, --help                  Display this help message
 
-Ignore patterns are hardcoded in the script in the IGNORE_PATTERNS array.
-Edit the script to modify which files are ignored.
+The script looks for a codegen ignore file in the following order:
+1. --codegen-ignore-file parameter
+2. .codegenignore in current directory
+3. Path specified in CODEGEN_IGNORE environment variable
+4. If none found, uses the IGNORE_PATTERNS array hardcoded in the script
+
+Patterns use gitignore semantics and are matched by scripts/codegen_ignore.py,
+the same matcher used by copy_and_commit_sdk.py. Ignored directories are
+skipped without descending into them.
 
 When --pretend is specified, the script will:
 - Show all files that would be copied
@@ -86,36 +102,51 @@ EOF
     exit 1
 }
 
-# Function to check if a file should be ignored based on hardcoded patterns
-should_ignore_file() {
-    local file_path="$1"
-    local dest_dir="$2"
+# Function to locate the codegen ignore file (same priority as copy_and_commit_sdk.py)
+find_codegen_ignore_file() {
+    local explicit_path="$1"
 
-    # Get relative path from destination directory
-    local rel_path="${file_path#$dest_dir/}"
-
-    # Check against hardcoded ignore patterns
-    for pattern in "${IGNORE_PATTERNS[@]}"; do
-        # Skip empty patterns
-        [[ -z "$pattern" ]] && continue
+    if [[ -n "$explicit_path" ]]; then
+        if [[ -f "$explicit_path" ]]; then
+            log_info "Using codegen ignore file: $explicit_path"
+            CODEGEN_IGNORE_FILE=$(realpath "$explicit_path")
+            return 0
+        fi
+        log_warn "Specified codegen ignore file not found: $explicit_path"
+    fi
 
-        # Convert glob pattern to regex for matching
-        # Replace * with .* for regex matching
-        local regex_pattern="${pattern//\*/.*}"
+    if [[ -f ".codegenignore" ]]; then
+        log_info "Found codegen ignore file: $(pwd)/.codegenignore"
+        CODEGEN_IGNORE_FILE=$(realpath ".codegenignore")
+        return 0
+    fi
 
-        # Check if the relative path matches the pattern
-        if [[ "$rel_path" == $pattern ]] || [[ "$rel_path" =~ ^${regex_pattern}$ ]]; then
-            return 0  # Should ignore
+    if [[ -n "$CODEGEN_IGNORE" ]]; then
+        if [[ -f "$CODEGEN_IGNORE" ]]; then
+            log_info "Using codegen ignore file from CODEGEN_IGNORE: $CODEGEN_IGNORE"
+            CODEGEN_IGNORE_FILE=$(realpath "$CODEGEN_IGNORE")
+            return 0
         fi
+        log_warn "CODEGEN_IGNORE points to non-existent file: $CODEGEN_IGNORE"
+    fi
 
-        # Also check just the filename for patterns like "*.md"
-        local filename=$(basename "$file_path")
-        if [[ "$filename" == $pattern ]] || [[ "$filename" =~ ^${regex_pattern}$ ]]; then
-            return 0  # Should ignore
-        fi
-    done
+    log_warn "No codegen ignore file found - using hardcoded patterns"
+}
+
+# Function to walk the source tree, printing NUL-terminated "<action>\t<path>" records
+walk_source_tree() {
+    local src="$1"
+    local ignore_args=()
+
+    if [[ -n "$CODEGEN_IGNORE_FILE" ]]; then
+        ignore_args+=(--ignore-file "$CODEGEN_IGNORE_FILE")
+    else
+        for pattern in "${IGNORE_PATTERNS[@]}"; do
+            [[ -n "$pattern" ]] && ignore_args+=(--pattern "$pattern")
+        done
+    fi
 
-    return 1  # Don't ignore
+    python3 "$SCRIPT_DIR/codegen_ignore.py" walk "$src" "${ignore_args[@]}"
 }
 
 # Function to copy files recursively
@@ -124,6 +155,7 @@ copy_files() {
     local dest="$2"
     local copied_count=0
     local skipped_count=0
+    local skipped_dir_count=0
 
     log_action "Copying files from $src to $dest"
 
@@ -131,9 +163,15 @@ copy_files() {
         log_pretend "Would create destination directory if needed: $dest"
         echo ""
         log_pretend "Active ignore patterns:"
-        for pattern in "${IGNORE_PATTERNS[@]}"; do
-            [[ -n "$pattern" ]] && log_pretend "  - $pattern"
-        done
+        if [[ -n "$CODEGEN_IGNORE_FILE" ]]; then
+            while IFS= read -r pattern; do
+                [[ -n "$pattern" && "$pattern" != \#* ]] && log_pretend "  - $pattern"
+            done < "$CODEGEN_IGNORE_FILE"
+        else
+            for pattern in "${IGNORE_PATTERNS[@]}"; do
+                [[ -n "$pattern" ]] && log_pretend "  - $pattern"
+            done
+        fi
         echo ""
         log_pretend "Files that would be copied:"
         log_pretend "----------------------------"
@@ -142,20 +180,38 @@ copy_files() {
         mkdir -p "$dest"
     fi
 
-    # Find all files in source directory
-    while IFS= read -r -d '' file; do
-        # Get relative path
-        local rel_path="${file#$src/}"
+    # Walk the source directory once, pruning ignored directories. The walk goes to a
+    # file first: a failing walker inside a process substitution would escape set -e
+    # and look like an empty (successful) copy
+    local walk_file
+    walk_file=$(mktemp)
+    if ! walk_source_tree "$src" > "$walk_file"; then
+        rm -f "$walk_file"
+        log_error "Failed to walk source directory: $src"
+        exit 1
+    fi
+
+    while IFS=$'\t' read -r -d '' action rel_path; do
+        local file="$src/$rel_path"
         local dest_file="$dest/$rel_path"
 
-        # Check if file should be ignored
-        if should_ignore_file "$dest_file" "$dest"; then
+        if [[ "$action" == "skip-dir" ]]; then
+            if [[ "$PRETEND_MODE" == true ]]; then
+                log_pretend "  [SKIP] $rel_path/ (directory matches ignore pattern)"
+            else
+                log_warn "Skipping ignored directory: $rel_path/"
+            fi
+            skipped_dir_count=$((skipped_dir_count + 1))
+            continue
+        fi
+
+        if [[ "$action" == "skip" ]]; then
             if [[ "$PRETEND_MODE" == true ]]; then
                 log_pretend "  [SKIP] $rel_path (matches ignore pattern)"
             else
                 log_warn "Skipping ignored file: $rel_path"
             fi
-            ((skipped_count++))
+            skipped_count=$((skipped_count + 1))
             continue
         fi
 
@@ -174,15 +230,16 @@ copy_files() {
             # Copy the file
             cp "$file" "$dest_file"
         fi
-        ((copied_count++))
-    done < <(find "$src" -type f -print0)
+        copied_count=$((copied_count + 1))
+    done < "$walk_file"
+    rm -f "$walk_file"
 
     if [[ "$PRETEND_MODE" == true ]]; then
         echo ""
-        log_pretend "Summary: Would copy $copied_count file(s), skip $skipped_count file(s)"
+        log_pretend "Summary: Would copy $copied_count file(s), skip $skipped_count file(s) and $skipped_dir_count director(y/ies)"
         echo ""
     else
-        log_info "Copied $copied_count file(s), skipped $skipped_count file(s)"
+        log_info "Copied $copied_count file(s), skipped $skipped_count file(s) and $skipped_dir_count director(y/ies)"
     fi
 }
 
@@ -321,6 +378,7 @@ main() {
     local source_dir=""
     local destination_dir=""
     local branch_name="sdk-updates"
+    local codegen_ignore_file=""
 
     # Parse command line arguments
     while [[ $# -gt 0 ]]; do
@@ -337,6 +395,10 @@ main() {
                 branch_name="$2"
                 shift 2
                 ;;
+            --codegen-ignore-file)
+                codegen_ignore_file="$2"
+                shift 2
+                ;;
             --pretend)
                 PRETEND_MODE=true
                 shift
@@ -377,12 +439,19 @@ main() {
     source_dir=$(realpath "$source_dir")
     destination_dir=$(realpath "$destination_dir")
 
+    # Find the ignore file shared with copy_and_commit_sdk.py
+    find_codegen_ignore_file "$codegen_ignore_file"
+
     if [[ "$PRETEND_MODE" == true ]]; then
         log_pretend "Configuration:"
         log_pretend "  Source directory: $source_dir"
         log_pretend "  Destination directory: $destination_dir"
         log_pretend "  Branch name: $branch_name"
-        log_pretend "  Ignore patterns: ${#IGNORE_PATTERNS[@]} pattern(s) configured"
+        if [[ -n "$CODEGEN_IGNORE_FILE" ]]; then
+            log_pretend "  Ignore file: $CODEGEN_IGNORE_FILE"
+        else
+            log_pretend "  Ignore patterns: ${#IGNORE_PATTERNS[@]} pattern(s) configured"
+        fi
         echo ""
     fi
 
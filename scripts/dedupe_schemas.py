@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Structural deduplication of components/schemas in the OpenAPI spec.
+
+Every component becomes a generated model class, and so does every inline
+object or enum. Manual consolidation (Site/BoxscoreSite/GameSite, ProGame
+into Game, ...) has removed the obvious copies; this script finds the rest
+mechanically:
+
+    - Each schema is canonicalized: documentation (description, example,
+      title, non-Speakeasy x- extensions) is dropped, and `required`, `enum`
+      and allOf/oneOf/anyOf lists are sorted
+    - Components are grouped by partition refinement over the canonical
+      forms, with each $ref standing for its target's group, so schemas that
+      only differ in which of two identical components they reference (or
+      that refer to each other recursively) still match
+    - Every $ref to a duplicate is rewritten to the group's canonical
+      component (the most referenced one; then the shortest name)
+    - Inline objects and enums identical to a component are replaced by a
+      $ref to it
+    - Components no longer reachable from any operation are removed
+      (--keep-unused to leave them)
+
+Free-form objects (`type: object` without properties) are placeholders for
+payloads that aren't described yet (see scratch/notes), so they are never
+merged even when they look alike. Near duplicates (objects sharing most of
+their properties, enums sharing most of their values) are only reported:
+merging them would change the API contract.
+
+Merging renames generated models (the duplicate's class disappears), so
+review the --check report before applying it. Edits go through
+SpecDocument, so everything outside the rewritten refs and removed
+components keeps its formatting.
+
+Usage:
+    python dedupe_schemas.py <openapi-file.yaml> [--in-place | --output FILE | --check]
+        [--keep-unused] [--near-threshold 0.9]
+"""
+import sys
+import json
+import hashlib
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+from spec_impact import iter_refs
+from spec_transform import SpecDocument, SpecTransform, run_transforms
+
+PREFIX = '#/components/schemas/'
+
+# Keys that document a schema without changing the generated model
+DOC_KEYS = {'description', 'example', 'examples', 'title', 'externalDocs'}
+
+# Sorted before comparison; their order doesn't change the model
+UNORDERED_KEYS = ('required', 'enum')
+COMPOSITION_KEYS = ('allOf', 'oneOf', 'anyOf')
+
+# Mapping keys whose value is a schema (properties are handled separately)
+SCHEMA_KEYS = ('items', 'additionalProperties', 'not', 'schema')
+
+
+def ref_name(value: Any) -> Optional[str]:
+    """The component a `#/components/schemas/...` reference points at"""
+    if isinstance(value, str) and value.startswith(PREFIX):
+        return value[len(PREFIX):]
+    return None
+
+
+def is_free_form(schema: Any) -> bool:
+    """An object schema that doesn't describe its contents"""
+    if not isinstance(schema, dict) or '$ref' in schema:
+        return False
+    structural = ('properties', 'enum', 'items') + COMPOSITION_KEYS
+    return schema.get('type', 'object') == 'object' and not any(key in schema for key in structural)
+
+
+def is_inline_candidate(schema: Any) -> bool:
+    """Inline schemas worth replacing by a $ref: they would become a model class of their own"""
+    return isinstance(schema, dict) and '$ref' not in schema and ('properties' in schema or 'enum' in schema)
+
+
+class Canonicalizer:
+    """Canonical forms of schemas, with $refs replaced by the target's equivalence class"""
+
+    def __init__(self, schemas: Dict[str, Any]):
+        self.schemas = schemas
+        self.classes = self._classify()
+
+    def form(self, schema: Any, classes: Optional[Dict[str, int]] = None) -> Any:
+        classes = self.classes if classes is None else classes
+        if isinstance(schema, list):
+            return [self.form(item, classes) for item in schema]
+        if not isinstance(schema, dict):
+            return schema
+        form = {}
+        for key, value in schema.items():
+            if key in DOC_KEYS or (key.startswith('x-') and not key.startswith('x-speakeasy-')):
+                continue
+            name = ref_name(value)
+            if name is not None:
+                form[key] = f"class:{classes.get(name, name)}"
+            elif key == 'properties' and isinstance(value, dict):
+                form[key] = {prop: self.form(sub, classes) for prop, sub in value.items()}
+            elif key in UNORDERED_KEYS and isinstance(value, list):
+                form[key] = sorted(value, key=repr)
+            elif key in COMPOSITION_KEYS and isinstance(value, list):
+                form[key] = sorted((self.form(item, classes) for item in value), key=self._dump)
+            else:
+                form[key] = self.form(value, classes)
+        return form
+
+    @staticmethod
+    def _dump(form: Any) -> str:
+        return json.dumps(form, sort_keys=True, default=str)
+
+    def key(self, schema: Any, classes: Optional[Dict[str, int]] = None) -> str:
+        """Hash of the canonical form"""
+        return hashlib.sha256(self._dump(self.form(schema, classes)).encode()).hexdigest()
+
+    def _classify(self) -> Dict[str, int]:
+        """
+        Group components into structural equivalence classes.
+
+        Starts with every component in one class and splits classes by
+        canonical form (refs standing for their target's current class) until
+        nothing splits further. Free-form placeholders get a class each.
+        """
+        classes = {name: 0 for name in self.schemas}
+        count = 1
+        while True:
+            ids: Dict[str, int] = {}
+            refined = {}
+            for name, schema in self.schemas.items():
+                key = f"free-form:{name}" if is_free_form(schema) else self.key(schema, classes)
+                refined[name] = ids.setdefault(key, len(ids))
+            if len(ids) == count:
+                return refined
+            classes, count = refined, len(ids)
+
+
+def near_duplicates(schemas: Dict[str, Any], canon: Canonicalizer, threshold: float) -> List[Tuple[str, str, float]]:
+    """
+    Pairs of distinct components that are similar but not identical.
+
+    Objects are compared on their (property, canonical property schema)
+    pairs and enums on their values, by Jaccard similarity.
+    """
+    signatures: Dict[str, Tuple[str, Set[str]]] = {}
+    for name, schema in schemas.items():
+        if not isinstance(schema, dict) or is_free_form(schema):
+            continue
+        if 'enum' in schema:
+            signatures[name] = (f"enum:{schema.get('type')}", {repr(value) for value in schema['enum']})
+        elif 'properties' in schema:
+            signatures[name] = ('object', {
+                f"{prop}={Canonicalizer._dump(canon.form(sub))}" for prop, sub in schema['properties'].items()
+            })
+
+    pairs = []
+    names = sorted(signatures)
+    for index, first in enumerate(names):
+        kind, items = signatures[first]
+        for second in names[index + 1:]:
+            other_kind, other_items = signatures[second]
+            if kind != other_kind or canon.classes[first] == canon.classes[second]:
+                continue
+            score = len(items & other_items) / len(items | other_items)
+            if score >= threshold:
+                pairs.append((first, second, round(score, 2)))
+    return sorted(pairs, key=lambda pair: -pair[2])
+
+
+class SchemaDedup(SpecTransform):
+    """Merge structurally identical components and inline schemas, then drop unused components"""
+
+    name = 'schema-dedup'
+
+    def __init__(self, drop_unused: bool = True, near_threshold: float = 0.9):
+        self.drop_unused = drop_unused
+        self.near_threshold = near_threshold
+        self.groups: Dict[str, List[str]] = {}
+        self.inline: List[Tuple[str, str]] = []
+        self.removed: List[str] = []
+        self.near: List[Tuple[str, str, float]] = []
+
+    # ------------------------------------------------------------------
+    # Analysis (plain data)
+    # ------------------------------------------------------------------
+
+    def _plan(self, data: Dict):
+        schemas = ((data.get('components') or {}).get('schemas')) or {}
+        self.canon = Canonicalizer(schemas)
+        self.by_key: Dict[str, str] = {}
+
+        references = Counter(ref_name(ref) for ref in iter_refs(data))
+        members: Dict[int, List[str]] = {}
+        for name, group in self.canon.classes.items():
+            members.setdefault(group, []).append(name)
+        self.replace: Dict[str, str] = {}
+        for names in members.values():
+            canonical = min(names, key=lambda name: (-references[name], len(name), name))
+            if not is_free_form(schemas[canonical]):
+                self.by_key[self.canon.key(schemas[canonical])] = canonical
+            if len(names) > 1:
+                self.groups[canonical] = sorted(name for name in names if name != canonical)
+                self.replace.update({name: canonical for name in names if name != canonical})
+
+        reachable: Set[str] = set()
+        pending = [self._target(name) for name in self._live_refs(
+            {key: value for key, value in data.items() if key != 'components'})]
+        pending += [self._target(name) for key, value in (data.get('components') or {}).items()
+                    if key != 'schemas' for name in self._live_refs(value)]
+        while pending:
+            name = pending.pop()
+            if name in reachable or name not in schemas:
+                continue
+            reachable.add(name)
+            pending.extend(self._target(ref) for ref in self._live_refs(schemas[name], top=True))
+        self.unused = set(schemas) - reachable if self.drop_unused else set(self.replace)
+        if self.near_threshold:
+            self.near = near_duplicates(schemas, self.canon, self.near_threshold)
+
+    def _target(self, name: str) -> str:
+        return self.replace.get(name, name)
+
+    def _inline_match(self, schema: Any) -> Optional[str]:
+        if not is_inline_candidate(schema):
+            return None
+        return self.by_key.get(self.canon.key(schema))
+
+    def _live_refs(self, node: Any, top: bool = False) -> Iterator[str]:
+        """Refs that survive the rewrite: inline schemas replaced by a $ref contribute only that ref"""
+        if isinstance(node, dict):
+            if not top:
+                match = self._inline_match(node)
+                if match is not None:
+                    yield match
+                    return
+            for key, value in node.items():
+                name = ref_name(value)
+                if name is not None:
+                    yield name
+                elif key == 'properties' and isinstance(value, dict):
+                    for sub in value.values():
+                        yield from self._live_refs(sub)
+                elif key in SCHEMA_KEYS:
+                    yield from self._live_refs(value)
+                else:
+                    yield from self._live_refs(value, top=True)
+        elif isinstance(node, list):
+            for item in node:
+                yield from self._live_refs(item, top=True)
+
+    # ------------------------------------------------------------------
+    # Edits (YAML nodes)
+    # ------------------------------------------------------------------
+
+    def apply(self, document: SpecDocument) -> int:
+        self._plan(document.data)
+        self.document = document
+        self.visited: Set[int] = set()
+        changed = 0
+
+        components = document.get(document.root, 'components')
+        schemas_entry = document.get(components[1], 'schemas') if components else None
+        schemas_node = schemas_entry[1] if schemas_entry else None
+
+        # Remove unused components, one whole entry (key line to the next key) at a time
+        skipped = set()
+        if isinstance(schemas_node, yaml.MappingNode):
+            entries = schemas_node.value
+            for index, (key_node, value_node) in enumerate(entries):
+                if key_node.value not in self.unused:
+                    continue
+                start = document._line_starts[key_node.start_mark.line]
+                if index + 1 < len(entries):
+                    end = document._line_starts[entries[index + 1][0].start_mark.line]
+                else:
+                    end = document.end_of_entries(schemas_node)
+                document.replace(start, end, '')
+                skipped.add(id(value_node))
+                self.removed.append(key_node.value)
+                changed += 1
+
+        # Rewrite refs and inline duplicates everywhere else
+        for key_node, value_node in document.root.value:
+            if key_node.value == 'components' and isinstance(value_node, yaml.MappingNode):
+                for section_key, section in value_node.value:
+                    if section_key.value == 'schemas' and isinstance(section, yaml.MappingNode):
+                        for schema_key, schema in section.value:
+                            if id(schema) not in skipped:
+                                changed += self._rewrite(schema, label=schema_key.value)
+                    else:
+                        changed += self._rewrite(section, label=section_key.value)
+            else:
+                changed += self._rewrite(value_node)
+        return changed
+
+    def _rewrite(self, node: yaml.Node, label: str = '') -> int:
+        if id(node) in self.visited:
+            return 0
+        self.visited.add(id(node))
+        document = self.document
+        changed = 0
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                key = key_node.value
+                if isinstance(value_node, yaml.ScalarNode):
+                    name = ref_name(value_node.value)
+                    if name in self.replace:
+                        start, end = document.offset(value_node.start_mark), document.offset(value_node.end_mark)
+                        text = document.text[start:end].replace(PREFIX + name, PREFIX + self.replace[name])
+                        document.replace(start, end, text)
+                        changed += 1
+                    continue
+                if key == 'properties' and isinstance(value_node, yaml.MappingNode):
+                    for prop_key, prop in value_node.value:
+                        changed += self._rewrite_schema(prop_key, prop, f"{label}.{prop_key.value}")
+                elif key in SCHEMA_KEYS and isinstance(value_node, yaml.MappingNode):
+                    changed += self._rewrite_schema(key_node, value_node, f"{label}/{key}")
+                else:
+                    changed += self._rewrite(value_node, label=f"{label}/{key}")
+        elif isinstance(node, yaml.SequenceNode):
+            for index, item in enumerate(node.value):
+                changed += self._rewrite(item, label=f"{label}[{index}]")
+        return changed
+
+    def _rewrite_schema(self, key_node: yaml.Node, value_node: yaml.Node, label: str) -> int:
+        """Replace an inline schema by a $ref when it duplicates a component, else recurse into it"""
+        document = self.document
+        if isinstance(value_node, yaml.MappingNode) and not document.is_alias(key_node, value_node):
+            match = self._inline_match(document.to_data(value_node))
+            if match is not None:
+                self.visited.add(id(value_node))
+                start, end = document.value_span(key_node, value_node)
+                indent = ' ' * value_node.start_mark.column
+                document.replace(start, end, f":{document.newline}{indent}$ref: '{PREFIX}{match}'")
+                self.inline.append((label.lstrip('./'), match))
+                return 1
+        return self._rewrite(value_node, label=label)
+
+
+def main():
+    """Main entry point for the script"""
+    parser = argparse.ArgumentParser(description='Merge structurally identical schemas in an OpenAPI spec')
+    parser.add_argument('openapi_file', help='Path to the OpenAPI spec (YAML)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--in-place', action='store_true', help='Rewrite the spec file in place')
+    output.add_argument('--output', help='Write the result to this path (default: <name>.modified.yaml)')
+    output.add_argument('--check', action='store_true',
+                        help='Write nothing; exit with status 1 if any schema would be merged or removed')
+    parser.add_argument('--keep-unused', action='store_true',
+                        help='Only merge duplicates; leave other unreferenced components in place')
+    parser.add_argument('--near-threshold', type=float, default=0.9,
+                        help='Report near duplicates at or above this similarity (0 to skip)')
+    args = parser.parse_args()
+
+    openapi_file = args.openapi_file
+
+    if not Path(openapi_file).exists():
+        print(f"Error: File '{openapi_file}' not found")
+        sys.exit(1)
+
+    document = SpecDocument.from_file(Path(openapi_file))
+    transform = SchemaDedup(drop_unused=not args.keep_unused, near_threshold=args.near_threshold)
+    changed = run_transforms(document, [transform])[transform.name]
+
+    removed = set(transform.removed)
+    merged = set()
+    print(f"  - Components: {len(transform.canon.schemas)}")
+    for canonical, duplicates in sorted(transform.groups.items()):
+        if canonical not in removed:
+            merged.update(duplicates)
+            print(f"  - Merged into {canonical}: {', '.join(duplicates)}")
+    for location, component in transform.inline:
+        print(f"  - Inline schema replaced by $ref {component}: {location}")
+    unused = sorted(removed - merged)
+    if unused:
+        print(f"  - Unused components removed: {', '.join(unused)}")
+    for first, second, score in transform.near:
+        print(f"  - Near duplicates (review by hand): {first} ~ {second} ({score:.0%})")
+    print(f"\nComponents after deduplication: {len(transform.canon.schemas) - len(transform.removed)}")
+    print(f"Nodes changed: {changed}")
+
+    if args.check:
+        if changed:
+            sys.exit(1)
+        return
+
+    if not changed:
+        print("\nNo changes needed")
+        return
+
+    output_file = openapi_file if args.in_place else (
+        args.output or str(Path(openapi_file).with_suffix('')) + '.modified.yaml'
+    )
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        f.write(document.render())
+    print(f"\nSaved to: {output_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+File copy strategies for the SDK sync scripts.
+
+On filesystems that support it (btrfs, XFS, APFS-backed overlays, ...) the
+kernel can clone a file instead of pushing every byte through userspace.
+`clone_file` implements the following link modes:
+
+    copy      shutil.copy2 (the historical behaviour)
+    reflink   FICLONE copy-on-write clone; fails if the filesystem can't clone
+    auto      FICLONE, falling back to os.copy_file_range, then shutil.copy2
+    hardlink  os.link (source and destination share one inode), falling back
+              to auto when the files are on different filesystems
+
+Every strategy except hardlink writes a new file next to the destination and
+renames it into place. A destination that was hardlinked to its source by an
+earlier run is replaced instead of being written through, so the source is
+never modified.
+"""
+import os
+import errno
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+LINK_MODES = ('copy', 'reflink', 'hardlink', 'auto')
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) from linux/fs.h
+FICLONE = 0x40049409
+
+# Strategies that don't duplicate the file's data on disk
+ZERO_COPY_STRATEGIES = ('reflink', 'hardlink')
+
+# errno values meaning "this strategy isn't supported here, try the next one"
+# (anything else, e.g. EACCES, ENOSPC or EIO, is a real failure and is raised)
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP,
+    errno.ENOTTY, errno.ENOSYS,
+}
+
+# os.link also reports EPERM for protected hardlinks and on filesystems
+# without hardlinks, and EMLINK when the source has too many links
+_HARDLINK_FALLBACK_ERRNOS = _UNSUPPORTED_ERRNOS | {errno.EPERM, errno.EMLINK}
+
+
+class CopyStats:
+    """Thread-safe tally of the copy strategy used for each file"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+
+    def record(self, strategy: str, size: int):
+        """Record one file copied with the given strategy"""
+        with self._lock:
+            self.files[strategy] = self.files.get(strategy, 0) + 1
+            self.bytes[strategy] = self.bytes.get(strategy, 0) + size
+
+    @property
+    def bytes_avoided(self) -> int:
+        """Bytes that were cloned or linked instead of duplicated"""
+        return sum(self.bytes.get(strategy, 0) for strategy in ZERO_COPY_STRATEGIES)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary, e.g. 'reflink: 10 file(s), 2.0 MiB; ...'"""
+        if not self.files:
+            return "no files copied"
+        parts = [
+            f"{strategy}: {self.files[strategy]} file(s), {format_bytes(self.bytes[strategy])}"
+            for strategy in sorted(self.files)
+        ]
+        return '; '.join(parts) + f" ({format_bytes(self.bytes_avoided)} of data copies avoided)"
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count using binary units"""
+    value = float(size)
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if value < 1024 or unit == 'GiB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{size} B"
+
+
+def _is_unsupported(error: OSError) -> bool:
+    return error.errno in _UNSUPPORTED_ERRNOS
+
+
+def _reflink(src_fd: int, dst_fd: int):
+    """Clone src into dst with the FICLONE ioctl"""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "FICLONE is not available on this platform")
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int):
+    """Copy src into dst in the kernel with os.copy_file_range"""
+    if not hasattr(os, 'copy_file_range'):
+        raise OSError(errno.ENOSYS, "os.copy_file_range is not available")
+    remaining = size
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+        if copied == 0:
+            break
+        remaining -= copied
+
+
+def _write_replacing(src: Path, dst: Path, writer) -> None:
+    """Run writer(src_fd, dst_fd) into a temporary file, then rename it over dst"""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{dst.name}.", suffix='.tmp', dir=dst.parent)
+    try:
+        with open(src, 'rb') as src_file:
+            writer(src_file.fileno(), fd)
+        os.close(fd)
+        fd = -1
+        shutil.copystat(src, tmp_name)
+        os.replace(tmp_name, dst)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _same_file(src: Path, dst: Path) -> bool:
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def files_identical(src: Path, dst: Path) -> bool:
+    """
+    Check whether dst already holds the same contents as src.
+
+    Sizes are compared first and mtimes second (every strategy preserves the
+    source mtime, so equal size and mtime means dst is an earlier copy). Only
+    when the mtimes differ are the SHA-256 digests compared.
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        True if dst exists and matches src byte for byte
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    return file_digest(src) == file_digest(dst)
+
+
+def clone_file(src: Path, dst: Path, link_mode: str = 'copy') -> str:
+    """
+    Copy a single file using the cheapest strategy the link mode allows.
+
+    The destination's parent directory must already exist. Metadata is
+    preserved as with shutil.copy2.
+
+    Args:
+        src: Source file
+        dst: Destination file
+        link_mode: One of LINK_MODES
+
+    Returns:
+        The strategy actually used: 'reflink', 'copy_file_range', 'copy' or
+        'hardlink'
+
+    Raises:
+        OSError: If the copy fails, or link_mode is 'reflink' and the
+            filesystem can't clone the file
+        ValueError: If link_mode is not one of LINK_MODES
+    """
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode: {link_mode}")
+
+    src = Path(src)
+    dst = Path(dst)
+
+    if link_mode == 'hardlink':
+        if _same_file(src, dst):
+            return 'hardlink'
+        tmp_name = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.lnk")
+        try:
+            os.link(src, tmp_name)
+            os.replace(tmp_name, dst)
+            return 'hardlink'
+        except OSError as e:
+            if os.path.lexists(tmp_name):
+                os.unlink(tmp_name)
+            if e.errno not in _HARDLINK_FALLBACK_ERRNOS:
+                raise
+        link_mode = 'auto'
+
+    if link_mode == 'copy':
+        if _same_file(src, dst):
+            # Break a hardlink left by an earlier run instead of truncating the source
+            os.unlink(dst)
+        shutil.copy2(src, dst)
+        return 'copy'
+
+    try:
+        _write_replacing(src, dst, _reflink)
+        return 'reflink'
+    except OSError as e:
+        if link_mode == 'reflink' or not _is_unsupported(e):
+            raise
+
+    size = src.stat().st_size
+    try:
+        _write_replacing(src, dst, lambda src_fd, dst_fd: _copy_file_range(src_fd, dst_fd, size))
+        return 'copy_file_range'
+    except OSError as e:
+        if not _is_unsupported(e):
+            raise
+
+    if _same_file(src, dst):
+        os.unlink(dst)
+    shutil.copy2(src, dst)
+    return 'copy'
@@ -1,65 +1,213 @@
-import yaml
 import sys
+import argparse
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+from spec_cache import load_spec
+from spec_transform import HTTP_METHODS, SpecDocument, SpecTransform, run_transforms
 
-def add_servers_to_endpoints(openapi_file):
-    """Add appropriate servers to each endpoint based on path pattern."""
+# Define server configurations
+PRO_SERVERS = [{
+    'url': 'https://pro.nfl.com',
+    'description': 'Production NFL Pro API'
+}]
 
-    # Load the OpenAPI spec
-    with open(openapi_file, 'r') as f:
-        spec = yaml.safe_load(f)
+REGULAR_SERVERS = [{
+    'url': 'https://api.nfl.com',
+    'description': 'Production Regular NFL API'
+}]
 
-    # Define server configurations
-    pro_server = [{
-        'url': 'https://pro.nfl.com',
-        'description': 'Production NFL Pro API'
-    }]
 
-    regular_server = [{
-        'url': 'https://api.nfl.com',
-        'description': 'Production Regular NFL API'
-    }]
+def servers_for_path(path: str) -> Tuple[str, List[Dict[str, str]]]:
+    """Determine which server an endpoint belongs to based on its path pattern"""
+    if path.startswith('/api/'):
+        return 'pro', PRO_SERVERS
+    return 'regular', REGULAR_SERVERS
 
-    # Track changes
-    pro_count = 0
-    regular_count = 0
 
-    # Iterate through all paths and operations
-    for path, path_item in spec.get('paths', {}).items():
-        # Determine which server based on path pattern
-        if path.startswith('/api/'):
-            server_config = pro_server
-            pro_count += 1
-        else:
-            server_config = regular_server
-            regular_count += 1
+class EndpointServers(SpecTransform):
+    """
+    Set the per-operation `servers` of every endpoint from its path.
 
-        # Add servers to each operation in this path
-        for method in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head', 'trace']:
-            if method in path_item:
-                path_item[method]['servers'] = server_config
+    Paths under /api/ are served by pro.nfl.com, everything else by
+    api.nfl.com. Operations that already have the right servers are left
+    alone. Changed operations reuse an existing anchor for the server list
+    when one is defined earlier in the document; otherwise the first one
+    defines a new anchor and later ones alias it.
+    """
 
-    # Write back to file
-    output_file = openapi_file.replace('.yaml', '.modified.yaml')
-    with open(output_file, 'w') as f:
-        yaml.dump(spec, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    name = 'endpoint-servers'
+
+    def __init__(self):
+        self.pro_count = 0
+        self.regular_count = 0
+
+    def apply(self, document: SpecDocument) -> int:
+        changed = 0
+        # Anchors usable so far, per server kind: kind -> anchor name
+        available: Dict[str, str] = {}
+        # Anchors whose definitions this transform rewrote: name -> new data
+        redefined: Dict[str, Any] = {}
+
+        for path, _, method_key, operation in document.iter_operations():
+            kind, servers = servers_for_path(path)
+            if kind == 'pro':
+                self.pro_count += 1
+            else:
+                self.regular_count += 1
+
+            entry = document.get(operation, 'servers')
+            anchor = None
+            current: Optional[Any] = None
+            if entry:
+                key_node, value_node = entry
+                anchor = document.anchor_of(value_node)
+                current = document.to_data(value_node)
+                if anchor in redefined:
+                    current = redefined[anchor]
+                if not document.is_alias(key_node, value_node) and anchor:
+                    # This node defines an anchor; later aliases refer to it
+                    if current == servers:
+                        available.setdefault(kind, anchor)
+
+            if current == servers:
+                continue
+
+            indent = entry[0].start_mark.column if entry else operation.value[0][0].start_mark.column
+            defines_anchor = entry and anchor and not document.is_alias(*entry)
+
+            if defines_anchor:
+                # Keep the anchor name so aliases elsewhere stay valid
+                value = f": &{anchor}{document.newline}" + document.render_block(servers, indent)
+                redefined[anchor] = servers
+                available[kind] = anchor
+                new_anchor = ''
+            elif kind in available:
+                value = f": *{available[kind]}"
+                new_anchor = ''
+            else:
+                new_anchor = document.new_anchor(f"{kind}_servers")
+                value = f": &{new_anchor}{document.newline}" + document.render_block(servers, indent)
+                available[kind] = new_anchor
+
+            if entry:
+                start, end = document.value_span(*entry)
+                if value.endswith(document.newline):
+                    value = value[:-len(document.newline)]
+                document.replace(start, end, value, new_anchor)
+            else:
+                if not value.endswith(document.newline):
+                    value += document.newline
+                document.insert(document.end_of_entries(operation), ' ' * indent + 'servers' + value, new_anchor)
+            changed += 1
+
+        return changed
+
+
+def count_server_changes(spec: Dict[str, Any]) -> Tuple[int, int, int]:
+    """
+    Count endpoints per server kind, and how many need their servers updated.
+
+    Works on the parsed spec, so it can use the cached load and skip
+    composing the YAML node graph when nothing needs rewriting.
+
+    Args:
+        spec: The parsed OpenAPI spec
+
+    Returns:
+        Tuple of (pro_count, regular_count, changes_needed)
+    """
+    pro_count = regular_count = changes = 0
+    for path, path_item in (spec.get('paths') or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method, operation in path_item.items():
+            if method not in HTTP_METHODS or not isinstance(operation, dict):
+                continue
+            kind, servers = servers_for_path(path)
+            if kind == 'pro':
+                pro_count += 1
+            else:
+                regular_count += 1
+            if operation.get('servers') != servers:
+                changes += 1
+    return pro_count, regular_count, changes
+
+
+def add_servers_to_endpoints(openapi_file, output_file=None, check=False) -> int:
+    """
+    Add appropriate servers to each endpoint based on path pattern.
+
+    Only the `servers` entries that need to change are rewritten; the rest of
+    the file, including anchors and comments, is left untouched.
+    Nothing is written when every endpoint already has the right servers.
+
+    Args:
+        openapi_file: Path to the OpenAPI spec
+        output_file: Where to write the result (default: <name>.modified.yaml)
+        check: If True, only report whether changes are needed
+
+    Returns:
+        Number of operations whose servers changed (or would change)
+    """
+    openapi_file = str(openapi_file)
+
+    # Check against the cached parse first; compose the node graph only if edits are needed
+    pro_count, regular_count, changed = count_server_changes(load_spec(Path(openapi_file)))
+    if changed and not check:
+        document = SpecDocument.from_file(Path(openapi_file))
+        transform = EndpointServers()
+        changed = run_transforms(document, [transform])[transform.name]
 
-    print(f"✓ Modified OpenAPI spec written to: {output_file}")
     print(f"  - Pro API endpoints (/api/*): {pro_count}")
     print(f"  - Regular API endpoints (other): {regular_count}")
     print(f"\nTotal endpoints processed: {pro_count + regular_count}")
+    print(f"Endpoints with updated servers: {changed}")
 
+    if check:
+        return changed
+    if not changed:
+        print("✓ All endpoints already have the correct servers; nothing written")
+        return changed
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python add_servers.py <openapi-file.yaml>")
-        sys.exit(1)
+    # Write back to file
+    if output_file is None:
+        output_file = openapi_file.replace('.yaml', '.modified.yaml')
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        f.write(document.render())
 
-    openapi_file = sys.argv[1]
+    print(f"✓ Modified OpenAPI spec written to: {output_file}")
+    return changed
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Set per-operation servers in an OpenAPI spec based on path pattern'
+    )
+    parser.add_argument('openapi_file', help='Path to the OpenAPI spec (YAML)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--in-place', action='store_true', help='Rewrite the spec file in place')
+    output.add_argument('--output', help='Write the result to this path (default: <name>.modified.yaml)')
+    output.add_argument(
+        '--check',
+        action='store_true',
+        help='Write nothing; exit with status 1 if any endpoint needs updated servers'
+    )
+    args = parser.parse_args()
+
+    openapi_file = args.openapi_file
 
     if not Path(openapi_file).exists():
         print(f"Error: File '{openapi_file}' not found")
         sys.exit(1)
 
-    add_servers_to_endpoints(openapi_file)
\ No newline at end of file
+    output_file = openapi_file if args.in_place else args.output
+    changed = add_servers_to_endpoints(openapi_file, output_file, args.check)
+
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Declare offset/limit pagination on the spec's paginated operations.
+
+The secured stats endpoints (and /football/v2/stats/players/season) take
+`limit` and `offset` query parameters and report the total number of matching
+records, but without an `x-speakeasy-pagination` extension the generated SDK
+returns a single page and callers write their own page loops. With the
+extension, each generated method returns a response with a `next()` method
+(sync) or awaitable `next()` (async), so callers can iterate pages lazily:
+
+    res = sdk.player_passing_statistics.get_player_passing_stats_by_season(season=2025, ...)
+    while res is not None:
+        process(res.result.passers)
+        res = res.next()
+
+An operation is treated as paginated when it has both `limit` and `offset`
+query parameters and its 200 response schema has a `total` count (directly or
+in a `pagination` object). The page's results are the response's single array
+property whose items are objects, e.g. `passers` or `defenders`; filter echoes
+such as `split` or `positionGroup` are ignored. Operations where that array
+can't be identified unambiguously are reported and left alone.
+
+Usage:
+    python fix_pagination.py <openapi-file.yaml> [--in-place | --output FILE | --check]
+"""
+import sys
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from spec_cache import RefResolver
+from spec_transform import SpecDocument, SpecTransform, run_transforms
+
+EXTENSION = 'x-speakeasy-pagination'
+
+
+def offset_limit_pagination(results_field: str) -> Dict[str, Any]:
+    """Build the x-speakeasy-pagination value for an offset/limit operation"""
+    return {
+        'type': 'offsetLimit',
+        'inputs': [
+            {'name': 'offset', 'in': 'parameters', 'type': 'offset'},
+            {'name': 'limit', 'in': 'parameters', 'type': 'limit'},
+        ],
+        'outputs': {
+            'results': f"$.{results_field}",
+        },
+    }
+
+
+class SchemaProperties:
+    """Resolves $refs and allOf to list a schema's effective properties"""
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        self.refs = RefResolver(spec)
+
+    def resolve(self, schema: Any) -> Dict:
+        """Follow local $refs until a concrete schema is reached (dangling $refs resolve to {})"""
+        seen = set()
+        while isinstance(schema, dict) and isinstance(schema.get('$ref'), str) and schema['$ref'] not in seen:
+            seen.add(schema['$ref'])
+            try:
+                schema = self.refs.resolve(schema['$ref'])
+            except (KeyError, IndexError, TypeError, ValueError):
+                return {}
+        return schema if isinstance(schema, dict) else {}
+
+    def properties(self, schema: Any) -> Dict[str, Dict]:
+        """Return the properties of a schema, merging allOf parts"""
+        schema = self.resolve(schema)
+        merged: Dict[str, Dict] = {}
+        for part in schema.get('allOf') or []:
+            merged.update(self.properties(part))
+        for name, prop in (schema.get('properties') or {}).items():
+            merged[name] = self.resolve(prop)
+        return merged
+
+    def is_object(self, schema: Any) -> bool:
+        """Check whether a schema describes an object"""
+        schema = self.resolve(schema)
+        return schema.get('type') == 'object' or 'properties' in schema or 'allOf' in schema
+
+
+def response_schema(operation: Dict) -> Optional[Dict]:
+    """Return the JSON schema of an operation's 200 response, if any"""
+    response = (operation.get('responses') or {}).get('200') or {}
+    return ((response.get('content') or {}).get('application/json') or {}).get('schema')
+
+
+def find_results_field(schemas: SchemaProperties, operation: Dict) -> Optional[List[str]]:
+    """
+    Find the array holding a paginated operation's results.
+
+    Args:
+        schemas: Property resolver for the spec
+        operation: The operation, as plain data
+
+    Returns:
+        None if the operation isn't paginated, otherwise the candidate results
+        fields (exactly one when the operation can be annotated)
+    """
+    query_params = {
+        param.get('name') for param in operation.get('parameters') or []
+        if isinstance(param, dict) and param.get('in') == 'query'
+    }
+    if not {'limit', 'offset'} <= query_params:
+        return None
+
+    schema = response_schema(operation)
+    if schema is None:
+        return None
+    properties = schemas.properties(schema)
+    pagination = schemas.properties(properties.get('pagination', {}))
+    if 'total' not in properties and 'total' not in pagination:
+        return None
+
+    return [
+        name for name, prop in properties.items()
+        if prop.get('type') == 'array' and schemas.is_object(prop.get('items', {}))
+    ]
+
+
+class Pagination(SpecTransform):
+    """Add x-speakeasy-pagination (offsetLimit) to every paginated operation"""
+
+    name = 'pagination'
+
+    def __init__(self):
+        self.paginated: List[str] = []
+        self.ambiguous: List[str] = []
+
+    def apply(self, document: SpecDocument) -> int:
+        schemas = SchemaProperties(document.data)
+        changed = 0
+
+        for path, method, _, operation in document.iter_operations():
+            data = document.to_data(operation)
+            candidates = find_results_field(schemas, data)
+            if candidates is None:
+                continue
+
+            label = data.get('operationId') or f"{method.upper()} {path}"
+            if len(candidates) != 1:
+                self.ambiguous.append(f"{label} (results candidates: {', '.join(candidates) or 'none'})")
+                continue
+
+            self.paginated.append(label)
+            desired = offset_limit_pagination(candidates[0])
+            if data.get(EXTENSION) == desired:
+                continue
+
+            indent = operation.value[0][0].start_mark.column
+            block = document.render_block(desired, indent + 2)
+            entry = document.get(operation, EXTENSION)
+            if entry:
+                start, end = document.value_span(*entry)
+                document.replace(start, end, ':' + document.newline + block.rstrip('\r\n'))
+            else:
+                document.insert(
+                    document.end_of_entries(operation),
+                    f"{' ' * indent}{EXTENSION}:{document.newline}{block}"
+                )
+            changed += 1
+
+        return changed
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Add x-speakeasy-pagination to paginated operations in an OpenAPI spec'
+    )
+    parser.add_argument('openapi_file', help='Path to the OpenAPI spec (YAML)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--in-place', action='store_true', help='Rewrite the spec file in place')
+    output.add_argument('--output', help='Write the result to this path (default: <name>.modified.yaml)')
+    output.add_argument(
+        '--check',
+        action='store_true',
+        help='Write nothing; exit with status 1 if any operation needs its pagination updated'
+    )
+    args = parser.parse_args()
+
+    openapi_file = args.openapi_file
+
+    if not Path(openapi_file).exists():
+        print(f"Error: File '{openapi_file}' not found")
+        sys.exit(1)
+
+    document = SpecDocument.from_file(Path(openapi_file))
+    transform = Pagination()
+    changed = run_transforms(document, [transform])[transform.name]
+
+    print(f"  - Paginated operations: {len(transform.paginated)}")
+    for label in transform.ambiguous:
+        print(f"  - Skipped, results array is ambiguous: {label}")
+    print(f"\nOperations with updated pagination: {changed}")
+
+    if args.check:
+        if changed:
+            sys.exit(1)
+        return
+
+    if not changed:
+        print("✓ Pagination is already up to date; nothing written")
+        return
+
+    output_file = openapi_file if args.in_place else args.output
+    if output_file is None:
+        output_file = openapi_file.replace('.yaml', '.modified.yaml')
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        f.write(document.render())
+
+    print(f"✓ Modified OpenAPI spec written to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
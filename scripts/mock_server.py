@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for pro.nfl.com and api.nfl.com, for load and resilience tests.
+
+Every operation in openapi/nfl-com-api.yaml gets a route. Operations with a
+recorded payload in scratch/example_responses replay it; the file is matched
+by path, e.g. /api/stats/boxscore -> stats_boxscore.json and
+/football/v2/experience/weekly-game-details ->
+football_v2_experience_weekly-game-details.json. All other operations answer
+with a response synthesized from their 200 schema (schema examples where the
+spec has them, placeholder values otherwise). Bodies are serialized and
+gzipped once at startup, so the server itself stays cheap at high request
+rates.
+
+Both hosts share one listener. Requests are routed by their Host header (or
+by path alone when it isn't an NFL host), so an SDK client only needs its URLs
+rewritten to the mock:
+
+    def to_mock(request):   # the Host header still names the NFL host
+        request.url = request.url.copy_with(scheme='http', host='127.0.0.1', port=8080)
+
+    sdk = GriddyNFL(client=httpx.Client(event_hooks={'request': [to_mock]}))
+
+(The async client needs an `async def` hook.)
+
+Faults, all optional:
+    --latency MS / --jitter MS      delay every response by latency +- jitter
+    --error-rate P                  answer a fraction P of requests with
+                                    --error-status (default 500, 502, 503)
+    --rate-limit HOST=RPS/BURST     token bucket per host; over the limit the
+                                    response is 429 with Retry-After (whole
+                                    seconds, rounded up, as the header allows)
+    --no-gzip                       ignore Accept-Encoding: gzip
+
+Paginated operations (x-speakeasy-pagination) honour `offset` and `limit`
+over --total-rows rows, repeating the example or synthesized rows as needed.
+
+GET /__mock/stats returns request counts by status and operation, and the peak
+number of requests in flight; POST /__mock/reset clears them.
+
+Usage:
+    python mock_server.py [openapi-file.yaml] [--port 8080] [--latency 20 --jitter 10]
+    python mock_server.py --error-rate 0.05 --rate-limit pro.nfl.com=200/400
+    python mock_server.py --list
+"""
+import re
+import sys
+import gzip
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from fix_endpoint_servers import servers_for_path
+from fix_pagination import EXTENSION, SchemaProperties, response_schema
+from spec_cache import DEFAULT_SPEC, load_spec
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / 'scratch' / 'example_responses'
+
+HOSTS = ('pro.nfl.com', 'api.nfl.com')
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+# Synthesized responses stop expanding nested objects and arrays below this depth
+MAX_DEPTH = 8
+
+# Serialized pages kept per paginated route
+MAX_CACHED_PAGES = 256
+
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 429: 'Too Many Requests', 500: 'Internal Server Error',
+    502: 'Bad Gateway', 503: 'Service Unavailable', 504: 'Gateway Timeout',
+}
+
+PLACEHOLDERS = {
+    'date-time': '2025-09-07T17:00:00Z',
+    'date': '2025-09-07',
+    'time': '13:00:00',
+    'uuid': '10160000-0581-6fbc-bee4-38a6c8fd7bdb',
+    'uri': 'https://www.nfl.com/',
+    'url': 'https://www.nfl.com/',
+    'email': 'fan@example.com',
+}
+
+
+# ----------------------------------------------------------------------
+# Routes
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class Route:
+    """One operation: where it is served and the body it answers with"""
+
+    operation_id: str
+    method: str
+    host: str
+    path: str
+    source: str
+    body: bytes
+    pattern: Optional['re.Pattern'] = None
+    results: Optional[str] = None
+    _gzipped: Optional[bytes] = field(default=None, repr=False)
+    _pages: Dict[Tuple[int, int, int], bytes] = field(default_factory=dict, repr=False)
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+    def page(self, offset: int, limit: int, total: int) -> bytes:
+        """The body for one page of a paginated operation, with rows offset..offset+limit of total"""
+        key = (offset, limit, total)
+        body = self._pages.get(key)
+        if body is None:
+            payload = json.loads(self.body)
+            template = payload.get(self.results) or [{}]
+            count = max(0, min(limit, total - offset))
+            payload[self.results] = (template * (count // len(template) + 1))[:count]
+            for meta in (payload, payload.get('pagination')):
+                if isinstance(meta, dict):
+                    meta.update({name: value for name, value in
+                                 (('offset', offset), ('limit', limit), ('total', total)) if name in meta})
+            body = _compact(payload)
+            if len(self._pages) >= MAX_CACHED_PAGES:
+                self._pages.clear()
+            self._pages[key] = body
+        return body
+
+
+def fixture_name(path: str) -> str:
+    """The example response file for a path (/api/stats/boxscore -> stats_boxscore.json)"""
+    path = path[len('/api/'):] if path.startswith('/api/') else path.lstrip('/')
+    return path.replace('/', '_') + '.json'
+
+
+class Synthesizer:
+    """Builds a plausible instance of a schema"""
+
+    def __init__(self, spec: Dict, array_items: int = 2):
+        self.schemas = SchemaProperties(spec)
+        self.array_items = array_items
+
+    def instance(self, schema: Any, depth: int = 0) -> Any:
+        schema = self.schemas.resolve(schema)
+        if 'example' in schema:
+            return schema['example']
+        if 'enum' in schema and schema['enum']:
+            return schema['enum'][0]
+        for key in ('oneOf', 'anyOf'):
+            if schema.get(key):
+                return self.instance(schema[key][0], depth)
+        kind = schema.get('type')
+        if kind == 'array':
+            if depth >= MAX_DEPTH:
+                return []
+            return [self.instance(schema.get('items', {}), depth + 1) for _ in range(self.array_items)]
+        if kind == 'object' or 'properties' in schema or 'allOf' in schema:
+            if depth >= MAX_DEPTH:
+                return {}
+            properties = self.schemas.properties(schema)
+            if not properties and isinstance(schema.get('additionalProperties'), dict):
+                return {'key': self.instance(schema['additionalProperties'], depth + 1)}
+            return {name: self.instance(prop, depth + 1) for name, prop in properties.items()}
+        if kind == 'integer':
+            return schema.get('minimum', 1)
+        if kind == 'number':
+            return 1.5
+        if kind == 'boolean':
+            return True
+        if kind == 'string':
+            return PLACEHOLDERS.get(schema.get('format'), 'string')
+        return None
+
+
+def _compact(data: Any) -> bytes:
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def operation_host(path: str, operation: Dict) -> str:
+    """The host serving an operation (its `servers`, or the path rule fix_endpoint_servers applies)"""
+    servers = operation.get('servers') or servers_for_path(path)[1]
+    return urlsplit(servers[0]['url']).hostname
+
+
+def build_routes(
+        spec: Dict,
+        fixtures: Optional[Path] = DEFAULT_FIXTURES,
+        array_items: int = 2,
+        overrides: Optional[Dict[str, Path]] = None,
+) -> List[Route]:
+    """
+    Create a route for every operation in the spec.
+
+    Args:
+        spec: Parsed OpenAPI document
+        fixtures: Directory of recorded responses (see fixture_name)
+        array_items: Elements per array in synthesized responses
+        overrides: operationId -> response file, taking precedence over fixtures
+
+    Returns:
+        Routes, literal paths before templated ones
+    """
+    synthesizer = Synthesizer(spec, array_items)
+    overrides = overrides or {}
+    routes = []
+    for path, item in (spec.get('paths') or {}).items():
+        for method, operation in item.items():
+            if method not in HTTP_METHODS or not isinstance(operation, dict):
+                continue
+            operation_id = operation.get('operationId', f"{method} {path}")
+            fixture = overrides.get(operation_id) or (fixtures / fixture_name(path) if fixtures else None)
+            if fixture is not None and fixture.exists():
+                source, body = f"fixture {fixture.name}", _compact(json.loads(fixture.read_bytes()))
+            else:
+                schema = response_schema(operation)
+                source, body = 'schema', _compact(synthesizer.instance(schema) if schema else {})
+            pattern = None
+            if '{' in path:
+                pattern = re.compile('^' + re.sub(r'\\\{(\w+)\\\}', r'(?P<\1>[^/]+)', re.escape(path)) + '$')
+            results = ((operation.get(EXTENSION) or {}).get('outputs') or {}).get('results', '')
+            results = results[2:] if results.startswith('$.') and '.' not in results[2:] else None
+            routes.append(Route(operation_id, method.upper(), operation_host(path, operation), path, source, body,
+                                pattern, results))
+    return sorted(routes, key=lambda route: route.pattern is not None)
+
+
+class Router:
+    """Finds the route for a request; literal paths by dictionary lookup"""
+
+    def __init__(self, routes: List[Route]):
+        self.literal: Dict[Tuple[str, str, str], Route] = {}
+        self.any_host: Dict[Tuple[str, str], Route] = {}
+        self.templated = [route for route in routes if route.pattern is not None]
+        for route in routes:
+            if route.pattern is None:
+                self.literal[(route.host, route.method, route.path)] = route
+                self.any_host.setdefault((route.method, route.path), route)
+
+    def match(self, host: Optional[str], method: str, path: str) -> Optional[Route]:
+        if host in HOSTS:
+            route = self.literal.get((host, method, path))
+        else:
+            route = self.any_host.get((method, path))
+        if route is not None:
+            return route
+        for route in self.templated:
+            if route.method == method and (host not in HOSTS or route.host == host) and route.pattern.match(path):
+                return route
+        return None
+
+
+# ----------------------------------------------------------------------
+# Faults
+# ----------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Requests per second with a burst allowance (single event loop, so no locking)"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; returns 0, or the seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def parse_rate_limit(value: str) -> Tuple[str, TokenBucket]:
+    """HOST=RPS[/BURST], the format GRIDDY_NFL_RATE_LIMITS uses"""
+    host, _, limit = value.partition('=')
+    rate, _, burst = limit.partition('/')
+    try:
+        return host.strip(), TokenBucket(float(rate), float(burst or rate))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected HOST=RPS[/BURST], got {value!r}") from None
+
+
+@dataclass
+class Faults:
+    """What the server does to requests besides answering them"""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (500, 502, 503)
+    rate_limits: Dict[str, TokenBucket] = field(default_factory=dict)
+    gzip: bool = True
+
+    def delay(self, rng: random.Random) -> float:
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        return max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+
+class MockServer:
+    """A minimal HTTP/1.1 (keep-alive) server answering from routes"""
+
+    def __init__(
+            self,
+            routes: List[Route],
+            faults: Optional[Faults] = None,
+            seed: Optional[int] = None,
+            total_rows: int = 250,
+    ):
+        self.router = Router(routes)
+        self.faults = faults or Faults()
+        self.total_rows = total_rows
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.statuses: Dict[int, int] = {}
+        self.operations: Dict[str, int] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.started = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        total = sum(self.statuses.values())
+        elapsed = time.monotonic() - self.started
+        return {
+            'requests': total,
+            'elapsed_s': round(elapsed, 3),
+            'requests_per_s': round(total / elapsed, 1) if elapsed else 0.0,
+            'peak_in_flight': self.peak_in_flight,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'operations': dict(sorted(self.operations.items())),
+        }
+
+    async def respond(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Status, headers and body for one request"""
+        url = urlsplit(target)
+        host = (url.hostname or headers.get('host', '').rsplit(':', 1)[0]).lower()
+        if url.path.startswith('/__mock/'):
+            if method == 'POST' and url.path == '/__mock/reset':
+                self.reset()
+                return 204, {}, b''
+            if url.path == '/__mock/stats':
+                return 200, {'content-type': 'application/json'}, _compact(self.stats())
+            return 404, {}, b''
+
+        route = self.router.match(host, method, url.path)
+        name = route.operation_id if route else 'unmatched'
+        self.operations[name] = self.operations.get(name, 0) + 1
+
+        delay = self.faults.delay(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+        if route is None:
+            return 404, {'content-type': 'application/json'}, _compact({'error': f"no route for {method} {url.path}"})
+
+        bucket = self.faults.rate_limits.get(route.host)
+        wait = bucket.take() if bucket else 0.0
+        if wait:
+            # Retry-After only allows integer delta-seconds (or an HTTP date)
+            return 429, {'retry-after': str(max(1, math.ceil(wait))), 'content-type': 'application/json'}, \
+                _compact({'error': 'rate limited'})
+        if self.faults.error_rate and self.rng.random() < self.faults.error_rate:
+            status = self.rng.choice(self.faults.error_statuses)
+            return status, {'content-type': 'application/json'}, _compact({'error': REASONS.get(status, 'error')})
+
+        response_headers = {'content-type': 'application/json'}
+        gzipped = self.faults.gzip and 'gzip' in headers.get('accept-encoding', '')
+        if gzipped:
+            response_headers['content-encoding'] = 'gzip'
+        if route.results and url.query:
+            query = parse_qs(url.query)
+            try:
+                offset = int(query.get('offset', ['0'])[0])
+                limit = int(query.get('limit', ['0'])[0])
+            except ValueError:
+                return 400, {'content-type': 'application/json'}, _compact({'error': 'invalid offset or limit'})
+            if limit:
+                body = route.page(offset, limit, self.total_rows)
+                return 200, response_headers, gzip.compress(body, compresslevel=1) if gzipped else body
+        return 200, response_headers, route.gzipped if gzipped else route.body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                request_line, *lines = head.decode('latin-1').split('\r\n')
+                method, target, version = request_line.split(' ', 2)
+                headers = {}
+                for line in lines:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    status, response_headers, body = await self.respond(method, target, headers)
+                finally:
+                    self.in_flight -= 1
+                self.statuses[status] = self.statuses.get(status, 0) + 1
+
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+                response_headers['content-length'] = str(len(body))
+                if close:
+                    response_headers['connection'] = 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n".encode()
+                    + ''.join(f"{name}: {value}\r\n" for name, value in response_headers.items()).encode()
+                    + b'\r\n' + (b'' if method == 'HEAD' else body)
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """Start listening; port 0 picks a free port (see server.sockets[0].getsockname())"""
+        return await asyncio.start_server(self.handle, host, port, backlog=1024)
+
+
+async def serve(server: MockServer, host: str, port: int):
+    listener = await server.start(host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"Mock NFL API listening on http://{address[0]}:{address[1]} (stats at /__mock/stats)", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    """Main entry point for the script"""
+    parser = argparse.ArgumentParser(description='Serve example and synthesized NFL API responses locally')
+    parser.add_argument('file', type=Path, nargs='?', default=DEFAULT_SPEC, help='Path to the OpenAPI YAML file')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (0 for any free port)')
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES, help='Directory of example responses')
+    parser.add_argument('--fixture', action='append', default=[], metavar='OPERATION=FILE',
+                        help='Serve FILE for an operationId (repeatable)')
+    parser.add_argument('--array-items', type=int, default=2, help='Array length in synthesized responses')
+    parser.add_argument('--total-rows', type=int, default=250, help='Rows behind each paginated operation')
+    parser.add_argument('--latency', type=float, default=0.0, metavar='MS', help='Added delay per response')
+    parser.add_argument('--jitter', type=float, default=0.0, metavar='MS', help='Random +- variation of --latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, metavar='P',
+                        help='Fraction of requests answered with an error status')
+    parser.add_argument('--error-status', type=int, action='append', metavar='STATUS',
+                        help='Status used for injected errors (repeatable; default 500, 502, 503)')
+    parser.add_argument('--rate-limit', type=parse_rate_limit, action='append', default=[],
+                        metavar='HOST=RPS[/BURST]', help='Answer 429 above this rate for HOST (repeatable)')
+    parser.add_argument('--no-gzip', action='store_true', help='Never gzip responses')
+    parser.add_argument('--seed', type=int, help='Seed for latency jitter and error injection')
+    parser.add_argument('--list', action='store_true', help='List the routes and where their bodies come from')
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f"Error: File '{args.file}' not found")
+        sys.exit(1)
+
+    overrides = {}
+    for value in args.fixture:
+        operation_id, _, path = value.partition('=')
+        overrides[operation_id] = Path(path)
+    routes = build_routes(load_spec(args.file), args.fixtures, args.array_items, overrides)
+
+    if args.list:
+        for route in routes:
+            print(f"{route.method:6} {route.host:12} {route.path:70} {route.operation_id:40} {route.source}")
+        print(f"\n{len(routes)} routes, {sum(route.source != 'schema' for route in routes)} from fixtures")
+        return
+
+    faults = Faults(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_statuses=tuple(args.error_status or Faults.error_statuses),
+        rate_limits=dict(args.rate_limit),
+        gzip=not args.no_gzip,
+    )
+    try:
+        asyncio.run(serve(MockServer(routes, faults, args.seed, args.total_rows), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -5,16 +5,44 @@ Smart file preservation script for SDK regeneration.
 This script preserves specified files during SDK regeneration by copying them
 from the original SDK repository to the newly generated SDK directory.
 
+Each line of the preserve file is a path relative to the repository root:
+    README.md                      a single file
+    .github/                       a directory (everything inside it)
+    src/griddy/nfl/custom/**       a glob; ** matches across directories
+    tests/custom_*.py              a glob; * and ? stay within one directory
+    !src/griddy/nfl/custom/tmp_*   exclude paths matched by earlier entries
+                                   (entries after it are not affected)
+
+All entries are resolved in one walk of the source directory. Only the
+directories that can contain a match are read, each at most once, and a file
+matched by several entries is copied once. Files whose target already has the
+same contents (size and mtime, then SHA-256) are left untouched.
+
 Usage:
     python preserve_files.py <source_dir> <target_dir> <preserve_file>
+        [--link-mode {copy,reflink,hardlink,auto}] [--profile PATH] [--cprofile PATH]
 
 Example:
     python preserve_files.py sdk-repo griddy-sdk-python sdk-repo/.speakeasy-preserve
+
+--link-mode selects how files are copied (see fast_copy.py); 'auto' clones
+files with reflinks when the filesystem supports it.
+
+--profile writes a JSON report with the wall time, file count and bytes copied
+of each phase, in the same format as copy_and_commit_sdk.py --profile.
 """
+import os
 import sys
-import shutil
+import argparse
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Set, Tuple
+
+from codegen_ignore import IgnoreMatcher
+from fast_copy import LINK_MODES, CopyStats, clone_file, files_identical
+from sync_profiler import profiler
+
+GLOB_CHARS = '*?['
 
 
 def read_preserve_patterns(preserve_file: Path) -> List[str]:
@@ -43,10 +71,169 @@ def read_preserve_patterns(preserve_file: Path) -> List[str]:
     return patterns
 
 
+def is_glob(pattern: str) -> bool:
+    """Check whether a preserve pattern contains glob characters"""
+    return any(char in pattern for char in GLOB_CHARS)
+
+
+def _dir_may_contain(pattern: str, rel_dir: str) -> bool:
+    """
+    Check whether a glob pattern could match something inside a directory.
+
+    Args:
+        pattern: Root-relative glob pattern
+        rel_dir: Root-relative directory ('' for the root)
+
+    Returns:
+        False only if no path under rel_dir can match the pattern
+    """
+    pattern_segments = pattern.strip('/').split('/')
+    dir_segments = rel_dir.split('/') if rel_dir else []
+
+    for index, dir_segment in enumerate(dir_segments):
+        if index >= len(pattern_segments):
+            return False
+        if pattern_segments[index] == '**':
+            return True
+        if index == len(pattern_segments) - 1:
+            # The directory itself matches the last segment; handled as a full match
+            return False
+        if not fnmatchcase(dir_segment, pattern_segments[index]):
+            return False
+    return True
+
+
+def _is_below(rel_path: str, rel_dir: str) -> bool:
+    """Check whether rel_path is strictly inside rel_dir ('' is the root)"""
+    return rel_path != rel_dir and (rel_dir == '' or rel_path.startswith(rel_dir + '/'))
+
+
+class _DirectoryCache:
+    """Reads each directory of a tree at most once"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._listings: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._trees: Dict[str, List[str]] = {}
+
+    def listdir(self, rel_dir: str) -> Tuple[List[str], List[str]]:
+        """Return sorted (subdirectory names, file names) of a directory"""
+        if rel_dir not in self._listings:
+            dirs, files = [], []
+            with os.scandir(self.root / rel_dir if rel_dir else self.root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+            self._listings[rel_dir] = (sorted(dirs), sorted(files))
+        return self._listings[rel_dir]
+
+    def tree(self, rel_dir: str) -> List[str]:
+        """Return every file below a directory as root-relative paths"""
+        if rel_dir not in self._trees:
+            dirs, files = self.listdir(rel_dir)
+            prefix = f"{rel_dir}/" if rel_dir else ''
+            paths = [prefix + name for name in files]
+            for name in dirs:
+                paths.extend(self.tree(prefix + name))
+            self._trees[rel_dir] = paths
+        return self._trees[rel_dir]
+
+
+def resolve_preserve_patterns(source_dir: Path, patterns: List[str]) -> Dict[str, List[str]]:
+    """
+    Resolve preserve patterns to files in one walk of the source directory.
+
+    Literal paths are checked with a single stat. Globs are matched while
+    walking only the directories that can contain a match; a directory that
+    matches a pattern as a whole is taken in full without further matching.
+    Each directory is read at most once across all patterns.
+
+    Args:
+        source_dir: Directory containing original files to preserve
+        patterns: Preserve patterns, in file order
+
+    Returns:
+        Mapping of each positive pattern to the sorted root-relative files it
+        selected (after the '!' exclusions that follow it). Patterns that
+        matched nothing map to an empty list.
+    """
+    positives = [p for p in patterns if not p.startswith('!')]
+    # Entries are applied in order: a '!' entry only excludes files matched by the entries above it
+    excludes = {
+        pattern: IgnoreMatcher(['/' + p[1:].lstrip('/') for p in patterns[index + 1:] if p.startswith('!')])
+        for index, pattern in enumerate(patterns) if not pattern.startswith('!')
+    }
+
+    cache = _DirectoryCache(source_dir)
+    matched: Dict[str, Set[str]] = {pattern: set() for pattern in positives}
+
+    # Literal entries: one stat each; directories are taken in full
+    for pattern in positives:
+        if is_glob(pattern):
+            continue
+        rel_path = pattern.strip('/')
+        source_path = source_dir / rel_path
+        if source_path.is_dir():
+            matched[pattern].update(cache.tree(rel_path))
+        elif source_path.is_file() and not pattern.endswith('/'):
+            matched[pattern].add(rel_path)
+
+    # Glob entries: walk from each pattern's literal directory prefix
+    globs = [p for p in positives if is_glob(p)]
+    matchers = {pattern: IgnoreMatcher(['/' + pattern.lstrip('/')]) for pattern in globs}
+
+    def walk(rel_dir: str, active: List[str]):
+        dirs, files = cache.listdir(rel_dir)
+        prefix = f"{rel_dir}/" if rel_dir else ''
+
+        for name in files:
+            rel_path = prefix + name
+            for pattern in active:
+                if matchers[pattern].is_ignored(rel_path):
+                    matched[pattern].add(rel_path)
+
+        for name in dirs:
+            rel_path = prefix + name
+            remaining = []
+            for pattern in active:
+                if matchers[pattern].prunes(rel_path):
+                    matched[pattern].update(cache.tree(rel_path))
+                elif _dir_may_contain(pattern, rel_path):
+                    remaining.append(pattern)
+            if remaining:
+                walk(rel_path, remaining)
+
+    roots: Dict[str, List[str]] = {}
+    for pattern in globs:
+        prefix = []
+        for segment in pattern.strip('/').split('/')[:-1]:
+            if is_glob(segment):
+                break
+            prefix.append(segment)
+        roots.setdefault('/'.join(prefix), []).append(pattern)
+
+    # Patterns rooted below another root are matched during the outer walk
+    for root in sorted(roots):
+        if any(_is_below(root, other) for other in roots):
+            continue
+        if not (source_dir / root).is_dir():
+            continue
+        active = [p for other, ps in roots.items() if other == root or _is_below(other, root) for p in ps]
+        walk(root, active)
+
+    return {
+        pattern: sorted(path for path in files if not excludes[pattern].is_ignored(path))
+        for pattern, files in matched.items()
+    }
+
+
 def preserve_files(
         source_dir: Path,
         target_dir: Path,
-        preserve_file: Path
+        preserve_file: Path,
+        link_mode: str = 'copy'
 ) -> Tuple[int, int]:
     """
     Copy files from source to target based on preserve file specifications.
@@ -54,10 +241,11 @@ def preserve_files(
     Args:
         source_dir: Directory containing original files to preserve
         target_dir: Directory where preserved files should be copied
-        preserve_file: File containing list of paths to preserve
+        preserve_file: File containing list of paths or globs to preserve
+        link_mode: Copy strategy (copy, reflink, hardlink or auto)
 
     Returns:
-        Tuple of (preserved_count, missing_count)
+        Tuple of (preserved_count, missing_count), counted per pattern
     """
     if not preserve_file.exists():
         print(f"No preservation file found at {preserve_file}")
@@ -68,39 +256,90 @@ def preserve_files(
     print(f"   Target: {target_dir}")
     print()
 
-    patterns = read_preserve_patterns(preserve_file)
+    with profiler.phase('read_patterns'):
+        patterns = read_preserve_patterns(preserve_file)
 
     if not patterns:
         print("No files specified for preservation")
         return 0, 0
 
+    with profiler.phase('resolve_patterns'):
+        resolved = resolve_preserve_patterns(source_dir, patterns)
+
     preserved_count = 0
     missing_count = 0
+    for pattern, files in resolved.items():
+        if not files:
+            print(f"Not found: {pattern}")
+            missing_count += 1
+        elif is_glob(pattern):
+            print(f"Preserved glob: {pattern} ({len(files)} file(s))")
+            preserved_count += 1
+        elif (source_dir / pattern.strip('/')).is_dir():
+            print(f"Preserved directory: {pattern} ({len(files)} file(s))")
+            preserved_count += 1
+        else:
+            print(f"Preserved file: {pattern}")
+            preserved_count += 1
+
+    # Overlapping entries are deduplicated so each file is copied once
+    unique_files = sorted({path for files in resolved.values() for path in files})
+    profiler.count('files_matched', len(unique_files))
 
-    for pattern in patterns:
-        source_path = source_dir / pattern
-        target_path = target_dir / pattern
+    copy_stats = CopyStats()
+    unchanged_count = 0
+
+    with profiler.phase('preserve'):
+        created_dirs: Set[Path] = set()
+        for rel_path in unique_files:
+            source_path = source_dir / rel_path
+            target_path = target_dir / rel_path
+
+            if files_identical(source_path, target_path):
+                unchanged_count += 1
+                continue
 
-        if source_path.exists():
             # Create parent directories if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if target_path.parent not in created_dirs:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target_path.parent)
 
-            # Copy file or directory, preserving metadata
-            if source_path.is_file():
-                shutil.copy2(source_path, target_path)
-                print(f"Preserved file: {pattern}")
-            elif source_path.is_dir():
-                shutil.copytree(source_path, target_path, dirs_exist_ok=True)
-                print(f"Preserved directory: {pattern}")
+            copy_with_stats(source_path, target_path, link_mode, copy_stats)
 
-            preserved_count += 1
-        else:
-            print(f"Not found: {pattern}")
-            missing_count += 1
+        profiler.count('files_unchanged', unchanged_count)
+        profiler.count('bytes_avoided', copy_stats.bytes_avoided)
+
+    print()
+    print(f"Copied {len(unique_files) - unchanged_count} of {len(unique_files)} matched file(s); "
+          f"{unchanged_count} already up to date")
+    if copy_stats.files:
+        print(f"Copy strategies ({link_mode} mode): {copy_stats.summary()}")
 
     return preserved_count, missing_count
 
 
+def copy_with_stats(source_path, target_path, link_mode: str, copy_stats: CopyStats):
+    """
+    Copy a single file with the given link mode, reporting it to the profiler.
+
+    Args:
+        source_path: File to copy
+        target_path: Destination path
+        link_mode: Copy strategy passed to fast_copy.clone_file
+        copy_stats: Tally of the copy strategies used
+
+    Returns:
+        The destination path
+    """
+    strategy = clone_file(Path(source_path), Path(target_path), link_mode)
+    size = Path(target_path).stat().st_size
+    copy_stats.record(strategy, size)
+    profiler.count('files_copied')
+    profiler.count(f'files_{strategy}')
+    profiler.count('bytes_copied', size)
+    return target_path
+
+
 def validate_directories(source_dir: Path, target_dir: Path) -> None:
     """
     Validate that source and target directories exist.
@@ -150,24 +389,38 @@ def print_summary(preserved_count: int, missing_count: int) -> None:
 
 def main():
     """Main entry point for the script."""
-    if len(sys.argv) != 4:
-        print("Error: Incorrect number of arguments")
-        print()
-        print("Usage: preserve_files.py <source_dir> <target_dir> <preserve_file>")
-        print()
-        print("Arguments:")
-        print("  source_dir    - Directory containing files to preserve")
-        print("  target_dir    - Directory where files should be copied")
-        print("  preserve_file - File listing paths to preserve")
-        print()
-        print("Example:")
-        print("  python preserve_files.py sdk-repo generated-sdk sdk-repo/.speakeasy-preserve")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='Copy preserved files from the SDK repository into a newly generated SDK',
+        epilog='Example: python preserve_files.py sdk-repo generated-sdk sdk-repo/.speakeasy-preserve'
+    )
+    parser.add_argument('source_dir', type=Path, help='Directory containing files to preserve')
+    parser.add_argument('target_dir', type=Path, help='Directory where files should be copied')
+    parser.add_argument('preserve_file', type=Path, help='File listing paths to preserve')
+    parser.add_argument(
+        '--link-mode',
+        choices=LINK_MODES,
+        default='copy',
+        help='How files are copied: copy, reflink, hardlink or auto (default: copy)'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='PATH',
+        help="Write a JSON phase timing report to PATH ('-' for stdout)"
+    )
+    parser.add_argument(
+        '--cprofile',
+        type=Path,
+        metavar='PATH',
+        help='Write a cProfile (pstats) dump of the run to PATH'
+    )
+    args = parser.parse_args()
 
     # Parse arguments
-    source_dir = Path(sys.argv[1]).resolve()
-    target_dir = Path(sys.argv[2]).resolve()
-    preserve_file = Path(sys.argv[3]).resolve()
+    source_dir = args.source_dir.resolve()
+    target_dir = args.target_dir.resolve()
+    preserve_file = args.preserve_file.resolve()
+
+    profiler.start(args.profile, args.cprofile)
 
     try:
         # Validate inputs
@@ -177,7 +430,8 @@ def main():
         preserved_count, missing_count = preserve_files(
             source_dir,
             target_dir,
-            preserve_file
+            preserve_file,
+            args.link_mode
         )
 
         # Print summary
@@ -198,6 +452,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        profiler.finish()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Shared, cached loader for openapi/nfl-com-api.yaml.
+
+Parsing the ~14k-line spec takes over a second with the pure-Python YAML
+loader, and every tool that reads it (fix_endpoint_servers.py, lint helpers,
+example validators) used to pay that cost on each run. `load_spec` stores the
+parsed spec in a pickle sidecar next to the file, keyed by the SHA-256 of the
+file's contents. While the spec is unchanged, loading it is a hash plus an
+unpickle, which takes a few milliseconds.
+
+The sidecar is written to `<spec dir>/.spec-cache/<spec name>.pickle` (or to
+$SPEC_CACHE_DIR if set) and is ignored by git. Set SPEC_CACHE_DIR to an empty
+string to disable caching. Only load sidecars you wrote yourself: like any
+pickle, a sidecar can run code when loaded.
+
+`$ref`s are left in place in the cached data. `resolve_refs` wraps the spec in
+read-only views that resolve a `$ref` only when that node is accessed, so tools
+that read a handful of operations don't expand the whole component graph:
+
+    spec = resolve_refs(load_spec(Path('openapi/nfl-com-api.yaml')))
+    schema = spec['paths']['/api/content/game/preview']['get']['responses']['200']
+    schema['content']['application/json']['schema']['properties']  # resolved here
+
+Usage:
+    python spec_cache.py [openapi-file.yaml] [--refresh]
+"""
+import os
+import sys
+import time
+import pickle
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+from collections.abc import Mapping, Sequence
+
+import yaml
+
+# Prefer the libyaml bindings; fall back to the pure-Python implementation
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+DEFAULT_SPEC = Path(__file__).resolve().parent.parent / 'openapi' / 'nfl-com-api.yaml'
+CACHE_DIR_NAME = '.spec-cache'
+
+# Bump when the cached structure changes so old sidecars are rebuilt
+CACHE_FORMAT = 1
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of the spec's contents"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sidecar_path(spec_path: Path) -> Optional[Path]:
+    """
+    Return where the parsed-spec cache for a spec file lives.
+
+    Args:
+        spec_path: Path to the spec file
+
+    Returns:
+        Path to the pickle sidecar, or None if caching is disabled
+    """
+    cache_dir = os.environ.get('SPEC_CACHE_DIR')
+    if cache_dir == '':
+        return None
+    directory = Path(cache_dir) if cache_dir else spec_path.resolve().parent / CACHE_DIR_NAME
+    return directory / f"{spec_path.name}.pickle"
+
+
+def _read_sidecar(path: Path, digest: str) -> Optional[Any]:
+    """Return the cached spec if the sidecar matches digest, else None"""
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if header != (CACHE_FORMAT, digest, yaml.__version__):
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+
+def _write_sidecar(path: Path, digest: str, spec: Any):
+    """Atomically write the sidecar; failures only cost the cache"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((CACHE_FORMAT, digest, yaml.__version__), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        print(f"Warning: could not write spec cache {path}: {e}", file=sys.stderr)
+
+
+def load_spec(spec_path: Path = DEFAULT_SPEC, refresh: bool = False) -> Any:
+    """
+    Load a YAML spec, reusing the parsed result while the file is unchanged.
+
+    Args:
+        spec_path: Path to the spec file
+        refresh: If True, ignore any existing sidecar and rebuild it
+
+    Returns:
+        The parsed spec (plain dicts, lists and scalars, as from yaml.safe_load).
+        Callers share no state with the cache, so the result may be modified.
+    """
+    spec_path = Path(spec_path)
+    with open(spec_path, 'rb') as f:
+        raw = f.read()
+    digest = content_hash(raw)
+
+    cache = sidecar_path(spec_path)
+    if cache is not None and not refresh:
+        spec = _read_sidecar(cache, digest)
+        if spec is not None:
+            return spec
+
+    spec = yaml.load(raw, Loader=Loader)
+    if cache is not None:
+        _write_sidecar(cache, digest, spec)
+    return spec
+
+
+class RefResolver:
+    """Resolves local JSON pointers ("#/components/schemas/Foo") against a spec"""
+
+    def __init__(self, spec: Any):
+        self.spec = spec
+        self._cache: Dict[str, Any] = {}
+
+    def resolve(self, ref: str) -> Any:
+        """
+        Return the raw node a local $ref points to.
+
+        Args:
+            ref: A reference of the form "#/a/b/c"
+
+        Returns:
+            The referenced node, with any $refs inside it left unresolved
+
+        Raises:
+            KeyError: If the reference is not local or does not exist
+        """
+        if ref in self._cache:
+            return self._cache[ref]
+        if not ref.startswith('#'):
+            raise KeyError(f"Only local $refs are supported: {ref}")
+
+        node = self.spec
+        tokens = ref[1:].lstrip('/').split('/') if ref != '#' else []
+        for token in tokens:
+            token = token.replace('~1', '/').replace('~0', '~')
+            node = node[int(token)] if isinstance(node, list) else node[token]
+
+        self._cache[ref] = node
+        return node
+
+    def view(self, node: Any) -> Any:
+        """Wrap a node so $refs inside it are resolved on access"""
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            # Follow chains of $refs, guarding against loops
+            if node['$ref'] in seen:
+                raise KeyError(f"Circular $ref: {node['$ref']}")
+            seen.add(node['$ref'])
+            node = self.resolve(node['$ref'])
+        if isinstance(node, dict):
+            return ResolvedMapping(node, self)
+        if isinstance(node, list):
+            return ResolvedSequence(node, self)
+        return node
+
+
+class ResolvedMapping(Mapping):
+    """Read-only mapping view whose $ref values are resolved when accessed"""
+
+    __slots__ = ('raw', '_resolver')
+
+    def __init__(self, raw: Dict, resolver: RefResolver):
+        self.raw = raw
+        self._resolver = resolver
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._resolver.view(self.raw[key])
+
+    def __iter__(self) -> Iterator:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"ResolvedMapping({list(self.raw)!r})"
+
+
+class ResolvedSequence(Sequence):
+    """Read-only sequence view whose $ref items are resolved when accessed"""
+
+    __slots__ = ('raw', '_resolver')
+
+    def __init__(self, raw: list, resolver: RefResolver):
+        self.raw = raw
+        self._resolver = resolver
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._resolver.view(item) for item in self.raw[index]]
+        return self._resolver.view(self.raw[index])
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"ResolvedSequence(len={len(self.raw)})"
+
+
+def resolve_refs(spec: Any) -> Any:
+    """
+    Wrap a parsed spec in views that resolve local $refs lazily.
+
+    Args:
+        spec: A parsed spec, e.g. from load_spec()
+
+    Returns:
+        A read-only mapping view of the spec; nested $refs are resolved (and
+        memoized) only when the referring node is accessed
+    """
+    return RefResolver(spec).view(spec)
+
+
+def _timed(func, *args, **kwargs) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Build or refresh the parsed-spec cache and report load times'
+    )
+    parser.add_argument(
+        'openapi_file',
+        nargs='?',
+        type=Path,
+        default=DEFAULT_SPEC,
+        help='Path to the OpenAPI spec (default: openapi/nfl-com-api.yaml)'
+    )
+    parser.add_argument('--refresh', action='store_true', help='Rebuild the cache even if it is current')
+    args = parser.parse_args()
+
+    if not args.openapi_file.exists():
+        print(f"Error: File '{args.openapi_file}' not found")
+        sys.exit(1)
+
+    cache = sidecar_path(args.openapi_file)
+    _, first = _timed(load_spec, args.openapi_file, refresh=args.refresh)
+    spec, second = _timed(load_spec, args.openapi_file)
+
+    print(f"Spec: {args.openapi_file}")
+    print(f"Cache: {cache if cache is not None else 'disabled (SPEC_CACHE_DIR is empty)'}")
+    print(f"  - First load: {first * 1000:.1f} ms")
+    print(f"  - Cached load: {second * 1000:.1f} ms")
+    print(f"  - Paths: {len(spec.get('paths') or {})}")
+    print(f"  - Schemas: {len((spec.get('components') or {}).get('schemas') or {})}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Change-impact analysis for openapi/nfl-com-api.yaml.
+
+Builds the `$ref` dependency graph over the spec's components and its
+operations, diffs two revisions of the spec, and reports which schemas,
+operations and generated SDK files are affected:
+
+    - A changed component affects itself and every component and operation
+      that references it, directly or transitively
+    - A changed operation (including its path-level parameters) affects itself
+    - Changes outside `paths` and `components` (info, servers, security,
+      tags, ...) can touch any generated file, so the whole SDK is affected
+    - Changes to anything else that feeds generation (GENERATION_INPUTS: the
+      Speakeasy config, the SDK overlays, the preserve list, the scripts the
+      workflow runs) affect the whole SDK as well
+
+Affected schemas and operations are mapped to generated file patterns using
+Speakeasy's Python naming (class and operation names lowercased, resources
+named after tags). The patterns use globs so inline models generated next to
+a schema, e.g. `weeklygamedetailsummary*.py`, are included.
+
+The scope of a change is one of:
+    none     nothing that reaches the SDK changed (e.g. comments, formatting,
+             or no change to the spec at all); generation can be skipped
+    partial  only the listed SDK paths are affected
+    full     regenerate and copy everything
+
+Usage:
+    python spec_impact.py [--spec FILE] [--base REV] [--head REV]
+                          [--json] [--paths-file FILE] [--github-output FILE]
+
+--base defaults to HEAD~1 and --head to the working tree copy of the spec.
+"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+from spec_cache import DEFAULT_SPEC, Loader, load_spec
+from spec_transform import HTTP_METHODS
+
+# Root of the generated package inside the SDK repository (moduleName griddy.nfl)
+SDK_PACKAGE_DIR = 'src/griddy/nfl'
+
+# Files regenerated on every run, whatever changed
+ALWAYS_AFFECTED = [
+    '.speakeasy/gen.lock',
+    f'{SDK_PACKAGE_DIR}/_version.py',
+]
+
+# Top-level keys whose changes are confined to the nodes they contain
+SCOPED_KEYS = ('paths', 'components')
+
+# Files besides the spec that feed generation, relative to the repository
+# root; a trailing slash matches everything below a directory
+GENERATION_INPUTS = (
+    '.speakeasy/',
+    '.speakeasy-preserve',
+    'sdk-overlays/',
+    'scripts/',
+    '.github/workflows/generate-sdks.yml',
+)
+
+
+def iter_refs(node: Any) -> Iterator[str]:
+    """Yield every $ref string found anywhere inside a node"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str):
+                yield ref
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def operation_key(path: str, method: str, operation: Dict) -> str:
+    """Return the graph key of an operation: op:<operationId>, or op:<METHOD> <path>"""
+    operation_id = operation.get('operationId') if isinstance(operation, dict) else None
+    return f"op:{operation_id}" if operation_id else f"op:{method.upper()} {path}"
+
+
+def spec_nodes(spec: Dict) -> Dict[str, Any]:
+    """
+    Split a spec into the nodes tracked by the dependency graph.
+
+    Args:
+        spec: The parsed spec
+
+    Returns:
+        Mapping of node key to definition. Components are keyed by their $ref
+        ("#/components/schemas/Foo"); operations by operation_key() and
+        include their path item's shared fields (e.g. path-level parameters).
+    """
+    nodes: Dict[str, Any] = {}
+
+    for kind, entries in (spec.get('components') or {}).items():
+        if not isinstance(entries, dict):
+            continue
+        for name, definition in entries.items():
+            nodes[f"#/components/{kind}/{name}"] = definition
+
+    for path, path_item in (spec.get('paths') or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        shared = {key: value for key, value in path_item.items() if key not in HTTP_METHODS}
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS:
+                key = operation_key(path, method, operation)
+                nodes[key] = {'path': path, 'method': method, 'shared': shared, 'operation': operation}
+
+    return nodes
+
+
+class DependencyGraph:
+    """$ref dependency graph over a spec's components and operations"""
+
+    def __init__(self, spec: Dict):
+        self.nodes = spec_nodes(spec)
+        self.dependencies: Dict[str, Set[str]] = {}
+        self.dependents: Dict[str, Set[str]] = {key: set() for key in self.nodes}
+
+        for key, definition in self.nodes.items():
+            refs = {ref for ref in iter_refs(definition) if ref in self.nodes}
+            self.dependencies[key] = refs
+            for ref in refs:
+                self.dependents[ref].add(key)
+
+    def operations(self) -> List[str]:
+        """Return the keys of all operations"""
+        return [key for key in self.nodes if key.startswith('op:')]
+
+    def reachable_from(self, keys: Set[str], edges: Dict[str, Set[str]]) -> Set[str]:
+        """Return keys plus everything reachable from them along edges"""
+        seen = set(keys)
+        stack = list(keys)
+        while stack:
+            for neighbour in edges.get(stack.pop(), ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        return seen
+
+    def impacted_by(self, keys: Set[str]) -> Set[str]:
+        """Return every node that (transitively) references one of keys, plus keys"""
+        return self.reachable_from(keys, self.dependents)
+
+
+def _lower_name(name: str) -> str:
+    """Speakeasy's Python file naming: the identifier lowercased, non-alphanumerics dropped"""
+    return ''.join(char for char in name if char.isalnum()).lower()
+
+
+def _resource_module(tag: str) -> str:
+    """Speakeasy's Python resource module name for a tag"""
+    return '_'.join(part.lower() for part in tag.replace('-', ' ').split())
+
+
+def sdk_paths_for(key: str, definition: Any) -> List[str]:
+    """
+    Map a graph node to the generated SDK file patterns it produces.
+
+    Args:
+        key: Graph node key
+        definition: The node's definition from spec_nodes()
+
+    Returns:
+        List of gitignore-style patterns relative to the SDK repository root
+    """
+    if key.startswith('op:'):
+        operation = definition.get('operation') or {}
+        name = _lower_name(operation.get('operationId') or f"{definition['method']}{definition['path']}")
+        paths = [
+            f"{SDK_PACKAGE_DIR}/models/{name}op.py",
+            f"docs/models/{name}*.md",
+        ]
+        for tag in operation.get('tags') or []:
+            paths.append(f"{SDK_PACKAGE_DIR}/{_resource_module(tag)}.py")
+            paths.append(f"docs/sdks/{_lower_name(tag)}/README.md")
+        return paths
+
+    kind, name = key.split('/')[-2:]
+    if kind in ('schemas', 'responses', 'requestBodies', 'parameters'):
+        name = _lower_name(name)
+        return [
+            f"{SDK_PACKAGE_DIR}/models/{name}*.py",
+            f"{SDK_PACKAGE_DIR}/errors/{name}*.py",
+            f"docs/models/{name}*.md",
+            f"docs/errors/{name}*.md",
+        ]
+    # securitySchemes and other component kinds feed shared SDK code
+    return [f"{SDK_PACKAGE_DIR}/models/security.py", f"{SDK_PACKAGE_DIR}/sdk.py", f"{SDK_PACKAGE_DIR}/basesdk.py"]
+
+
+def analyze(old_spec: Optional[Dict], new_spec: Dict) -> Dict:
+    """
+    Compare two revisions of the spec.
+
+    Args:
+        old_spec: The base revision, or None if it isn't available
+        new_spec: The head revision
+
+    Returns:
+        Report with keys scope, reasons, changed, affected and sdk_paths
+        (see the module docstring for the meaning of scope)
+    """
+    report: Dict[str, Any] = {
+        'scope': 'none',
+        'reasons': [],
+        'changed': {'components': [], 'operations': []},
+        'affected': {'components': [], 'operations': []},
+        'sdk_paths': [],
+    }
+
+    if old_spec is None:
+        report['scope'] = 'full'
+        report['reasons'].append('base revision of the spec is not available')
+        return report
+
+    for key in sorted(set(old_spec) | set(new_spec)):
+        if key not in SCOPED_KEYS and old_spec.get(key) != new_spec.get(key):
+            report['scope'] = 'full'
+            report['reasons'].append(f"top-level '{key}' changed")
+    if report['scope'] == 'full':
+        return report
+
+    old_nodes = spec_nodes(old_spec)
+    graph = DependencyGraph(new_spec)
+
+    changed = {
+        key for key in set(old_nodes) | set(graph.nodes)
+        if old_nodes.get(key) != graph.nodes.get(key)
+    }
+    if not changed:
+        return report
+
+    added = changed - set(old_nodes)
+    removed = changed - set(graph.nodes)
+    affected = graph.impacted_by(changed & set(graph.nodes)) | removed
+
+    sdk_paths: List[str] = []
+    for key in sorted(affected):
+        definition = graph.nodes.get(key, old_nodes.get(key))
+        sdk_paths.extend(sdk_paths_for(key, definition))
+
+    if added or removed:
+        # Package exports and the README's operation list enumerate every model/operation
+        sdk_paths += [f"{SDK_PACKAGE_DIR}/models/__init__.py", f"{SDK_PACKAGE_DIR}/errors/__init__.py", 'README.md']
+        report['reasons'].append(f"{len(added)} node(s) added, {len(removed)} removed")
+    old_tags = {tag for key, node in old_nodes.items() if key.startswith('op:')
+                for tag in (node.get('operation') or {}).get('tags') or []}
+    new_tags = {tag for key in graph.operations() for tag in graph.nodes[key]['operation'].get('tags') or []}
+    if old_tags != new_tags:
+        sdk_paths += [f"{SDK_PACKAGE_DIR}/sdk.py", 'README.md']
+        report['reasons'].append('set of operation tags changed')
+
+    def split(keys: Set[str]) -> Tuple[List[str], List[str]]:
+        return (sorted(k for k in keys if not k.startswith('op:')),
+                sorted(k[3:] for k in keys if k.startswith('op:')))
+
+    report['scope'] = 'partial'
+    report['reasons'].append(f"{len(changed)} component(s)/operation(s) changed")
+    report['changed']['components'], report['changed']['operations'] = split(changed)
+    report['affected']['components'], report['affected']['operations'] = split(affected)
+    report['sdk_paths'] = sorted(set(sdk_paths + ALWAYS_AFFECTED))
+    return report
+
+
+def git_root_for(path: Path) -> Path:
+    """Return the root of the git repository containing path"""
+    result = subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'],
+        cwd=path.resolve().parent, capture_output=True, text=True, check=True
+    )
+    return Path(result.stdout.strip())
+
+
+def load_spec_at(spec_path: Path, revision: str) -> Optional[Dict]:
+    """
+    Load the spec as of a git revision.
+
+    Args:
+        spec_path: Path to the spec in the working tree
+        revision: Any git revision (commit, branch, HEAD~1, ...)
+
+    Returns:
+        The parsed spec, or None if the revision or the file at it doesn't exist
+    """
+    if not revision or set(revision) == {'0'}:
+        # Empty, or the all-zero "before" sha GitHub sends for new branches
+        return None
+
+    git_root = git_root_for(spec_path)
+    rel_path = spec_path.resolve().relative_to(git_root).as_posix()
+    result = subprocess.run(
+        ['git', 'show', f"{revision}:{rel_path}"], cwd=git_root, capture_output=True
+    )
+    if result.returncode != 0:
+        return None
+    return yaml.load(result.stdout, Loader=Loader)
+
+
+def changed_generation_inputs(spec_path: Path, base: str, head: Optional[str] = None) -> List[str]:
+    """
+    List the files in GENERATION_INPUTS that changed between two revisions.
+
+    Args:
+        spec_path: Path to the spec in the working tree (locates the repository)
+        base: Git revision to compare against
+        head: Git revision to compare with (default: the working tree)
+
+    Returns:
+        Changed paths relative to the repository root; every input is
+        reported as changed if the diff can't be computed
+    """
+    git_root = git_root_for(spec_path)
+    result = subprocess.run(
+        ['git', 'diff', '--name-only', base] + ([head] if head else []) + ['--'],
+        cwd=git_root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return list(GENERATION_INPUTS)
+    return [
+        path for path in result.stdout.splitlines()
+        if any(path == entry or (entry.endswith('/') and path.startswith(entry)) for entry in GENERATION_INPUTS)
+    ]
+
+
+def print_report(report: Dict):
+    """Print a human-readable summary of an impact report"""
+    print(f"Scope: {report['scope']}")
+    for reason in report['reasons']:
+        print(f"  - {reason}")
+
+    for section in ('changed', 'affected'):
+        components = report[section]['components']
+        operations = report[section]['operations']
+        if not components and not operations:
+            continue
+        print(f"\n{section.capitalize()}: {len(components)} component(s), {len(operations)} operation(s)")
+        for component in components:
+            print(f"  {component}")
+        for operation in operations:
+            print(f"  op {operation}")
+
+    if report['sdk_paths']:
+        print(f"\nSDK paths ({len(report['sdk_paths'])}):")
+        for path in report['sdk_paths']:
+            print(f"  {path}")
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Report which schemas, operations and SDK files a spec change affects'
+    )
+    parser.add_argument('--spec', type=Path, default=DEFAULT_SPEC, help='Path to the OpenAPI spec')
+    parser.add_argument('--base', default='HEAD~1', help='Git revision to compare against (default: HEAD~1)')
+    parser.add_argument('--head', help='Git revision to analyze (default: the working tree copy)')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument(
+        '--paths-file',
+        type=Path,
+        help='Write affected SDK path patterns here, one per line (for copy_and_commit_sdk.py --only-paths)'
+    )
+    parser.add_argument(
+        '--github-output',
+        type=Path,
+        help='Append scope=... and sdk_changed=... to this GitHub Actions output file'
+    )
+    args = parser.parse_args()
+
+    if not args.spec.exists():
+        print(f"Error: File '{args.spec}' not found")
+        sys.exit(1)
+
+    old_spec = load_spec_at(args.spec, args.base)
+    new_spec = load_spec_at(args.spec, args.head) if args.head else load_spec(args.spec)
+    if new_spec is None:
+        print(f"Error: '{args.spec}' does not exist at revision {args.head}")
+        sys.exit(1)
+
+    report = analyze(old_spec, new_spec)
+    if report['scope'] != 'full':
+        inputs = changed_generation_inputs(args.spec, args.base, args.head)
+        if inputs:
+            report['scope'] = 'full'
+            report['reasons'].append(f"{len(inputs)} generation input(s) changed: {', '.join(inputs[:5])}"
+                                     + (', ...' if len(inputs) > 5 else ''))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.paths_file:
+        with open(args.paths_file, 'w', encoding='utf-8') as f:
+            f.writelines(f"{path}\n" for path in report['sdk_paths'])
+
+    if args.github_output:
+        with open(args.github_output, 'a', encoding='utf-8') as f:
+            f.write(f"scope={report['scope']}\n")
+            f.write(f"sdk_changed={'true' if report['scope'] != 'none' else 'false'}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Round-trip-safe transforms for openapi/nfl-com-api.yaml.
+
+Loading the spec into Python objects and dumping it back rewrites the whole
+file: comments are dropped, formatting changes, and shared anchors such as
+`servers: &id001` are expanded into one copy per operation. Instead, a
+SpecDocument composes the YAML node graph once, using the libyaml C loader
+when available, and transforms record text edits against the original source.
+Everything outside the edited spans stays byte for byte the same, including
+anchors, aliases, comments and key order.
+
+Several transforms can be chained over a single parse:
+
+    document = SpecDocument.from_file(Path('openapi/nfl-com-api.yaml'))
+    results = run_transforms(document, [EndpointServers(), OtherFix()])
+    Path('openapi/nfl-com-api.yaml').write_text(document.render())
+
+Every transform sees the original document. Edits from different transforms
+must not overlap, or render() raises a SpecTransformError.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import yaml
+
+# Prefer the libyaml bindings; fall back to the pure-Python implementation
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+
+class SpecTransformError(Exception):
+    """Raised when edits cannot be applied to the document"""
+
+
+class SpecDocument:
+    """A composed YAML document that records text edits against its source"""
+
+    def __init__(self, text: str, name: str = '<spec>'):
+        self.text = text
+        self.name = name
+        self.root = yaml.compose(text, Loader=Loader)
+        if not isinstance(self.root, yaml.MappingNode):
+            raise SpecTransformError(f"{name}: top level of the spec must be a mapping")
+
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        self._edits: List[Tuple[int, int, str, str]] = []
+        self._data: Optional[Any] = None
+
+        # Node marks don't carry anchor names, and an alias resolves to the
+        # anchored node itself, so anchors and aliases are read from events
+        self._anchors: Dict[int, str] = {}
+        self._alias_starts: List[int] = []
+        self._aliases: List[Tuple[int, int, str]] = []
+        for event in yaml.parse(text, Loader=Loader):
+            if isinstance(event, yaml.AliasEvent):
+                start, end = self.offset(event.start_mark), self.offset(event.end_mark)
+                self._alias_starts.append(start)
+                self._aliases.append((start, end, event.anchor))
+            elif getattr(event, 'anchor', None):
+                self._anchors[self.offset(event.start_mark)] = event.anchor
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'SpecDocument':
+        """Read and compose a spec file"""
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return cls(f.read(), str(path))
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    def offset(self, mark) -> int:
+        """Convert a node or event mark into a character offset in the source"""
+        return self._line_starts[mark.line] + mark.column
+
+    def get(self, mapping: yaml.MappingNode, key: str) -> Optional[Tuple[yaml.Node, yaml.Node]]:
+        """Return the (key_node, value_node) pair for a key in a mapping node"""
+        for key_node, value_node in mapping.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == key:
+                return key_node, value_node
+        return None
+
+    def anchor_of(self, node: yaml.Node) -> Optional[str]:
+        """Return the anchor name defined on a node, if any"""
+        return self._anchors.get(self.offset(node.start_mark))
+
+    def is_alias(self, key_node: yaml.Node, value_node: yaml.Node) -> bool:
+        """Check whether a mapping value is written as an alias (*name)"""
+        return self.offset(value_node.start_mark) < self.offset(key_node.end_mark)
+
+    def value_span(self, key_node: yaml.Node, value_node: yaml.Node) -> Tuple[int, int]:
+        """
+        Return the source span of a mapping value, from just after its key.
+
+        The span starts right after the key (before the colon) and ends at the
+        last non-whitespace character of the value, so replacing it with
+        ": <new value>" keeps the surrounding layout intact.
+        """
+        start = self.offset(key_node.end_mark)
+        if self.is_alias(key_node, value_node):
+            index = bisect_left(self._alias_starts, start)
+            end = self._aliases[index][1]
+        else:
+            end = self.offset(value_node.end_mark)
+            while end > start and self.text[end - 1] in ' \t\r\n':
+                end -= 1
+        return start, end
+
+    def end_of_entries(self, mapping: yaml.MappingNode) -> int:
+        """Return the offset just past the line holding a block mapping's last value"""
+        key_node, value_node = mapping.value[-1]
+        _, end = self.value_span(key_node, value_node)
+        newline = self.text.find('\n', end)
+        return len(self.text) if newline == -1 else newline + 1
+
+    def to_data(self, node: yaml.Node) -> Any:
+        """Convert a node to plain Python data (scalars are kept as strings)"""
+        if isinstance(node, yaml.MappingNode):
+            return {self.to_data(k): self.to_data(v) for k, v in node.value}
+        if isinstance(node, yaml.SequenceNode):
+            return [self.to_data(item) for item in node.value]
+        return node.value
+
+    @property
+    def data(self) -> Any:
+        """The whole document as plain data, built on first use"""
+        if self._data is None:
+            self._data = self.to_data(self.root)
+        return self._data
+
+    def iter_operations(self) -> Iterator[Tuple[str, str, yaml.Node, yaml.MappingNode]]:
+        """Yield (path, method, method_key_node, operation_node) in document order"""
+        paths = self.get(self.root, 'paths')
+        if not paths or not isinstance(paths[1], yaml.MappingNode):
+            return
+        for path_key, path_item in paths[1].value:
+            if not isinstance(path_item, yaml.MappingNode):
+                continue
+            for method_key, operation in path_item.value:
+                if method_key.value in HTTP_METHODS and isinstance(operation, yaml.MappingNode):
+                    yield path_key.value, method_key.value, method_key, operation
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    @property
+    def newline(self) -> str:
+        """The line ending used by the source"""
+        return '\r\n' if '\r\n' in self.text[:4096] else '\n'
+
+    def new_anchor(self, base: str) -> str:
+        """Return an anchor name not already used in the document"""
+        used = set(self._anchors.values()) | {name for _, _, name in self._edits if name}
+        name, suffix = base, 1
+        while name in used:
+            suffix += 1
+            name = f"{base}{suffix}"
+        return name
+
+    def replace(self, start: int, end: int, text: str, anchor: str = ''):
+        """Record a replacement of source[start:end] with text"""
+        self._edits.append((start, end, text, anchor))
+
+    def insert(self, offset: int, text: str, anchor: str = ''):
+        """Record an insertion of text at offset"""
+        self._edits.append((offset, offset, text, anchor))
+
+    def render_block(self, data: Any, indent: int) -> str:
+        """Dump data as a block at the given indentation, using the source's line endings"""
+        dumped = yaml.dump(data, Dumper=Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        lines = [' ' * indent + line for line in dumped.splitlines()]
+        return self.newline.join(lines) + self.newline
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._edits)
+
+    def render(self) -> str:
+        """Apply the recorded edits to the source text"""
+        edits = sorted(self._edits, key=lambda edit: (edit[0], edit[1]))
+        for (start_a, end_a, _, _), (start_b, _, _, _) in zip(edits, edits[1:]):
+            if start_b < end_a:
+                line = bisect_right(self._line_starts, start_b)
+                raise SpecTransformError(f"{self.name}: overlapping edits near line {line}")
+
+        parts = []
+        position = 0
+        for start, end, text, _ in edits:
+            parts.append(self.text[position:start])
+            parts.append(text)
+            position = end
+        parts.append(self.text[position:])
+        return ''.join(parts)
+
+
+class SpecTransform:
+    """Base class for a transform that records edits on a SpecDocument"""
+
+    #: Short name used in reports
+    name = 'transform'
+
+    def apply(self, document: SpecDocument) -> int:
+        """
+        Record edits on the document.
+
+        Args:
+            document: The parsed spec
+
+        Returns:
+            Number of nodes changed
+        """
+        raise NotImplementedError
+
+
+def run_transforms(document: SpecDocument, transforms: Sequence[SpecTransform]) -> Dict[str, int]:
+    """
+    Apply several transforms to one parsed document.
+
+    Args:
+        document: The parsed spec
+        transforms: Transforms to apply, in order
+
+    Returns:
+        Mapping of transform name to number of nodes it changed
+    """
+    return {transform.name: transform.apply(document) for transform in transforms}
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Derive the sub-SDK map of the Python SDK from the spec's tags.
+
+GriddyNFL (src/griddy/nfl/sdk.py, a hand-owned file) creates its sub-SDKs on
+first attribute access instead of importing every tag module up front. To do
+that it needs, per tag, the attribute name and the module and class Speakeasy
+generates for it. This script derives them from openapi/nfl-com-api.yaml and
+writes them as a Python module into the SDK overlay, so new tags are picked up
+without editing sdk.py:
+
+    - Every tag used by an operation is a sub-SDK ("Player Statistics" ->
+      sdk.player_statistics, griddy.nfl.player_statistics.PlayerStatistics)
+    - SubSDKs declares the attributes for type checkers and editors; GriddyNFL
+      inherits it, and the declarations create no attributes at runtime
+
+Usage:
+    python sub_sdks.py <openapi-file.yaml> [--output FILE | --check FILE]
+"""
+import re
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, Tuple
+
+from spec_cache import load_spec
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent.parent / 'sdk-overlays/python/src/griddy/nfl/_sub_sdks.py'
+
+PACKAGE = 'griddy.nfl'
+
+HEADER = '''"""
+Sub-SDKs of GriddyNFL, created on first attribute access.
+
+Generated from openapi/nfl-com-api.yaml by scripts/sub_sdks.py in
+griddy-sdk-sources; do not edit by hand.
+"""
+from typing import TYPE_CHECKING
+'''
+
+
+def tag_names(tag: str) -> Tuple[str, str]:
+    """Attribute/module name and class name Speakeasy derives from a tag"""
+    words = re.findall(r'[A-Za-z0-9]+', tag)
+    return '_'.join(word.lower() for word in words), ''.join(word[0].upper() + word[1:] for word in words)
+
+
+def build_sub_sdks(spec: Dict) -> Dict[str, str]:
+    """Attribute name -> class name for every tag used by an operation"""
+    sub_sdks = {}
+    for item in (spec.get('paths') or {}).values():
+        for operation in item.values():
+            if not isinstance(operation, dict):
+                continue
+            for tag in operation.get('tags') or []:
+                attribute, class_name = tag_names(tag)
+                sub_sdks[attribute] = class_name
+    return dict(sorted(sub_sdks.items()))
+
+
+def render(sub_sdks: Dict[str, str]) -> str:
+    imports = '\n'.join(f"    from .{attribute} import {class_name}" for attribute, class_name in sub_sdks.items())
+    declarations = '\n'.join(f"    {attribute}: \"{class_name}\"" for attribute, class_name in sub_sdks.items())
+    entries = '\n'.join(f"    '{attribute}': ('{PACKAGE}.{attribute}', '{class_name}'),"
+                        for attribute, class_name in sub_sdks.items())
+    return (
+        f"{HEADER}\nif TYPE_CHECKING:\n{imports}\n\n\n"
+        f"class SubSDKs:\n    \"\"\"Attribute declarations of the sub-SDKs\"\"\"\n\n{declarations}\n\n\n"
+        f"# Attribute -> (module, class)\nSUB_SDKS = {{\n{entries}\n}}\n"
+    )
+
+
+def main():
+    """Main entry point for the script"""
+    parser = argparse.ArgumentParser(description='Generate the sub-SDK map of the Python SDK')
+    parser.add_argument('file', type=Path, help='Path to the OpenAPI YAML file')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--output', type=Path, default=DEFAULT_OUTPUT,
+                       help='Module to write (default: the Python SDK overlay)')
+    group.add_argument('--check', type=Path, metavar='FILE',
+                       help='Exit with status 1 if FILE is out of date instead of writing')
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f"Error: File '{args.file}' not found")
+        sys.exit(1)
+
+    sub_sdks = build_sub_sdks(load_spec(args.file))
+    content = render(sub_sdks)
+    if args.check:
+        current = args.check.read_text() if args.check.exists() else ''
+        if current != content:
+            print(f"{args.check} is out of date; run scripts/sub_sdks.py {args.file}")
+            sys.exit(1)
+        print(f"{args.check} is up to date ({len(sub_sdks)} sub-SDKs)")
+        return
+
+    args.output.write_text(content)
+    print(f"Wrote {len(sub_sdks)} sub-SDKs to {args.output}")
+    for attribute, class_name in sub_sdks.items():
+        print(f"  {attribute}: {class_name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Phase timing and profiling for the SDK sync scripts.
+
+Scripts wrap each phase of their run in `profiler.phase(name)` and report work
+done inside it with `profiler.count(counter, amount)`. When profiling is
+enabled with `profiler.start()`, `profiler.finish()` writes a JSON report
+containing, for every phase, its wall time and counters such as files,
+bytes_copied and subprocesses. A cProfile dump can optionally be written at
+the same time. When profiling is disabled, phases and counters are no-ops.
+
+Example report:
+    {
+      "script": "copy_and_commit_sdk.py",
+      "total_wall_time_s": 1.234,
+      "phases": [
+        {"name": "copy_files", "wall_time_s": 0.9, "files_copied": 120, ...}
+      ],
+      "totals": {"files_copied": 120, "subprocesses": 9, ...}
+    }
+"""
+import sys
+import json
+import time
+import cProfile
+import platform
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+class SyncProfiler:
+    """Collects per-phase wall time and counters for a single script run"""
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path: Optional[str] = None
+        self.cprofile_path: Optional[Path] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._lock = threading.Lock()
+        self._phases: List[Dict] = []
+        self._stack: List[Dict] = []
+        self._started_at: Optional[str] = None
+        self._start_time = 0.0
+
+    def start(self, report_path: Optional[str], cprofile_path: Optional[Path] = None):
+        """
+        Enable profiling for this run.
+
+        Args:
+            report_path: Where to write the JSON report ('-' for stdout), or
+                None to disable the report
+            cprofile_path: Optional path for a cProfile (pstats) dump
+        """
+        self.report_path = report_path
+        self.cprofile_path = cprofile_path
+        self.enabled = bool(report_path or cprofile_path)
+        if not self.enabled:
+            return
+
+        self._started_at = datetime.now(timezone.utc).isoformat()
+        self._start_time = time.perf_counter()
+        if cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of the run; counters reported inside it are attributed to it.
+
+        Entering a phase with the same name again accumulates into the same
+        report entry.
+
+        Args:
+            name: Phase name used in the report
+        """
+        if not self.enabled:
+            yield
+            return
+
+        with self._lock:
+            record = self._record(name)
+            self._stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                record['wall_time_s'] = round(record['wall_time_s'] + time.perf_counter() - start, 6)
+                self._stack.remove(record)
+
+    def count(self, counter: str, amount: int = 1):
+        """
+        Add to a counter of the innermost active phase.
+
+        Safe to call from worker threads started inside the phase.
+
+        Args:
+            counter: Counter name (e.g. files_copied, bytes_copied, subprocesses)
+            amount: Amount to add
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            record = self._stack[-1] if self._stack else self._record('(unattributed)')
+            record[counter] = record.get(counter, 0) + amount
+
+    def _record(self, name: str) -> Dict:
+        """Return the report entry for a phase, creating it on first use"""
+        for record in self._phases:
+            if record['name'] == name:
+                return record
+        record = {'name': name, 'wall_time_s': 0.0}
+        self._phases.append(record)
+        return record
+
+    def report(self) -> Dict:
+        """Build the JSON-serialisable report for the run so far"""
+        totals: Dict[str, int] = {}
+        for record in self._phases:
+            for key, value in record.items():
+                if key not in ('name', 'wall_time_s'):
+                    totals[key] = totals.get(key, 0) + value
+
+        return {
+            'script': Path(sys.argv[0]).name,
+            'argv': sys.argv[1:],
+            'python': platform.python_version(),
+            'started_at': self._started_at,
+            'total_wall_time_s': round(time.perf_counter() - self._start_time, 6),
+            'phases': self._phases,
+            'totals': totals,
+        }
+
+    def finish(self):
+        """Write the JSON report and cProfile dump, if enabled"""
+        if not self.enabled:
+            return
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(str(self.cprofile_path))
+            print(f"cProfile stats written to: {self.cprofile_path}", file=sys.stderr)
+
+        if self.report_path:
+            report = json.dumps(self.report(), indent=2)
+            if self.report_path == '-':
+                print(report)
+            else:
+                Path(self.report_path).parent.mkdir(parents=True, exist_ok=True)
+                with open(self.report_path, 'w', encoding='utf-8') as f:
+                    f.write(report + '\n')
+                print(f"Profile report written to: {self.report_path}", file=sys.stderr)
+
+        self.enabled = False
+
+
+# Shared instance used by the sync scripts
+profiler = SyncProfiler()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for griddy.nfl.
+
+Short-lived jobs pay for every module the SDK imports before their first
+request. Each scenario runs in a fresh interpreter under `python -X
+importtime`, and the cost is the self time of every module imported beyond
+what a bare interpreter (`-c pass`) already loads:
+
+    package      import griddy.nfl
+    client       from griddy.nfl import GriddyNFL
+    one-tag      GriddyNFL(...).teams, i.e. one sub-SDK and its models
+    columnar     import griddy.nfl.columnar
+
+Per scenario the results hold the best import_ms over --repeat runs, the
+number of griddy.nfl modules imported and the slowest of them (cumulative
+time, from the best run). Both import_ms and modules are guarded: with the
+package and its sub-SDKs loaded lazily, `package` should import a handful of
+modules and `one-tag` only the one tag's.
+
+Comparing with a baseline exits with status 1 when a scenario regresses by
+more than --threshold (changes below NOISE_FLOOR are ignored). Save a
+baseline by writing --json from a known-good build; the workflow in
+griddy-sdk-sources compares with sdk-overlays/python/benchmarks/import_baseline.json:
+
+    python benchmarks/import_time.py --json import_baseline.json
+    python benchmarks/import_time.py --baseline import_baseline.json --threshold 0.25
+"""
+import os
+import re
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+SCENARIOS = {
+    'package': 'import griddy.nfl',
+    'client': 'from griddy.nfl import GriddyNFL',
+    'one-tag': "from griddy.nfl import GriddyNFL; GriddyNFL(nfl_auth='benchmark').teams",
+    'columnar': 'import griddy.nfl.columnar',
+}
+
+# Metric -> whether a larger value is better, for baseline comparisons
+COMPARED = {'import_ms': False, 'modules': False}
+
+# Changes smaller than these are treated as noise whatever their relative size
+NOISE_FLOOR = {'import_ms': 5.0, 'modules': 2}
+
+# Keep opt-in layers (and the imports they bring) out of the measurement
+ENV_REMOVED = ('GRIDDY_NFL_COALESCE', 'GRIDDY_NFL_STORE')
+
+PACKAGE = 'griddy.nfl'
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s?(\s*)(\S+)')
+
+
+def import_times(code: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every import of a fresh interpreter running code"""
+    env = {key: value for key, value in os.environ.items() if key not in ENV_REMOVED}
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        lines = [line for line in completed.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(lines[-1] if lines else 'failed')
+    imports = []
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return imports
+
+
+def measure(code: str, startup: Set[str], repeat: int, top: int) -> Dict:
+    best = None
+    for _ in range(repeat):
+        imports = [entry for entry in import_times(code) if entry[0] not in startup]
+        total = sum(self_us for _, self_us, _ in imports)
+        if best is None or total < best[0]:
+            best = (total, imports)
+    total, imports = best
+    own = [entry for entry in imports if entry[0] == PACKAGE or entry[0].startswith(PACKAGE + '.')]
+    slowest = sorted(own, key=lambda entry: entry[2], reverse=True)[:top]
+    return {
+        'import_ms': round(total / 1000, 1),
+        'modules': len(own),
+        'slowest': [[module, round(cumulative / 1000, 1)] for module, _, cumulative in slowest],
+    }
+
+
+def compare(baseline: Dict, results: Dict, threshold: float) -> List[str]:
+    """Describe every metric that moved the wrong way by more than threshold (a fraction)"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or 'error' in previous:
+            continue
+        if 'error' in current:
+            regressions.append(f"{key}: failed ({current['error']})")
+            continue
+        for metric, higher_is_better in COMPARED.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if abs(new - old) < NOISE_FLOOR.get(metric, 0):
+                continue
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{key}: {metric} {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict]):
+    print(f"{'scenario':12} {'import_ms':>10} {'modules':>8}  slowest")
+    for key, row in results.items():
+        if 'error' in row:
+            print(f"{key:12} failed: {row['error']}")
+            continue
+        slowest = ', '.join(f"{module} {ms}" for module, ms in row['slowest'])
+        print(f"{key:12} {row['import_ms']:>10} {row['modules']:>8}  {slowest}")
+
+
+def main():
+    """Main entry point for the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark the import time of griddy.nfl')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f"Comma-separated scenarios ({', '.join(SCENARIOS)})")
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per scenario; the best one is reported')
+    parser.add_argument('--top', type=int, default=3, help='Slowest griddy.nfl modules to list per scenario')
+    parser.add_argument('--json', dest='json_out', type=Path, help='Write the results here as JSON')
+    parser.add_argument('--baseline', type=Path, help='Earlier --json output to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative regression per metric (default 0.25)')
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    startup = {module for module, _, _ in import_times('pass')}
+    results: Dict[str, Dict] = {}
+    for name in scenarios:
+        try:
+            results[name] = measure(SCENARIOS[name], startup, args.repeat, args.top)
+        except RuntimeError as e:
+            results[name] = {'error': str(e)}
+
+    print_table(results)
+    if args.json_out:
+        args.json_out.write_text(json.dumps({
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            },
+            'results': results,
+        }, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text()).get('results', {})
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark full model validation against griddy.nfl.lazy on recorded responses.
+
+For each example response this measures:
+
+    json       json.loads alone (the floor for any decoding)
+    validate   validation of the whole body into the generated models, as the
+               SDK methods do today (needs the generated griddy.nfl.models)
+    lazy       lazy.loads plus reading the handful of fields a score-only
+               consumer needs
+    stream     lazy.iter_array over 64 KB chunks for the response's large array
+
+Before timing anything, the streaming parser is checked against json.loads:
+the streamed responses are fed to lazy.iter_array in chunks of every size
+from 1 to --check-chunks bytes, and a few synthetic float arrays in chunks
+of every size up to their length, so chunk boundaries fall inside numbers at
+every position. The benchmark exits with status 1 if any element differs:
+chunk boundaries from response.iter_bytes() are arbitrary, and counting
+items isn't enough. It also checks (when pydantic is installed) that
+lazy_call views a paginated method's body rather than the page wrapper
+the method returns.
+
+Usage:
+    python benchmarks/lazy_responses.py --responses ../griddy-sdk-sources/scratch/example_responses
+    python benchmarks/lazy_responses.py --responses DIR --json results.json
+"""
+import sys
+import json
+import time
+import typing
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from griddy.nfl import lazy
+
+
+def weekly_scores(games):
+    return [(game.id, game.summary.home_team.score.total, game.summary.away_team.score.total) for game in games]
+
+
+def summary_scores(response):
+    return [(game.game_id, game.home_team.score.total, game.away_team.score.total) for game in response.data]
+
+
+def gamecenter_leaders(response):
+    return response.schedule.game_id, response.leaders
+
+
+def boxscore_totals(response):
+    return response.game_id, response.schedule.score.phase
+
+
+# file -> (model name, is array, fields read by the "lazy" case, streamed array path)
+CASES = {
+    'football_v2_experience_weekly-game-details.json': ('WeeklyGameDetail', True, weekly_scores, ('*', 'replays')),
+    'football_v2_stats_live_game-summaries.json': ('GameStatsResponse', False, summary_scores, ('data',)),
+    'stats_gamecenter.json': ('GamecenterResponse', False, gamecenter_leaders, None),
+    'stats_boxscore.json': ('TeamBoxScore', False, boxscore_totals, None),
+}
+
+
+# Documents whose numbers end up split at every possible position, checked at every chunk size
+SYNTHETIC = [
+    b'[1.5, 2.25, -0.125, 3e2, 4.5E-3, 0.0, 12, -7, 1e-07]',
+    json.dumps([{'homeWinProbability': 0.5 + i / 97, 'awayWinProbability': 0.5 - i / 97, 'play': i}
+                for i in range(8)]).encode(),
+    b'{"a":[],"b":1.5,"c":{"d":[2.5e1,true,null]},"data":[0.75,1.25]}',
+]
+
+
+def select(document: Any, path) -> List[Any]:
+    """The elements lazy.iter_array yields for path, taken from the decoded document"""
+    if not path:
+        return list(document) if isinstance(document, list) else []
+    key, rest = path[0], path[1:]
+    if key == '*':
+        return [value for element in document for value in select(element, rest)] if isinstance(document, list) else []
+    return select(document.get(key), rest) if isinstance(document, dict) else []
+
+
+def check_stream(body: bytes, path, max_chunk: int) -> List[str]:
+    """Compare lazy.iter_array with json.loads at every chunk size up to max_chunk"""
+    expected = select(json.loads(body), path)
+    failures = []
+    for size in range(1, max_chunk + 1):
+        chunks = [body[i:i + size] for i in range(0, len(body), size)]
+        try:
+            items = [getattr(item, 'raw', item) for item in lazy.iter_array(chunks, *path)]
+        except ValueError as e:
+            failures.append(f"chunk size {size}: {e}")
+            continue
+        if items != expected:
+            failures.append(f"chunk size {size}: {len(items)} elements differ from json.loads ({len(expected)})")
+    return failures
+
+
+def check_all(responses: Path, max_chunk: int) -> List[str]:
+    failures = []
+    for index, body in enumerate(SYNTHETIC):
+        for path in ((), ('data',)):
+            failures += [f"synthetic {index} {path}: {failure}" for failure in check_stream(body, path, len(body))]
+    for name, (_, _, _, stream_path) in CASES.items():
+        path = responses / name
+        if stream_path is None or not path.exists():
+            continue
+        failures += [f"{name}: {failure}" for failure in check_stream(path.read_bytes(), stream_path, max_chunk)]
+    return failures
+
+
+def check_pages() -> List[str]:
+    """Check that a paginated method's lazy view is its body, not Speakeasy's page wrapper"""
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        return []
+
+    class Body(BaseModel):
+        passers: List[int]
+
+    class Page(BaseModel):
+        next: Callable[[], Optional[Any]]
+        result: Body
+
+    def method() -> Optional[Page]:
+        raise NotImplementedError
+
+    annotation = lazy._return_annotation(method)
+    if annotation is not Body:
+        return [f"paginated method: lazy_call would use {annotation!r} instead of the page's result type"]
+    if list(lazy.loads(b'{"passers": [1, 2]}', annotation).passers) != [1, 2]:
+        return ["paginated method: the body's fields aren't readable from the view"]
+    return []
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-`repeat` wall time of func, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def load_annotation(model_name: str, is_array: bool) -> Optional[Any]:
+    """The generated model for a case, or None when the SDK models aren't importable"""
+    try:
+        from griddy.nfl import models
+    except ImportError:
+        return None
+    model = getattr(models, model_name, None)
+    if model is None:
+        return None
+    return typing.List[model] if is_array else model
+
+
+def run_case(path: Path, case, repeat: int) -> Dict[str, Any]:
+    model_name, is_array, read_fields, stream_path = case
+    body = path.read_bytes()
+    annotation = load_annotation(model_name, is_array)
+    chunks = [body[i:i + 65536] for i in range(0, len(body), 65536)]
+
+    result: Dict[str, Any] = {'bytes': len(body), 'model': model_name}
+    result['json_ms'] = timed(lambda: json.loads(body), repeat)
+    if annotation is not None:
+        adapter = lazy._adapter(annotation)
+        result['validate_ms'] = timed(lambda: read_fields(adapter.validate_json(body)), repeat)
+    result['lazy_ms'] = timed(lambda: read_fields(lazy.loads(body, annotation)), repeat)
+    if stream_path is not None:
+        result['stream_ms'] = timed(lambda: sum(1 for _ in lazy.iter_array(chunks, *stream_path)), repeat)
+    if 'validate_ms' in result:
+        result['speedup'] = round(result['validate_ms'] / result['lazy_ms'], 1)
+    return result
+
+
+def main():
+    """Main entry point for the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark lazy responses against full validation')
+    parser.add_argument('--responses', type=Path, default=Path('scratch/example_responses'),
+                        help='Directory of example responses (griddy-sdk-sources/scratch/example_responses)')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per measurement (best is reported)')
+    parser.add_argument('--json', dest='json_out', type=Path, help='Also write the results here as JSON')
+    parser.add_argument('--check-chunks', type=int, default=8,
+                        help='Check streaming at every chunk size up to this many bytes (default 8, 0 to skip)')
+    args = parser.parse_args()
+
+    if args.check_chunks:
+        failures = check_all(args.responses, args.check_chunks) + check_pages()
+        if failures:
+            print(f"lazy checks failed in {len(failures)} case(s):")
+            for failure in failures[:20]:
+                print(f"  {failure}")
+            sys.exit(1)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, case in CASES.items():
+        path = args.responses / name
+        if not path.exists():
+            print(f"skipping {name}: not found in {args.responses}", file=sys.stderr)
+            continue
+        results[name] = run_case(path, case, args.repeat)
+
+    columns: List[str] = ['bytes', 'json_ms', 'validate_ms', 'lazy_ms', 'stream_ms', 'speedup']
+    print(f"{'response':52} " + ' '.join(f"{column:>11}" for column in columns))
+    for name, row in results.items():
+        cells = [row.get(column) for column in columns]
+        print(f"{name:52} " + ' '.join(
+            f"{cell:>11.2f}" if isinstance(cell, float) else f"{'-' if cell is None else cell:>11}" for cell in cells
+        ))
+    if not any('validate_ms' in row for row in results.values()):
+        print("\nvalidate_ms needs the generated SDK (griddy.nfl.models) to be importable", file=sys.stderr)
+
+    if args.json_out:
+        args.json_out.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
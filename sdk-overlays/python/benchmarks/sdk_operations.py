@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Throughput, latency, deserialization and memory benchmarks for griddy.nfl.
+
+Representative operations run against a local server (griddy-sdk-sources'
+scripts/mock_server.py, started here with --mock or already running at
+--server), in sync and async mode, at several concurrency levels:
+
+    teams                 getAllTeams, small
+    boxscore              getStatsBoxscore, medium (recorded example)
+    weekly-game-details   getWeeklyGameDetails, ~490 KB (recorded example)
+    playbyplay            getPlayByPlay, large (synthesized)
+    passing-stats         getPlayerPassingStatsBySeason, one 100-row page
+    season-player-stats   getSeasonPlayerStats, one 100-row page
+
+Each (operation, mode, concurrency) runs in its own Python process, so the
+reported peak RSS belongs to that run alone. Per run the results hold
+requests/s, p50/p95/p99 and mean latency, the errors seen, the time to
+validate one response body into the SDK's models (deserialize_ms) and the
+process's peak RSS.
+
+The SDK's own rate limiter, response cache, coalescing and game store are
+switched off for the runs: the numbers describe the client, not those
+layers.
+
+Comparing with a baseline exits with status 1 when any run regresses by more
+than --threshold (requests/s down, or p95 latency, deserialization time or
+peak RSS up; changes below NOISE_FLOOR are ignored). A run that fails
+exits with status 1 as well, with or without a baseline, so a case can't
+drop out of the comparison unnoticed. Save a baseline by writing --json
+from a known-good build:
+
+    python benchmarks/sdk_operations.py --mock ../griddy-sdk-sources/scripts/mock_server.py --json baseline.json
+    python benchmarks/sdk_operations.py --mock ... --baseline baseline.json --threshold 0.25
+"""
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import platform
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+@dataclass(frozen=True)
+class Case:
+    """An SDK method and the arguments it is benchmarked with"""
+
+    operation_id: str
+    resource: str
+    method: str
+    kwargs: Dict[str, Any]
+
+
+CASES = {
+    'teams': Case('getAllTeams', 'teams', 'get_all_teams', {}),
+    'boxscore': Case('getStatsBoxscore', 'stats', 'get_stats_boxscore', {'game_id': 2025100200}),
+    'weekly-game-details': Case('getWeeklyGameDetails', 'football', 'get_weekly_game_details',
+                                {'season': 2025, 'type': 'REG', 'week': 5}),
+    'playbyplay': Case('getPlayByPlay', 'football', 'get_play_by_play',
+                       {'game_id': 'f6cee331-311e-11f0-b670-ae1250fadad1'}),
+    'passing-stats': Case('getPlayerPassingStatsBySeason', 'player_statistics', 'get_player_passing_stats_by_season',
+                          {'season': 2025, 'season_type': 'REG', 'limit': 100}),
+    'season-player-stats': Case('getSeasonPlayerStats', 'football', 'get_season_player_stats',
+                                {'season': 2025, 'season_type': 'REG', 'limit': 100}),
+}
+
+# Metric -> whether a larger value is better, for baseline comparisons
+COMPARED = {'rps': True, 'p95_ms': False, 'deserialize_ms': False, 'peak_rss_mb': False}
+
+# Changes smaller than these are treated as noise whatever their relative size
+NOISE_FLOOR = {'p95_ms': 1.0, 'deserialize_ms': 0.2, 'peak_rss_mb': 2.0}
+
+# Environment for the benchmark processes: measure the client, not the SDK's caching and throttling layers
+WORKER_ENV = {
+    'GRIDDY_NFL_RATE_LIMIT': '0',
+    'GRIDDY_NFL_CACHE_DISABLE': '1',
+}
+WORKER_ENV_REMOVED = ('GRIDDY_NFL_COALESCE', 'GRIDDY_NFL_STORE')
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+# ----------------------------------------------------------------------
+# Worker (one operation, mode and concurrency level per process)
+# ----------------------------------------------------------------------
+
+
+def make_sdk(server: str, connections: int):
+    """A GriddyNFL whose requests all go to the local server"""
+    import httpx
+    from griddy.nfl import GriddyNFL
+
+    target = httpx.URL(server)
+
+    def to_server(request: httpx.Request):
+        # The Host header keeps naming pro.nfl.com / api.nfl.com, which the mock routes on
+        request.url = request.url.copy_with(scheme=target.scheme, host=target.host, port=target.port)
+
+    async def ato_server(request: httpx.Request):
+        to_server(request)
+
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    return GriddyNFL(
+        nfl_auth='benchmark',
+        client=httpx.Client(limits=limits, event_hooks={'request': [to_server]}),
+        async_client=httpx.AsyncClient(limits=limits, event_hooks={'request': [ato_server]}),
+    )
+
+
+def deserialize_ms(sdk, case: Case, repeat: int = 10) -> Tuple[Optional[float], Optional[int]]:
+    """Best time to validate one response body into the method's return type, and the body size"""
+    try:
+        from griddy.nfl import lazy
+    except ImportError:
+        return None, None
+    method = getattr(getattr(sdk, case.resource), case.method)
+    with lazy.lazy_call(method, **case.kwargs) as response:
+        body = response.http_response.read()
+        annotation = response.annotation
+    if annotation is None:
+        return None, len(body)
+    adapter = lazy._adapter(annotation)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        adapter.validate_json(body)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3), len(body)
+
+
+def run_sync(call: Callable[[], Any], requests: int, concurrency: int) -> Tuple[List[float], int, float]:
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    remaining = [requests]
+
+    def worker():
+        nonlocal errors
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            start = time.perf_counter()
+            try:
+                call()
+            except Exception:
+                with lock:
+                    errors += 1
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return latencies, errors, time.perf_counter() - start
+
+
+async def run_async(call: Callable[[], Any], requests: int, concurrency: int) -> Tuple[List[float], int, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def run_worker(case_name: str, mode: str, concurrency: int, server: str, requests: int, warmup: int) -> Dict:
+    case = CASES[case_name]
+    sdk = make_sdk(server, concurrency)
+    resource_ = getattr(sdk, case.resource)
+
+    if mode == 'sync':
+        method = getattr(resource_, case.method)
+        call = lambda: method(**case.kwargs)  # noqa: E731
+        run_sync(call, warmup, concurrency)
+        latencies, errors, wall = run_sync(call, requests, concurrency)
+    else:
+        method = getattr(resource_, case.method + '_async')
+        call = lambda: method(**case.kwargs)  # noqa: E731
+
+        async def measure():
+            await run_async(call, warmup, concurrency)
+            return await run_async(call, requests, concurrency)
+
+        latencies, errors, wall = asyncio.run(measure())
+
+    parse_ms, size = deserialize_ms(sdk, case)
+    latencies.sort()
+    to_ms = 1000
+    return {
+        'operation': case.operation_id,
+        'mode': mode,
+        'concurrency': concurrency,
+        'requests': requests,
+        'errors': errors,
+        'response_bytes': size,
+        'rps': round(len(latencies) / wall, 1) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * to_ms, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * to_ms, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * to_ms, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * to_ms, 3) if latencies else 0.0,
+        'deserialize_ms': parse_ms,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+
+
+def start_mock(script: Path, array_items: int) -> Tuple[subprocess.Popen, str]:
+    """Start scripts/mock_server.py on a free port and return it with its URL"""
+    process = subprocess.Popen(
+        [sys.executable, str(script), '--port', '0', '--array-items', str(array_items)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    line = process.stdout.readline()
+    match = re.search(r'http://[\d.]+:\d+', line)
+    if not match:
+        process.kill()
+        raise RuntimeError(f"mock server did not start: {line.strip() or 'no output'}")
+    return process, match.group(0)
+
+
+def run_one(case: str, mode: str, concurrency: int, args) -> Dict:
+    env = {key: value for key, value in os.environ.items() if key not in WORKER_ENV_REMOVED}
+    env.update(WORKER_ENV)
+    command = [
+        sys.executable, __file__, '--worker', f"{case}:{mode}:{concurrency}", '--server', args.server,
+        '--requests', str(args.requests), '--warmup', str(args.warmup),
+    ]
+    completed = subprocess.run(command, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'failed'}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(baseline: Dict, results: Dict, threshold: float) -> List[str]:
+    """Describe every metric that moved the wrong way by more than threshold (a fraction)"""
+    regressions = []
+    for key, current in results.items():
+        if 'error' in current:
+            regressions.append(f"{key}: failed ({current['error']})")
+            continue
+        previous = baseline.get(key)
+        if not previous or 'error' in previous:
+            continue
+        for metric, higher_is_better in COMPARED.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if abs(new - old) < NOISE_FLOOR.get(metric, 0):
+                continue
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{key}: {metric} {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict]):
+    columns = ['rps', 'p50_ms', 'p95_ms', 'p99_ms', 'deserialize_ms', 'peak_rss_mb', 'errors']
+    print(f"{'run':36} " + ' '.join(f"{column:>14}" for column in columns))
+    for key, row in results.items():
+        if 'error' in row:
+            print(f"{key:36} failed: {row['error']}")
+            continue
+        cells = [row.get(column) for column in columns]
+        print(f"{key:36} " + ' '.join(f"{'-' if cell is None else cell:>14}" for cell in cells))
+
+
+def main():
+    """Main entry point for the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark griddy.nfl operations against a local server')
+    server = parser.add_mutually_exclusive_group()
+    server.add_argument('--server', help='URL of an already running mock server')
+    server.add_argument('--mock', type=Path, help='Path to griddy-sdk-sources/scripts/mock_server.py to start')
+    parser.add_argument('--cases', default=','.join(CASES), help=f"Comma-separated cases ({', '.join(CASES)})")
+    parser.add_argument('--modes', default='sync,async', help='Comma-separated modes (sync, async)')
+    parser.add_argument('--concurrency', default='1,8,32', help='Comma-separated concurrency levels')
+    parser.add_argument('--requests', type=int, default=200, help='Measured requests per run')
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests before each run')
+    parser.add_argument('--array-items', type=int, default=5, help='Array length in synthesized responses')
+    parser.add_argument('--json', dest='json_out', type=Path, help='Write the results here as JSON')
+    parser.add_argument('--baseline', type=Path, help='Earlier --json output to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative regression per metric (default 0.25)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        case, mode, concurrency = args.worker.split(':')
+        print(json.dumps(run_worker(case, mode, int(concurrency), args.server, args.requests, args.warmup)))
+        return
+
+    cases = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+
+    mock = None
+    if args.server is None:
+        if args.mock is None:
+            parser.error('pass --server URL or --mock PATH')
+        mock, args.server = start_mock(args.mock, args.array_items)
+    try:
+        results: Dict[str, Dict] = {}
+        for case in cases:
+            for mode in modes:
+                for concurrency in levels:
+                    key = f"{case}/{mode}/c{concurrency}"
+                    results[key] = run_one(case, mode, concurrency, args)
+                    print(f"  {key}: {results[key].get('rps', results[key].get('error'))}", file=sys.stderr)
+    finally:
+        if mock is not None:
+            mock.terminate()
+            mock.wait()
+
+    print_table(results)
+    if args.json_out:
+        args.json_out.write_text(json.dumps({
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'requests': args.requests,
+                'array_items': args.array_items,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            },
+            'results': results,
+        }, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text()).get('results', {})
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    elif any('error' in row for row in results.values()):
+        print(f"\n{sum('error' in row for row in results.values())} run(s) failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+griddy.nfl: Python SDK for the NFL.com APIs.
+
+Hand-owned (the generator output is not copied over it). Nothing beyond the
+version metadata is imported with the package: GriddyNFL, SDKConfiguration,
+submodules such as `models` and, for backwards compatibility, every model
+name (`from griddy.nfl import TeamBoxScore`) are resolved by the module-level
+__getattr__ on first use. `import griddy.nfl.columnar` and the like therefore
+no longer pull in the whole SDK.
+"""
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ._version import (
+    __gen_version__,
+    __openapi_doc_version__,
+    __title__,
+    __user_agent__,
+    __version__,
+)
+
+VERSION: str = __version__
+OPENAPI_DOC_VERSION = __openapi_doc_version__
+SPEAKEASY_GENERATOR_VERSION = __gen_version__
+USER_AGENT = __user_agent__
+
+if TYPE_CHECKING:
+    from . import models
+    from ._hooks.transport import SharedTransport, TransportConfig
+    from .sdk import GriddyNFL
+    from .sdkconfiguration import SDKConfiguration
+
+# Top-level name -> module defining it
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'GriddyNFL': '.sdk',
+    'SDKConfiguration': '.sdkconfiguration',
+    'SharedTransport': '._hooks.transport',
+    'TransportConfig': '._hooks.transport',
+}
+
+__all__ = [
+    'GriddyNFL',
+    'SDKConfiguration',
+    'SharedTransport',
+    'TransportConfig',
+    'VERSION',
+    'OPENAPI_DOC_VERSION',
+    'SPEAKEASY_GENERATOR_VERSION',
+    'USER_AGENT',
+    'models',
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif not name.startswith('__') and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # A submodule (`griddy.nfl.models`, `from griddy.nfl import teams`)
+        value = importlib.import_module(f".{name}", __name__)
+    elif name[:1].isupper():
+        # Model names used to be re-exported here; models resolves them one module at a time
+        models = importlib.import_module('.models', __name__)
+        try:
+            value = getattr(models, name)
+        except AttributeError:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,738 @@
+"""
+Column layouts of the paginated stats operations, for griddy.nfl.columnar.
+
+Generated from openapi/nfl-com-api.yaml by scripts/columnar_schemas.py in
+griddy-sdk-sources; do not edit by hand.
+
+Each entry maps an operationId to:
+
+    results   the response field holding the rows
+    total     key path of the total row count, when the response has one
+    columns   (name, key path, type), type one of int64, float64, bool, string
+    maps      key paths of free-form objects whose keys become columns
+"""
+
+COLUMNAR_SCHEMAS = {'getDefensiveOverviewStatsBySeason': {'results': 'defenders',
+                                       'total': ('total',),
+                                       'columns': [('displayName', ('displayName',), 'string'),
+                                                   ('gameSnap', ('gameSnap',), 'int64'),
+                                                   ('gp', ('gp',), 'int64'),
+                                                   ('gs', ('gs',), 'int64'),
+                                                   ('hStop', ('hStop',), 'int64'),
+                                                   ('headshot', ('headshot',), 'string'),
+                                                   ('int', ('int',), 'int64'),
+                                                   ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                                   ('nflId', ('nflId',), 'string'),
+                                                   ('ngsPosition', ('ngsPosition',), 'string'),
+                                                   ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                                   ('passRatingNd', ('passRatingNd',), 'float64'),
+                                                   ('position', ('position',), 'string'),
+                                                   ('positionGroup', ('positionGroup',), 'string'),
+                                                   ('pr', ('pr',), 'int64'),
+                                                   ('qbp', ('qbp',), 'int64'),
+                                                   ('qbpR', ('qbpR',), 'float64'),
+                                                   ('qd', ('qd',), 'bool'),
+                                                   ('rd', ('rd',), 'int64'),
+                                                   ('recNd', ('recNd',), 'int64'),
+                                                   ('recTdNd', ('recTdNd',), 'int64'),
+                                                   ('recYdsNd', ('recYdsNd',), 'int64'),
+                                                   ('sack', ('sack',), 'int64'),
+                                                   ('shortName', ('shortName',), 'string'),
+                                                   ('snap', ('snap',), 'int64'),
+                                                   ('snapPct', ('snapPct',), 'float64'),
+                                                   ('tStop', ('tStop',), 'int64'),
+                                                   ('tck', ('tck',), 'int64'),
+                                                   ('teamId', ('teamId',), 'string'),
+                                                   ('teamSnap', ('teamSnap',), 'int64'),
+                                                   ('tg', ('tg',), 'int64'),
+                                                   ('tgtNd', ('tgtNd',), 'int64'),
+                                                   ('totalTg', ('totalTg',), 'int64')],
+                                       'maps': []},
+ 'getDefensivePassRushStatsBySeason': {'results': 'defenders',
+                                       'total': ('total',),
+                                       'columns': [('displayName', ('displayName',), 'string'),
+                                                   ('gameSnap', ('gameSnap',), 'int64'),
+                                                   ('gp', ('gp',), 'int64'),
+                                                   ('gs', ('gs',), 'int64'),
+                                                   ('headshot', ('headshot',), 'string'),
+                                                   ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                                   ('nflId', ('nflId',), 'string'),
+                                                   ('ngsPosition', ('ngsPosition',), 'string'),
+                                                   ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                                   ('position', ('position',), 'string'),
+                                                   ('positionGroup', ('positionGroup',), 'string'),
+                                                   ('pr', ('pr',), 'int64'),
+                                                   ('prGo', ('prGo',), 'float64'),
+                                                   ('prR', ('prR',), 'float64'),
+                                                   ('qbp', ('qbp',), 'int64'),
+                                                   ('qbpR', ('qbpR',), 'float64'),
+                                                   ('qd', ('qd',), 'bool'),
+                                                   ('qp', ('qp',), 'int64'),
+                                                   ('sack', ('sack',), 'float64'),
+                                                   ('sackR', ('sackR',), 'float64'),
+                                                   ('shortName', ('shortName',), 'string'),
+                                                   ('teamId', ('teamId',), 'string'),
+                                                   ('teamSnap', ('teamSnap',), 'int64'),
+                                                   ('tg', ('tg',), 'int64'),
+                                                   ('totalTg', ('totalTg',), 'int64'),
+                                                   ('ttp', ('ttp',), 'float64'),
+                                                   ('tts', ('tts',), 'float64'),
+                                                   ('turnQbp', ('turnQbp',), 'int64')],
+                                       'maps': []},
+ 'getDefensiveStatsBySeason': {'results': 'defenders',
+                               'total': ('total',),
+                               'columns': [('bhPct', ('bhPct',), 'float64'),
+                                           ('catchNd', ('catchNd',), 'float64'),
+                                           ('cov', ('cov',), 'int64'),
+                                           ('covNd', ('covNd',), 'int64'),
+                                           ('croeNd', ('croeNd',), 'float64'),
+                                           ('displayName', ('displayName',), 'string'),
+                                           ('gameSnap', ('gameSnap',), 'int64'),
+                                           ('gp', ('gp',), 'int64'),
+                                           ('gs', ('gs',), 'int64'),
+                                           ('headshot', ('headshot',), 'string'),
+                                           ('int', ('int',), 'int64'),
+                                           ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                           ('nflId', ('nflId',), 'string'),
+                                           ('ngsPosition', ('ngsPosition',), 'string'),
+                                           ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                           ('passRatingNd', ('passRatingNd',), 'float64'),
+                                           ('position', ('position',), 'string'),
+                                           ('positionGroup', ('positionGroup',), 'string'),
+                                           ('qd', ('qd',), 'bool'),
+                                           ('recNd', ('recNd',), 'int64'),
+                                           ('recTdNd', ('recTdNd',), 'int64'),
+                                           ('recYdsNd', ('recYdsNd',), 'int64'),
+                                           ('sep', ('sep',), 'float64'),
+                                           ('shortName', ('shortName',), 'string'),
+                                           ('teamId', ('teamId',), 'string'),
+                                           ('teamSnap', ('teamSnap',), 'int64'),
+                                           ('tg', ('tg',), 'int64'),
+                                           ('tgtEpaNd', ('tgtEpaNd',), 'float64'),
+                                           ('tgtNd', ('tgtNd',), 'int64'),
+                                           ('tgtRNd', ('tgtRNd',), 'float64'),
+                                           ('totalTg', ('totalTg',), 'int64'),
+                                           ('twfPct', ('twfPct',), 'float64'),
+                                           ('yacprNd', ('yacprNd',), 'float64')],
+                               'maps': []},
+ 'getFantasyStatsBySeason': {'results': 'players',
+                             'total': ('total',),
+                             'columns': [('displayName', ('displayName',), 'string'),
+                                         ('fpHalfPpr', ('fpHalfPpr',), 'float64'),
+                                         ('fpPpr', ('fpPpr',), 'float64'),
+                                         ('fpPprPG', ('fpPprPG',), 'float64'),
+                                         ('fpStd', ('fpStd',), 'float64'),
+                                         ('fpStdPG', ('fpStdPG',), 'float64'),
+                                         ('gp', ('gp',), 'int64'),
+                                         ('gs', ('gs',), 'int64'),
+                                         ('headshot', ('headshot',), 'string'),
+                                         ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                         ('nflId', ('nflId',), 'string'),
+                                         ('passInt', ('passInt',), 'int64'),
+                                         ('passTd', ('passTd',), 'int64'),
+                                         ('passYds', ('passYds',), 'int64'),
+                                         ('passYdsPG', ('passYdsPG',), 'float64'),
+                                         ('position', ('position',), 'string'),
+                                         ('positionGroup', ('positionGroup',), 'string'),
+                                         ('rec', ('rec',), 'int64'),
+                                         ('recPG', ('recPG',), 'float64'),
+                                         ('recTd', ('recTd',), 'int64'),
+                                         ('recYds', ('recYds',), 'int64'),
+                                         ('redZoneTargets', ('redZoneTargets',), 'int64'),
+                                         ('rushTd', ('rushTd',), 'int64'),
+                                         ('rushYds', ('rushYds',), 'int64'),
+                                         ('rushYdsPG', ('rushYdsPG',), 'float64'),
+                                         ('shortName', ('shortName',), 'string'),
+                                         ('snapPct', ('snapPct',), 'float64'),
+                                         ('targetShare', ('targetShare',), 'float64'),
+                                         ('teamId', ('teamId',), 'string'),
+                                         ('tgt', ('tgt',), 'int64')],
+                             'maps': []},
+ 'getPlayerPassingStatsBySeason': {'results': 'passers',
+                                   'total': ('total',),
+                                   'columns': [('att', ('att',), 'int64'),
+                                               ('attPG', ('attPG',), 'float64'),
+                                               ('avgSep', ('avgSep',), 'float64'),
+                                               ('avgTTP', ('avgTTP',), 'float64'),
+                                               ('avgTTS', ('avgTTS',), 'float64'),
+                                               ('avgTTT', ('avgTTT',), 'float64'),
+                                               ('ay', ('ay',), 'float64'),
+                                               ('ayAtt', ('ayAtt',), 'float64'),
+                                               ('blitzR', ('blitzR',), 'float64'),
+                                               ('cmp', ('cmp',), 'int64'),
+                                               ('cmpPG', ('cmpPG',), 'float64'),
+                                               ('cmpPct', ('cmpPct',), 'float64'),
+                                               ('cpoe', ('cpoe',), 'float64'),
+                                               ('db', ('db',), 'int64'),
+                                               ('dbPG', ('dbPG',), 'float64'),
+                                               ('deepAttPct', ('deepAttPct',), 'float64'),
+                                               ('displayName', ('displayName',), 'string'),
+                                               ('drop', ('drop',), 'int64'),
+                                               ('dropPG', ('dropPG',), 'float64'),
+                                               ('dropR', ('dropR',), 'float64'),
+                                               ('epa', ('epa',), 'float64'),
+                                               ('epaDb', ('epaDb',), 'float64'),
+                                               ('epaPG', ('epaPG',), 'float64'),
+                                               ('gp', ('gp',), 'int64'),
+                                               ('gs', ('gs',), 'int64'),
+                                               ('headshot', ('headshot',), 'string'),
+                                               ('int', ('int',), 'int64'),
+                                               ('intPG', ('intPG',), 'float64'),
+                                               ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                               ('nflId', ('nflId',), 'string'),
+                                               ('ngsPosition', ('ngsPosition',), 'string'),
+                                               ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                               ('paDbPct', ('paDbPct',), 'float64'),
+                                               ('position', ('position',), 'string'),
+                                               ('positionGroup', ('positionGroup',), 'string'),
+                                               ('qbp', ('qbp',), 'int64'),
+                                               ('qbpPG', ('qbpPG',), 'float64'),
+                                               ('qbpR', ('qbpR',), 'float64'),
+                                               ('qp', ('qp',), 'bool'),
+                                               ('rating', ('rating',), 'float64'),
+                                               ('sack', ('sack',), 'int64'),
+                                               ('sackPG', ('sackPG',), 'float64'),
+                                               ('shortName', ('shortName',), 'string'),
+                                               ('td', ('td',), 'int64'),
+                                               ('tdPG', ('tdPG',), 'float64'),
+                                               ('teamId', ('teamId',), 'string'),
+                                               ('tg', ('tg',), 'int64'),
+                                               ('totalTg', ('totalTg',), 'int64'),
+                                               ('twAttPG', ('twAttPG',), 'float64'),
+                                               ('twAttPct', ('twAttPct',), 'float64'),
+                                               ('xCmp', ('xCmp',), 'float64'),
+                                               ('xYac', ('xYac',), 'float64'),
+                                               ('yac', ('yac',), 'float64'),
+                                               ('yacPct', ('yacPct',), 'float64'),
+                                               ('yds', ('yds',), 'int64'),
+                                               ('ydsPG', ('ydsPG',), 'float64'),
+                                               ('ypa', ('ypa',), 'float64')],
+                                   'maps': []},
+ 'getPlayerPassingStatsByWeek': {'results': 'passers',
+                                 'total': ('total',),
+                                 'columns': [('att', ('att',), 'int64'),
+                                             ('attPG', ('attPG',), 'float64'),
+                                             ('avgSep', ('avgSep',), 'float64'),
+                                             ('avgTTP', ('avgTTP',), 'float64'),
+                                             ('avgTTS', ('avgTTS',), 'float64'),
+                                             ('avgTTT', ('avgTTT',), 'float64'),
+                                             ('ay', ('ay',), 'float64'),
+                                             ('ayAtt', ('ayAtt',), 'float64'),
+                                             ('blitzR', ('blitzR',), 'float64'),
+                                             ('cmp', ('cmp',), 'int64'),
+                                             ('cmpPG', ('cmpPG',), 'float64'),
+                                             ('cmpPct', ('cmpPct',), 'float64'),
+                                             ('cpoe', ('cpoe',), 'float64'),
+                                             ('db', ('db',), 'int64'),
+                                             ('dbPG', ('dbPG',), 'float64'),
+                                             ('deepAttPct', ('deepAttPct',), 'float64'),
+                                             ('displayName', ('displayName',), 'string'),
+                                             ('drop', ('drop',), 'int64'),
+                                             ('dropPG', ('dropPG',), 'float64'),
+                                             ('dropR', ('dropR',), 'float64'),
+                                             ('epa', ('epa',), 'float64'),
+                                             ('epaDb', ('epaDb',), 'float64'),
+                                             ('epaPG', ('epaPG',), 'float64'),
+                                             ('gp', ('gp',), 'int64'),
+                                             ('gs', ('gs',), 'int64'),
+                                             ('headshot', ('headshot',), 'string'),
+                                             ('int', ('int',), 'int64'),
+                                             ('intPG', ('intPG',), 'float64'),
+                                             ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                             ('nflId', ('nflId',), 'string'),
+                                             ('ngsPosition', ('ngsPosition',), 'string'),
+                                             ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                             ('paDbPct', ('paDbPct',), 'float64'),
+                                             ('position', ('position',), 'string'),
+                                             ('positionGroup', ('positionGroup',), 'string'),
+                                             ('qbp', ('qbp',), 'int64'),
+                                             ('qbpPG', ('qbpPG',), 'float64'),
+                                             ('qbpR', ('qbpR',), 'float64'),
+                                             ('qp', ('qp',), 'bool'),
+                                             ('rating', ('rating',), 'float64'),
+                                             ('sack', ('sack',), 'int64'),
+                                             ('sackPG', ('sackPG',), 'float64'),
+                                             ('shortName', ('shortName',), 'string'),
+                                             ('td', ('td',), 'int64'),
+                                             ('tdPG', ('tdPG',), 'float64'),
+                                             ('teamId', ('teamId',), 'string'),
+                                             ('tg', ('tg',), 'int64'),
+                                             ('totalTg', ('totalTg',), 'int64'),
+                                             ('twAttPG', ('twAttPG',), 'float64'),
+                                             ('twAttPct', ('twAttPct',), 'float64'),
+                                             ('xCmp', ('xCmp',), 'float64'),
+                                             ('xYac', ('xYac',), 'float64'),
+                                             ('yac', ('yac',), 'float64'),
+                                             ('yacPct', ('yacPct',), 'float64'),
+                                             ('yds', ('yds',), 'int64'),
+                                             ('ydsPG', ('ydsPG',), 'float64'),
+                                             ('ypa', ('ypa',), 'float64'),
+                                             ('fapiGameId', ('fapiGameId',), 'string'),
+                                             ('finalScore', ('finalScore',), 'string'),
+                                             ('gameId', ('gameId',), 'int64'),
+                                             ('gameResult', ('gameResult',), 'string'),
+                                             ('isHome', ('isHome',), 'bool'),
+                                             ('opponentTeamId', ('opponentTeamId',), 'string'),
+                                             ('weekSlug', ('weekSlug',), 'string')],
+                                 'maps': []},
+ 'getPlayerReceivingStatsBySeason': {'results': 'receivers',
+                                     'total': ('total',),
+                                     'columns': [('avgRtDep', ('avgRtDep',), 'float64'),
+                                                 ('avgSep', ('avgSep',), 'float64'),
+                                                 ('ay', ('ay',), 'float64'),
+                                                 ('ayPG', ('ayPG',), 'float64'),
+                                                 ('ayTgt', ('ayTgt',), 'float64'),
+                                                 ('catch', ('catch',), 'float64'),
+                                                 ('croe', ('croe',), 'float64'),
+                                                 ('deepTgtPct', ('deepTgtPct',), 'float64'),
+                                                 ('displayName', ('displayName',), 'string'),
+                                                 ('drop', ('drop',), 'int64'),
+                                                 ('dropPG', ('dropPG',), 'float64'),
+                                                 ('dropTgt', ('dropTgt',), 'float64'),
+                                                 ('epa', ('epa',), 'float64'),
+                                                 ('epaPG', ('epaPG',), 'float64'),
+                                                 ('epaRt', ('epaRt',), 'float64'),
+                                                 ('epaTgt', ('epaTgt',), 'float64'),
+                                                 ('ezRec', ('ezRec',), 'int64'),
+                                                 ('ezRecPG', ('ezRecPG',), 'float64'),
+                                                 ('ezTgt', ('ezTgt',), 'int64'),
+                                                 ('ezTgtPG', ('ezTgtPG',), 'float64'),
+                                                 ('fapiGameId', ('fapiGameId',), 'string'),
+                                                 ('finalScore', ('finalScore',), 'string'),
+                                                 ('gameId', ('gameId',), 'int64'),
+                                                 ('gameResult', ('gameResult',), 'string'),
+                                                 ('gp', ('gp',), 'int64'),
+                                                 ('gs', ('gs',), 'int64'),
+                                                 ('headshot', ('headshot',), 'string'),
+                                                 ('int', ('int',), 'int64'),
+                                                 ('intPG', ('intPG',), 'float64'),
+                                                 ('isHome', ('isHome',), 'bool'),
+                                                 ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                                 ('nflId', ('nflId',), 'string'),
+                                                 ('ngsPosition', ('ngsPosition',), 'string'),
+                                                 ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                                 ('opponentTeamId', ('opponentTeamId',), 'string'),
+                                                 ('position', ('position',), 'string'),
+                                                 ('positionGroup', ('positionGroup',), 'string'),
+                                                 ('qr', ('qr',), 'bool'),
+                                                 ('rating', ('rating',), 'float64'),
+                                                 ('rec', ('rec',), 'int64'),
+                                                 ('recPG', ('recPG',), 'float64'),
+                                                 ('rt', ('rt',), 'int64'),
+                                                 ('rtPG', ('rtPG',), 'float64'),
+                                                 ('shortName', ('shortName',), 'string'),
+                                                 ('td', ('td',), 'int64'),
+                                                 ('tdPG', ('tdPG',), 'float64'),
+                                                 ('teamId', ('teamId',), 'string'),
+                                                 ('tg', ('tg',), 'int64'),
+                                                 ('tgt', ('tgt',), 'int64'),
+                                                 ('tgtPG', ('tgtPG',), 'float64'),
+                                                 ('tgtRt', ('tgtRt',), 'float64'),
+                                                 ('totalTg', ('totalTg',), 'int64'),
+                                                 ('twPct', ('twPct',), 'float64'),
+                                                 ('weekSlug', ('weekSlug',), 'string'),
+                                                 ('xCatch', ('xCatch',), 'float64'),
+                                                 ('xYac', ('xYac',), 'float64'),
+                                                 ('xYacPG', ('xYacPG',), 'float64'),
+                                                 ('yac', ('yac',), 'float64'),
+                                                 ('yacPG', ('yacPG',), 'float64'),
+                                                 ('yacRec', ('yacRec',), 'float64'),
+                                                 ('yacoe', ('yacoe',), 'float64'),
+                                                 ('yacoePG', ('yacoePG',), 'float64'),
+                                                 ('yds', ('yds',), 'int64'),
+                                                 ('ydsPG', ('ydsPG',), 'float64'),
+                                                 ('ydsRec', ('ydsRec',), 'float64'),
+                                                 ('ydsRt', ('ydsRt',), 'float64')],
+                                     'maps': []},
+ 'getPlayerReceivingStatsByWeek': {'results': 'receivers',
+                                   'total': ('total',),
+                                   'columns': [('avgRtDep', ('avgRtDep',), 'float64'),
+                                               ('avgSep', ('avgSep',), 'float64'),
+                                               ('ay', ('ay',), 'float64'),
+                                               ('ayPG', ('ayPG',), 'float64'),
+                                               ('ayTgt', ('ayTgt',), 'float64'),
+                                               ('catch', ('catch',), 'float64'),
+                                               ('croe', ('croe',), 'float64'),
+                                               ('deepTgtPct', ('deepTgtPct',), 'float64'),
+                                               ('displayName', ('displayName',), 'string'),
+                                               ('drop', ('drop',), 'int64'),
+                                               ('dropPG', ('dropPG',), 'float64'),
+                                               ('dropTgt', ('dropTgt',), 'float64'),
+                                               ('epa', ('epa',), 'float64'),
+                                               ('epaPG', ('epaPG',), 'float64'),
+                                               ('epaRt', ('epaRt',), 'float64'),
+                                               ('epaTgt', ('epaTgt',), 'float64'),
+                                               ('ezRec', ('ezRec',), 'int64'),
+                                               ('ezRecPG', ('ezRecPG',), 'float64'),
+                                               ('ezTgt', ('ezTgt',), 'int64'),
+                                               ('ezTgtPG', ('ezTgtPG',), 'float64'),
+                                               ('fapiGameId', ('fapiGameId',), 'string'),
+                                               ('finalScore', ('finalScore',), 'string'),
+                                               ('gameId', ('gameId',), 'int64'),
+                                               ('gameResult', ('gameResult',), 'string'),
+                                               ('gp', ('gp',), 'int64'),
+                                               ('gs', ('gs',), 'int64'),
+                                               ('headshot', ('headshot',), 'string'),
+                                               ('int', ('int',), 'int64'),
+                                               ('intPG', ('intPG',), 'float64'),
+                                               ('isHome', ('isHome',), 'bool'),
+                                               ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                               ('nflId', ('nflId',), 'string'),
+                                               ('ngsPosition', ('ngsPosition',), 'string'),
+                                               ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                               ('opponentTeamId', ('opponentTeamId',), 'string'),
+                                               ('position', ('position',), 'string'),
+                                               ('positionGroup', ('positionGroup',), 'string'),
+                                               ('qr', ('qr',), 'bool'),
+                                               ('rating', ('rating',), 'float64'),
+                                               ('rec', ('rec',), 'int64'),
+                                               ('recPG', ('recPG',), 'float64'),
+                                               ('rt', ('rt',), 'int64'),
+                                               ('rtPG', ('rtPG',), 'float64'),
+                                               ('shortName', ('shortName',), 'string'),
+                                               ('td', ('td',), 'int64'),
+                                               ('tdPG', ('tdPG',), 'float64'),
+                                               ('teamId', ('teamId',), 'string'),
+                                               ('tg', ('tg',), 'int64'),
+                                               ('tgt', ('tgt',), 'int64'),
+                                               ('tgtPG', ('tgtPG',), 'float64'),
+                                               ('tgtRt', ('tgtRt',), 'float64'),
+                                               ('totalTg', ('totalTg',), 'int64'),
+                                               ('twPct', ('twPct',), 'float64'),
+                                               ('weekSlug', ('weekSlug',), 'string'),
+                                               ('xCatch', ('xCatch',), 'float64'),
+                                               ('xYac', ('xYac',), 'float64'),
+                                               ('xYacPG', ('xYacPG',), 'float64'),
+                                               ('yac', ('yac',), 'float64'),
+                                               ('yacPG', ('yacPG',), 'float64'),
+                                               ('yacRec', ('yacRec',), 'float64'),
+                                               ('yacoe', ('yacoe',), 'float64'),
+                                               ('yacoePG', ('yacoePG',), 'float64'),
+                                               ('yds', ('yds',), 'int64'),
+                                               ('ydsPG', ('ydsPG',), 'float64'),
+                                               ('ydsRec', ('ydsRec',), 'float64'),
+                                               ('ydsRt', ('ydsRt',), 'float64')],
+                                   'maps': []},
+ 'getPlayerRushingStatsBySeason': {'results': 'rushers',
+                                   'total': ('total',),
+                                   'columns': [('att', ('att',), 'int64'),
+                                               ('attPG', ('attPG',), 'float64'),
+                                               ('displayName', ('displayName',), 'string'),
+                                               ('eff', ('eff',), 'float64'),
+                                               ('epa', ('epa',), 'float64'),
+                                               ('epaAtt', ('epaAtt',), 'float64'),
+                                               ('epaPG', ('epaPG',), 'float64'),
+                                               ('fum', ('fum',), 'int64'),
+                                               ('fumPG', ('fumPG',), 'float64'),
+                                               ('gp', ('gp',), 'int64'),
+                                               ('gs', ('gs',), 'int64'),
+                                               ('headshot', ('headshot',), 'string'),
+                                               ('inTPct', ('inTPct',), 'float64'),
+                                               ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                               ('lost', ('lost',), 'int64'),
+                                               ('lostPG', ('lostPG',), 'float64'),
+                                               ('nflId', ('nflId',), 'string'),
+                                               ('ngsPosition', ('ngsPosition',), 'string'),
+                                               ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                               ('position', ('position',), 'string'),
+                                               ('positionGroup', ('positionGroup',), 'string'),
+                                               ('qr', ('qr',), 'bool'),
+                                               ('rush10PYds', ('rush10PYds',), 'int64'),
+                                               ('rush10PYdsPG', ('rush10PYdsPG',), 'float64'),
+                                               ('rush15PMph', ('rush15PMph',), 'int64'),
+                                               ('rush15PMphPG', ('rush15PMphPG',), 'float64'),
+                                               ('rush20PMph', ('rush20PMph',), 'int64'),
+                                               ('rush20PMphPG', ('rush20PMphPG',), 'float64'),
+                                               ('ryoe', ('ryoe',), 'float64'),
+                                               ('ryoeAtt', ('ryoeAtt',), 'float64'),
+                                               ('ryoePG', ('ryoePG',), 'float64'),
+                                               ('shortName', ('shortName',), 'string'),
+                                               ('stBoxPct', ('stBoxPct',), 'float64'),
+                                               ('success', ('success',), 'float64'),
+                                               ('td', ('td',), 'int64'),
+                                               ('tdPG', ('tdPG',), 'float64'),
+                                               ('teamId', ('teamId',), 'string'),
+                                               ('tg', ('tg',), 'int64'),
+                                               ('totalTg', ('totalTg',), 'int64'),
+                                               ('underPct', ('underPct',), 'float64'),
+                                               ('xRy', ('xRy',), 'float64'),
+                                               ('xRyPG', ('xRyPG',), 'float64'),
+                                               ('xYpc', ('xYpc',), 'float64'),
+                                               ('yaco', ('yaco',), 'float64'),
+                                               ('yacoAtt', ('yacoAtt',), 'float64'),
+                                               ('yacoPG', ('yacoPG',), 'float64'),
+                                               ('ybco', ('ybco',), 'float64'),
+                                               ('ybcoPG', ('ybcoPG',), 'float64'),
+                                               ('yds', ('yds',), 'int64'),
+                                               ('ydsPG', ('ydsPG',), 'float64'),
+                                               ('ypc', ('ypc',), 'float64')],
+                                   'maps': []},
+ 'getPlayerRushingStatsByWeek': {'results': 'rushers',
+                                 'total': ('total',),
+                                 'columns': [('att', ('att',), 'int64'),
+                                             ('attPG', ('attPG',), 'float64'),
+                                             ('displayName', ('displayName',), 'string'),
+                                             ('eff', ('eff',), 'float64'),
+                                             ('epa', ('epa',), 'float64'),
+                                             ('epaAtt', ('epaAtt',), 'float64'),
+                                             ('epaPG', ('epaPG',), 'float64'),
+                                             ('fapiGameId', ('fapiGameId',), 'string'),
+                                             ('finalScore', ('finalScore',), 'string'),
+                                             ('fum', ('fum',), 'int64'),
+                                             ('fumPG', ('fumPG',), 'float64'),
+                                             ('gameId', ('gameId',), 'int64'),
+                                             ('gameResult', ('gameResult',), 'string'),
+                                             ('gp', ('gp',), 'int64'),
+                                             ('gs', ('gs',), 'int64'),
+                                             ('headshot', ('headshot',), 'string'),
+                                             ('inTPct', ('inTPct',), 'float64'),
+                                             ('isHome', ('isHome',), 'bool'),
+                                             ('jerseyNumber', ('jerseyNumber',), 'int64'),
+                                             ('lost', ('lost',), 'int64'),
+                                             ('lostPG', ('lostPG',), 'float64'),
+                                             ('nflId', ('nflId',), 'string'),
+                                             ('ngsPosition', ('ngsPosition',), 'string'),
+                                             ('ngsPositionGroup', ('ngsPositionGroup',), 'string'),
+                                             ('opponentTeamId', ('opponentTeamId',), 'string'),
+                                             ('position', ('position',), 'string'),
+                                             ('positionGroup', ('positionGroup',), 'string'),
+                                             ('qr', ('qr',), 'bool'),
+                                             ('rush10PYds', ('rush10PYds',), 'int64'),
+                                             ('rush10PYdsPG', ('rush10PYdsPG',), 'float64'),
+                                             ('rush15PMph', ('rush15PMph',), 'int64'),
+                                             ('rush15PMphPG', ('rush15PMphPG',), 'float64'),
+                                             ('rush20PMph', ('rush20PMph',), 'int64'),
+                                             ('rush20PMphPG', ('rush20PMphPG',), 'float64'),
+                                             ('ryoe', ('ryoe',), 'float64'),
+                                             ('ryoeAtt', ('ryoeAtt',), 'float64'),
+                                             ('ryoePG', ('ryoePG',), 'float64'),
+                                             ('shortName', ('shortName',), 'string'),
+                                             ('stBoxPct', ('stBoxPct',), 'float64'),
+                                             ('success', ('success',), 'float64'),
+                                             ('td', ('td',), 'int64'),
+                                             ('tdPG', ('tdPG',), 'float64'),
+                                             ('teamId', ('teamId',), 'string'),
+                                             ('tg', ('tg',), 'int64'),
+                                             ('totalTg', ('totalTg',), 'int64'),
+                                             ('underPct', ('underPct',), 'float64'),
+                                             ('weekSlug', ('weekSlug',), 'string'),
+                                             ('xRy', ('xRy',), 'float64'),
+                                             ('xRyPG', ('xRyPG',), 'float64'),
+                                             ('xYpc', ('xYpc',), 'float64'),
+                                             ('yaco', ('yaco',), 'float64'),
+                                             ('yacoAtt', ('yacoAtt',), 'float64'),
+                                             ('yacoPG', ('yacoPG',), 'float64'),
+                                             ('ybco', ('ybco',), 'float64'),
+                                             ('ybcoPG', ('ybcoPG',), 'float64'),
+                                             ('yds', ('yds',), 'int64'),
+                                             ('ydsPG', ('ydsPG',), 'float64'),
+                                             ('ypc', ('ypc',), 'float64')],
+                                 'maps': []},
+ 'getSeasonPlayerStats': {'results': 'players',
+                          'total': ('pagination', 'total'),
+                          'columns': [('player.birthDate', ('player', 'birthDate'), 'string'),
+                                      ('player.collegeConference', ('player', 'collegeConference'), 'string'),
+                                      ('player.collegeName', ('player', 'collegeName'), 'string'),
+                                      ('player.currentTeamId', ('player', 'currentTeamId'), 'string'),
+                                      ('player.displayName', ('player', 'displayName'), 'string'),
+                                      ('player.draftClub', ('player', 'draftClub'), 'string'),
+                                      ('player.draftNumber', ('player', 'draftNumber'), 'int64'),
+                                      ('player.draftround', ('player', 'draftround'), 'int64'),
+                                      ('player.entryYear', ('player', 'entryYear'), 'int64'),
+                                      ('player.esbId', ('player', 'esbId'), 'string'),
+                                      ('player.firstName', ('player', 'firstName'), 'string'),
+                                      ('player.footballName', ('player', 'footballName'), 'string'),
+                                      ('player.gsisId', ('player', 'gsisId'), 'string'),
+                                      ('player.gsisItId', ('player', 'gsisItId'), 'int64'),
+                                      ('player.headshot', ('player', 'headshot'), 'string'),
+                                      ('player.height', ('player', 'height'), 'string'),
+                                      ('player.jerseyNumber', ('player', 'jerseyNumber'), 'int64'),
+                                      ('player.lastName', ('player', 'lastName'), 'string'),
+                                      ('player.nflId', ('player', 'nflId'), 'int64'),
+                                      ('player.ngsPosition', ('player', 'ngsPosition'), 'string'),
+                                      ('player.ngsPositionGroup', ('player', 'ngsPositionGroup'), 'string'),
+                                      ('player.position', ('player', 'position'), 'string'),
+                                      ('player.positionGroup', ('player', 'positionGroup'), 'string'),
+                                      ('player.rookieYear', ('player', 'rookieYear'), 'int64'),
+                                      ('player.season', ('player', 'season'), 'int64'),
+                                      ('player.shortName', ('player', 'shortName'), 'string'),
+                                      ('player.smartId', ('player', 'smartId'), 'string'),
+                                      ('player.status', ('player', 'status'), 'string'),
+                                      ('player.statusDescriptionAbbr',
+                                       ('player', 'statusDescriptionAbbr'),
+                                       'string'),
+                                      ('player.statusShortDescription',
+                                       ('player', 'statusShortDescription'),
+                                       'string'),
+                                      ('player.teamAbbr', ('player', 'teamAbbr'), 'string'),
+                                      ('player.uniformNumber', ('player', 'uniformNumber'), 'string'),
+                                      ('player.weight', ('player', 'weight'), 'int64'),
+                                      ('player.yearsOfExperience', ('player', 'yearsOfExperience'), 'int64'),
+                                      ('team.abbreviation', ('team', 'abbreviation'), 'string'),
+                                      ('team.conferenceAbbr', ('team', 'conferenceAbbr'), 'string'),
+                                      ('team.conferenceFullName', ('team', 'conferenceFullName'), 'string'),
+                                      ('team.currentLogo', ('team', 'currentLogo'), 'string'),
+                                      ('team.divisionFullName', ('team', 'divisionFullName'), 'string'),
+                                      ('team.fullName', ('team', 'fullName'), 'string'),
+                                      ('team.id', ('team', 'id'), 'string'),
+                                      ('team.league', ('team', 'league'), 'string'),
+                                      ('team.location', ('team', 'location'), 'string'),
+                                      ('team.nflShopUrl', ('team', 'nflShopUrl'), 'string'),
+                                      ('team.nickName', ('team', 'nickName'), 'string'),
+                                      ('team.officialWebsiteUrl', ('team', 'officialWebsiteUrl'), 'string'),
+                                      ('team.owners', ('team', 'owners'), 'string'),
+                                      ('team.primaryColor', ('team', 'primaryColor'), 'string'),
+                                      ('team.season', ('team', 'season'), 'string'),
+                                      ('team.secondaryColor', ('team', 'secondaryColor'), 'string'),
+                                      ('team.teamType', ('team', 'teamType'), 'string'),
+                                      ('team.yearEstablished', ('team', 'yearEstablished'), 'int64')],
+                          'maps': [('stats',)]},
+ 'getTeamDefensePassStatsBySeason': {'results': 'defense',
+                                     'total': ('total',),
+                                     'columns': [('blitzPct', ('blitzPct',), 'float64'),
+                                                 ('epaPass', ('epaPass',), 'float64'),
+                                                 ('epaPassPP', ('epaPassPP',), 'float64'),
+                                                 ('go', ('go',), 'float64'),
+                                                 ('gp', ('gp',), 'int64'),
+                                                 ('pass', ('pass',), 'int64'),
+                                                 ('passPct', ('passPct',), 'float64'),
+                                                 ('passTd', ('passTd',), 'int64'),
+                                                 ('passYds', ('passYds',), 'int64'),
+                                                 ('passYpg', ('passYpg',), 'float64'),
+                                                 ('passYpp', ('passYpp',), 'float64'),
+                                                 ('qbp', ('qbp',), 'int64'),
+                                                 ('qbpPct', ('qbpPct',), 'float64'),
+                                                 ('sack', ('sack',), 'int64'),
+                                                 ('sackPct', ('sackPct',), 'float64'),
+                                                 ('sackedYds', ('sackedYds',), 'int64'),
+                                                 ('sackedYpg', ('sackedYpg',), 'float64'),
+                                                 ('sep', ('sep',), 'float64'),
+                                                 ('teamId', ('teamId',), 'string'),
+                                                 ('total', ('total',), 'int64'),
+                                                 ('ttp', ('ttp',), 'float64'),
+                                                 ('ttt', ('ttt',), 'float64'),
+                                                 ('yac', ('yac',), 'int64'),
+                                                 ('yacoe', ('yacoe',), 'int64')],
+                                     'maps': []},
+ 'getTeamDefenseRushStatsBySeason': {'results': 'defense',
+                                     'total': ('total',),
+                                     'columns': [('epaRush', ('epaRush',), 'float64'),
+                                                 ('epaRushPP', ('epaRushPP',), 'float64'),
+                                                 ('gp', ('gp',), 'int64'),
+                                                 ('inPct', ('inPct',), 'float64'),
+                                                 ('lightPct', ('lightPct',), 'float64'),
+                                                 ('outPct', ('outPct',), 'float64'),
+                                                 ('run', ('run',), 'int64'),
+                                                 ('runPct', ('runPct',), 'float64'),
+                                                 ('rush10PYds', ('rush10PYds',), 'int64'),
+                                                 ('rushTd', ('rushTd',), 'int64'),
+                                                 ('rushYds', ('rushYds',), 'int64'),
+                                                 ('rushYpg', ('rushYpg',), 'float64'),
+                                                 ('rushYpp', ('rushYpp',), 'float64'),
+                                                 ('ryoe', ('ryoe',), 'float64'),
+                                                 ('ryoeAtt', ('ryoeAtt',), 'float64'),
+                                                 ('stackedPct', ('stackedPct',), 'float64'),
+                                                 ('stuffPct', ('stuffPct',), 'float64'),
+                                                 ('teamId', ('teamId',), 'string'),
+                                                 ('total', ('total',), 'int64'),
+                                                 ('yacoAtt', ('yacoAtt',), 'float64'),
+                                                 ('ybcoAtt', ('ybcoAtt',), 'float64')],
+                                     'maps': []},
+ 'getTeamDefenseStatsBySeason': {'results': 'defense',
+                                 'total': ('total',),
+                                 'columns': [('defensiveTouchdown', ('defensiveTouchdown',), 'int64'),
+                                             ('epa', ('epa',), 'float64'),
+                                             ('epaPP', ('epaPP',), 'float64'),
+                                             ('epaPass', ('epaPass',), 'float64'),
+                                             ('epaPassPP', ('epaPassPP',), 'float64'),
+                                             ('epaRush', ('epaRush',), 'float64'),
+                                             ('epaRushPP', ('epaRushPP',), 'float64'),
+                                             ('forcedFumble', ('forcedFumble',), 'int64'),
+                                             ('fumbleRecovered', ('fumbleRecovered',), 'int64'),
+                                             ('gp', ('gp',), 'int64'),
+                                             ('interception', ('interception',), 'int64'),
+                                             ('pass', ('pass',), 'int64'),
+                                             ('passPct', ('passPct',), 'float64'),
+                                             ('passTd', ('passTd',), 'int64'),
+                                             ('passYds', ('passYds',), 'int64'),
+                                             ('passYpg', ('passYpg',), 'float64'),
+                                             ('passYpp', ('passYpp',), 'float64'),
+                                             ('ppg', ('ppg',), 'float64'),
+                                             ('qbp', ('qbp',), 'int64'),
+                                             ('qbpPct', ('qbpPct',), 'float64'),
+                                             ('run', ('run',), 'int64'),
+                                             ('rushTd', ('rushTd',), 'int64'),
+                                             ('rushYds', ('rushYds',), 'int64'),
+                                             ('rushYpg', ('rushYpg',), 'float64'),
+                                             ('rushYpp', ('rushYpp',), 'float64'),
+                                             ('ryoe', ('ryoe',), 'float64'),
+                                             ('sackedYds', ('sackedYds',), 'int64'),
+                                             ('sackedYpg', ('sackedYpg',), 'float64'),
+                                             ('td', ('td',), 'int64'),
+                                             ('teamId', ('teamId',), 'string'),
+                                             ('total', ('total',), 'int64'),
+                                             ('totalTakeaways', ('totalTakeaways',), 'int64'),
+                                             ('ttt', ('ttt',), 'float64'),
+                                             ('yds', ('yds',), 'int64'),
+                                             ('ypg', ('ypg',), 'float64'),
+                                             ('ypp', ('ypp',), 'float64')],
+                                 'maps': []},
+ 'getTeamOffenseOverviewStatsBySeason': {'results': 'offense',
+                                         'total': ('total',),
+                                         'columns': [('epa', ('epa',), 'float64'),
+                                                     ('epaPP', ('epaPP',), 'float64'),
+                                                     ('epaPass', ('epaPass',), 'float64'),
+                                                     ('epaPassPP', ('epaPassPP',), 'float64'),
+                                                     ('epaRush', ('epaRush',), 'float64'),
+                                                     ('epaRushPP', ('epaRushPP',), 'float64'),
+                                                     ('gp', ('gp',), 'int64'),
+                                                     ('pass', ('pass',), 'int64'),
+                                                     ('passPct', ('passPct',), 'float64'),
+                                                     ('passTd', ('passTd',), 'int64'),
+                                                     ('passYds', ('passYds',), 'int64'),
+                                                     ('passYpg', ('passYpg',), 'float64'),
+                                                     ('passYpp', ('passYpp',), 'float64'),
+                                                     ('ppg', ('ppg',), 'float64'),
+                                                     ('redZonePct', ('redZonePct',), 'float64'),
+                                                     ('run', ('run',), 'int64'),
+                                                     ('rushTd', ('rushTd',), 'int64'),
+                                                     ('rushYds', ('rushYds',), 'int64'),
+                                                     ('rushYpg', ('rushYpg',), 'float64'),
+                                                     ('rushYpp', ('rushYpp',), 'float64'),
+                                                     ('td', ('td',), 'int64'),
+                                                     ('teamId', ('teamId',), 'string'),
+                                                     ('thirdDownPct', ('thirdDownPct',), 'float64'),
+                                                     ('to', ('to',), 'int64'),
+                                                     ('total', ('total',), 'int64'),
+                                                     ('yds', ('yds',), 'int64'),
+                                                     ('ypg', ('ypg',), 'float64'),
+                                                     ('ypp', ('ypp',), 'float64')],
+                                         'maps': []},
+ 'getTeamOffensePassStatsBySeason': {'results': 'offense',
+                                     'total': ('total',),
+                                     'columns': [('att', ('att',), 'int64'),
+                                                 ('blitzPct', ('blitzPct',), 'float64'),
+                                                 ('epaPass', ('epaPass',), 'float64'),
+                                                 ('epaPassPP', ('epaPassPP',), 'float64'),
+                                                 ('gp', ('gp',), 'int64'),
+                                                 ('paPct', ('paPct',), 'float64'),
+                                                 ('pass', ('pass',), 'int64'),
+                                                 ('passPct', ('passPct',), 'float64'),
+                                                 ('passTd', ('passTd',), 'int64'),
+                                                 ('passYds', ('passYds',), 'int64'),
+                                                 ('passYpg', ('passYpg',), 'float64'),
+                                                 ('passYpp', ('passYpp',), 'float64'),
+                                                 ('qbp', ('qbp',), 'int64'),
+                                                 ('qbpPct', ('qbpPct',), 'float64'),
+                                                 ('sack', ('sack',), 'int64'),
+                                                 ('sackPct', ('sackPct',), 'float64'),
+                                                 ('sackedYds', ('sackedYds',), 'int64'),
+                                                 ('sackedYpg', ('sackedYpg',), 'float64'),
+                                                 ('sep', ('sep',), 'float64'),
+                                                 ('teamId', ('teamId',), 'string'),
+                                                 ('total', ('total',), 'int64'),
+                                                 ('ttp', ('ttp',), 'float64'),
+                                                 ('ttt', ('ttt',), 'float64'),
+                                                 ('yac', ('yac',), 'int64'),
+                                                 ('yacoe', ('yacoe',), 'int64')],
+                                     'maps': []}}
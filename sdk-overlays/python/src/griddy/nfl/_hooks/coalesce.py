@@ -0,0 +1,101 @@
+"""
+Single-flight coalescing of identical concurrent GET requests (async client).
+
+Services with many asyncio tasks often ask for the same player, injury report
+or game within a few milliseconds of each other. With coalescing enabled, the
+first such request goes to the network and identical requests arriving while
+it is in flight wait for its result instead of sending their own:
+
+    - Requests are identical when they have the same operation, the same URL
+      with the query parameters in any order, and the same credentials
+    - Followers get their own copy of the leader's response (marked with an
+      `x-griddy-coalesced: true` header); an exception is raised in all of them
+    - Nothing is kept once the leader's response arrives, so, unlike the
+      response cache, a result is never stale
+
+Cancelling the task that sent the request doesn't cancel the request itself,
+so the tasks waiting on it still get the result.
+
+Coalescing is opt-in (GRIDDY_NFL_COALESCE=1, read by registration.py) and
+needs `sdkHooksConfigAccess: true` in gen.yaml, like the other hooks.
+"""
+import asyncio
+import hashlib
+import weakref
+from typing import Dict, Optional, Tuple, Union
+
+import httpx
+
+from griddy.nfl.httpclient import AsyncHttpClient
+from griddy.nfl.sdkconfiguration import SDKConfiguration
+
+from .response_cache import OPERATION_ID_EXTENSION, _DROPPED_HEADERS
+from .types import BeforeRequestContext, BeforeRequestHook, SDKInitHook
+
+_Shared = Tuple[int, list, bytes]
+
+
+def coalesce_key(request: httpx.Request) -> Optional[str]:
+    """Key identical requests by operation, normalized URL and credentials; None if not coalescible"""
+    if request.method != 'GET':
+        return None
+    url = request.url
+    query = sorted(url.params.multi_items())
+    auth = request.headers.get('authorization', '')
+    auth_digest = hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else '-'
+    operation_id = request.extensions.get(OPERATION_ID_EXTENSION, '')
+    return f"{operation_id} {url.scheme}://{url.netloc.decode()}{url.path} {query} {auth_digest}"
+
+
+class AsyncCoalescingHttpClient:
+    """AsyncHttpClient wrapper that shares one in-flight GET between identical callers"""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+        # Futures belong to one event loop, so in-flight requests are tracked per loop
+        self._inflight: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]' = \
+            weakref.WeakKeyDictionary()
+        self.stats = {'sent': 0, 'coalesced': 0}
+
+    async def _fetch(self, request: httpx.Request, kwargs) -> Tuple[httpx.Response, _Shared]:
+        response = await self._client.send(request, **kwargs)
+        await response.aread()
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+        return response, (response.status_code, headers, response.content)
+
+    async def send(self, request: httpx.Request, *, stream: bool = False, **kwargs) -> httpx.Response:
+        key = None if stream else coalesce_key(request)
+        if key is None:
+            return await self._client.send(request, stream=stream, **kwargs)
+
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+            _, (status_code, headers, content) = await asyncio.shield(task)
+            return httpx.Response(
+                status_code, headers=headers + [('x-griddy-coalesced', 'true')], content=content, request=request,
+            )
+
+        self.stats['sent'] += 1
+        task = asyncio.ensure_future(self._fetch(request, kwargs))
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None) if inflight.get(key) is task else None)
+        response, _ = await asyncio.shield(task)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class CoalescingHook(SDKInitHook, BeforeRequestHook):
+    """Installs single-flight coalescing on the SDK's async HTTP client"""
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if config.async_client is not None and not isinstance(config.async_client, AsyncCoalescingHttpClient):
+            config.async_client = AsyncCoalescingHttpClient(config.async_client)
+        return config
+
+    def before_request(self, hook_ctx: BeforeRequestContext, request: httpx.Request) -> Union[httpx.Request, Exception]:
+        request.extensions[OPERATION_ID_EXTENSION] = hook_ctx.operation_id
+        return request
@@ -0,0 +1,310 @@
+"""
+Client-side, per-host rate limiting with priority classes.
+
+pro.nfl.com throttles well before api.nfl.com does, so one request budget for
+both either wastes api.nfl.com's headroom or gets pro.nfl.com requests
+rejected. `RateLimiter` keeps a token bucket per host (the same pro/api split
+the spec's per-operation `servers` define) and sends through it:
+
+    - A request waits for a token from its host's bucket before it is sent
+    - Waiting requests are released by priority, then in arrival order, so
+      live-score calls jump ahead of queued backfill calls
+    - A 429/503 with `Retry-After` pauses the whole host until then (plus a
+      little jitter, so paused workers don't all resume at once)
+
+Retrying is left to the generated methods: the spec sets
+`x-speakeasy-retries` (exponential backoff with jitter on 429 and 5xx), and
+every retry goes back through the limiter, so it also waits out a Retry-After.
+
+Priorities come from the operation (see OPERATION_PRIORITIES), or from the
+caller for a block of code:
+
+    from griddy.nfl._hooks.rate_limit import BACKFILL, request_priority
+
+    with request_priority(BACKFILL):
+        for game_id in season_game_ids:
+            sdk.football.get_play_by_play(game_id=game_id)
+
+Like the other hooks, this needs `sdkHooksConfigAccess: true` in gen.yaml.
+
+Rate limiting is opt-in. Configuration from the environment (read by
+registration.py):
+    GRIDDY_NFL_RATE_LIMIT=1          rate limit with DEFAULT_LIMITS
+    GRIDDY_NFL_RATE_LIMITS=SPEC      rate limit with these limits, e.g. "pro.nfl.com=4/8,api.nfl.com=20"
+                                     (requests per second / burst; unlisted hosts keep DEFAULT_LIMITS)
+    GRIDDY_NFL_RATE_LIMIT=0          don't rate limit, even if GRIDDY_NFL_RATE_LIMITS is set
+"""
+import time
+import heapq
+import random
+import asyncio
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Union
+
+import httpx
+
+from griddy.nfl.httpclient import AsyncHttpClient, HttpClient
+from griddy.nfl.sdkconfiguration import SDKConfiguration
+
+from .response_cache import OPERATION_ID_EXTENSION
+from .types import BeforeRequestContext, BeforeRequestHook, SDKInitHook
+
+# Priority classes; lower is served first
+LIVE = 0
+INTERACTIVE = 1
+BACKFILL = 2
+
+OPERATION_PRIORITIES: Dict[str, int] = {
+    'getLiveGameScores': LIVE,
+    'getLiveGameStats': LIVE,
+}
+
+# Longest Retry-After honored; anything beyond is left to the SDK's retry budget
+MAX_RETRY_AFTER = 120
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Sustained requests per second and burst size for one host"""
+
+    rate: float
+    burst: int
+
+
+# Used when rate limiting is switched on. Neither host publishes its limits and these values aren't
+# measured: they are conservative guesses, lower for pro.nfl.com since it throttles first. Tune them
+# with GRIDDY_NFL_RATE_LIMITS
+DEFAULT_LIMITS: Dict[str, HostLimit] = {
+    'pro.nfl.com': HostLimit(rate=5, burst=10),
+    'api.nfl.com': HostLimit(rate=20, burst=40),
+}
+
+_priority: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('griddy_request_priority', default=None)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Send requests made in this block (thread or task) with the given priority"""
+    reset = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(reset)
+
+
+def parse_limits(spec: str) -> Dict[str, HostLimit]:
+    """
+    Parse "host=rate[/burst],..." into HostLimits.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        host, _, value = entry.partition('=')
+        rate, _, burst = value.partition('/')
+        if not host or not rate:
+            raise ValueError(f"Invalid rate limit {entry!r}; expected host=rate[/burst]")
+        limits[host.strip()] = HostLimit(float(rate), int(burst) if burst else max(1, int(float(rate))))
+    return limits
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Read Retry-After (delta seconds or HTTP date) from a response"""
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class _Waiter:
+    """A queued request; granted by setting an Event or resolving a loop future"""
+
+    __slots__ = ('granted', 'event', 'loop', 'future')
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.granted = False
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def grant(self):
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(lambda: self.future.done() or self.future.set_result(None))
+
+
+class TokenBucket:
+    """
+    A token bucket whose waiters are served in priority order.
+
+    Safe to share between threads and event loops: sync callers block on an
+    Event, async callers await a future on their own loop.
+    """
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._waiters: List = []
+        self._seq = itertools.count()
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next `seconds` (e.g. after a Retry-After)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Resume with one request, then refill at the normal rate
+            self._updated = self._paused_until
+            self._tokens = min(self._tokens, 1.0)
+
+    def _dispatch(self) -> float:
+        """Grant tokens to waiters; return the seconds until another could be granted"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self.limit.burst, self._tokens + max(now - self._updated, 0.0) * self.limit.rate)
+            self._updated = max(now, self._updated)
+            while self._waiters and self._tokens >= 1:
+                _, _, waiter = heapq.heappop(self._waiters)
+                self._tokens -= 1
+                waiter.grant()
+            return max((1 - self._tokens) / self.limit.rate, 0.001)
+
+    def _enqueue(self, priority: int, waiter: _Waiter):
+        with self._lock:
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+
+    def _withdraw(self, waiter: _Waiter):
+        with self._lock:
+            self._waiters = [entry for entry in self._waiters if entry[2] is not waiter]
+            heapq.heapify(self._waiters)
+
+    def acquire(self, priority: int = INTERACTIVE):
+        """Block until a token is granted"""
+        waiter = _Waiter()
+        self._enqueue(priority, waiter)
+        # Every waiter drives dispatch, so no background thread is needed
+        while not waiter.granted:
+            waiter.event.wait(self._dispatch())
+
+    async def aacquire(self, priority: int = INTERACTIVE):
+        """Wait, without blocking the event loop, until a token is granted"""
+        waiter = _Waiter(asyncio.get_running_loop())
+        self._enqueue(priority, waiter)
+        try:
+            while not waiter.granted:
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), self._dispatch())
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            if waiter.granted:
+                # Don't lose a token that was granted as we were cancelled
+                with self._lock:
+                    self._tokens += 1
+            else:
+                self._withdraw(waiter)
+            raise
+
+
+class RateLimiter:
+    """One TokenBucket per host; hosts without a limit aren't throttled"""
+
+    def __init__(self, limits: Optional[Dict[str, HostLimit]] = None, jitter: float = 0.25):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.jitter = jitter
+        self._buckets: Dict[str, TokenBucket] = {host: TokenBucket(limit) for host, limit in self.limits.items()}
+
+    def bucket_for(self, request: httpx.Request) -> Optional[TokenBucket]:
+        return self._buckets.get(request.url.host)
+
+    def priority_for(self, request: httpx.Request) -> int:
+        priority = _priority.get()
+        if priority is None:
+            priority = OPERATION_PRIORITIES.get(request.extensions.get(OPERATION_ID_EXTENSION, ''), INTERACTIVE)
+        return priority
+
+    def observe(self, request: httpx.Request, response: httpx.Response):
+        """Pause the request's host if the response asks us to back off"""
+        bucket = self.bucket_for(request)
+        if bucket is None or response.status_code not in (429, 503):
+            return
+        seconds = retry_after_seconds(response)
+        if seconds is None and response.status_code == 429:
+            # Throttled without a hint: hold off for roughly one burst's worth
+            seconds = bucket.limit.burst / bucket.limit.rate
+        if seconds:
+            bucket.pause(seconds * (1 + random.uniform(0, self.jitter)))
+
+
+class RateLimitedHttpClient:
+    """HttpClient wrapper that waits for a host token before each request"""
+
+    def __init__(self, client: HttpClient, limiter: RateLimiter):
+        self._client = client
+        self.limiter = limiter
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        bucket = self.limiter.bucket_for(request)
+        if bucket is not None:
+            bucket.acquire(self.limiter.priority_for(request))
+        response = self._client.send(request, **kwargs)
+        self.limiter.observe(request, response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class AsyncRateLimitedHttpClient:
+    """AsyncHttpClient wrapper that waits for a host token before each request"""
+
+    def __init__(self, client: AsyncHttpClient, limiter: RateLimiter):
+        self._client = client
+        self.limiter = limiter
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        bucket = self.limiter.bucket_for(request)
+        if bucket is not None:
+            await bucket.aacquire(self.limiter.priority_for(request))
+        response = await self._client.send(request, **kwargs)
+        self.limiter.observe(request, response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class RateLimitHook(SDKInitHook, BeforeRequestHook):
+    """Routes the SDK's requests through a RateLimiter"""
+
+    def __init__(self, limiter: Optional[RateLimiter] = None):
+        self.limiter = limiter or RateLimiter()
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if config.client is not None and not isinstance(config.client, RateLimitedHttpClient):
+            config.client = RateLimitedHttpClient(config.client, self.limiter)
+        if config.async_client is not None and not isinstance(config.async_client, AsyncRateLimitedHttpClient):
+            config.async_client = AsyncRateLimitedHttpClient(config.async_client, self.limiter)
+        return config
+
+    def before_request(self, hook_ctx: BeforeRequestContext, request: httpx.Request) -> Union[httpx.Request, Exception]:
+        request.extensions[OPERATION_ID_EXTENSION] = hook_ctx.operation_id
+        return request
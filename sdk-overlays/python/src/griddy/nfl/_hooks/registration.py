@@ -0,0 +1,135 @@
+import os
+from typing import TYPE_CHECKING, Optional
+
+from .rate_limit import DEFAULT_LIMITS, RateLimiter, RateLimitHook, parse_limits
+from .response_cache import ResponseCache, ResponseCacheHook
+from .token_manager import ClientCredentials, DEFAULT_DEVICE_INFO, TokenManager, TokenManagerHook
+from .transport import SharedTransport, SharedTransportHook, TransportConfig
+from .types import Hooks
+
+if TYPE_CHECKING:
+    from ..store import GameStoreHook
+
+
+# This file is only ever generated once on the first generation and then is free to be modified.
+# Any hooks you wish to add should be registered in the init_hooks function. Feel free to define them
+# in this file or in separate files in the hooks folder.
+
+
+def init_hooks(hooks: Hooks):
+    # pylint: disable=unused-argument
+    """Add hooks by calling hooks.register{sdk_init/before_request/after_success/after_error}Hook
+    with an instance of a hook that implements that specific Hook interface
+    Hooks are registered per SDK instance, and are valid for the lifetime of the SDK instance"""
+    # sdk_init hooks wrap the HTTP clients in registration order: the shared
+    # transport replaces the default clients first, the rate limiter sits right
+    # above it so every request actually sent is throttled, coalescing merges
+    # duplicate calls before they queue for a token, and the cache (registered
+    # last, outermost, apart from the final-game store) answers hits before
+    # anything else runs
+    # Also registered with the shared transport switched off, for GriddyNFL(transport=...)
+    shared = os.environ.get('GRIDDY_NFL_SHARED_TRANSPORT') != '0'
+    hooks.register_sdk_init_hook(SharedTransportHook(_shared_transport() if shared else None))
+
+    if _rate_limit_enabled():
+        rate_limit_hook = RateLimitHook(_shared_rate_limiter())
+        hooks.register_sdk_init_hook(rate_limit_hook)
+        hooks.register_before_request_hook(rate_limit_hook)
+
+    token_manager = _shared_token_manager()
+    if token_manager is not None:
+        hooks.register_sdk_init_hook(TokenManagerHook(token_manager))
+
+    if os.environ.get('GRIDDY_NFL_COALESCE') == '1':
+        # Opt-in layers are imported only when enabled, to keep `import griddy.nfl` cheap
+        from .coalesce import CoalescingHook
+        coalescing_hook = CoalescingHook()
+        hooks.register_sdk_init_hook(coalescing_hook)
+        hooks.register_before_request_hook(coalescing_hook)
+
+    if os.environ.get('GRIDDY_NFL_CACHE_DISABLE') != '1':
+        cache_hook = ResponseCacheHook(_shared_cache())
+        hooks.register_sdk_init_hook(cache_hook)
+        hooks.register_before_request_hook(cache_hook)
+
+    store_hook = _shared_store_hook()
+    if store_hook is not None:
+        hooks.register_sdk_init_hook(store_hook)
+        hooks.register_before_request_hook(store_hook)
+
+    # Outermost, so lazy_call sees responses exactly as the generated code would. Imported here:
+    # griddy.nfl.lazy imports this package, and may be the first module a process loads
+    from ..lazy import RawResponseHook
+    hooks.register_sdk_init_hook(RawResponseHook())
+
+
+_cache = None
+_token_manager = None
+_transport = None
+_rate_limiter = None
+_store_hook = None
+
+
+def _shared_transport() -> SharedTransport:
+    """One set of connection pools per process, shared by every SDK instance"""
+    global _transport
+    if _transport is None:
+        _transport = SharedTransport(TransportConfig(
+            http2=os.environ.get('GRIDDY_NFL_HTTP2') != '0',
+            max_connections=int(os.environ.get('GRIDDY_NFL_MAX_CONNECTIONS') or 100),
+        ))
+    return _transport
+
+
+def _shared_cache() -> ResponseCache:
+    """One response cache per process, shared by every SDK instance"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            disk_dir=os.environ.get('GRIDDY_NFL_CACHE_DIR') or None,
+            disk_max_entries=int(os.environ.get('GRIDDY_NFL_CACHE_DISK_ENTRIES') or 4096),
+        )
+    return _cache
+
+
+def _rate_limit_enabled() -> bool:
+    """Client-side rate limiting is opt-in: GRIDDY_NFL_RATE_LIMIT=1, or limits in GRIDDY_NFL_RATE_LIMITS"""
+    setting = os.environ.get('GRIDDY_NFL_RATE_LIMIT')
+    if setting is not None:
+        return setting != '0'
+    return bool(os.environ.get('GRIDDY_NFL_RATE_LIMITS'))
+
+
+def _shared_rate_limiter() -> RateLimiter:
+    """One set of per-host buckets per process, so limits hold across SDK instances"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter({**DEFAULT_LIMITS, **parse_limits(os.environ.get('GRIDDY_NFL_RATE_LIMITS', ''))})
+    return _rate_limiter
+
+
+def _shared_store_hook() -> Optional['GameStoreHook']:
+    """One final-game store per process, if GRIDDY_NFL_STORE names a database"""
+    global _store_hook
+    if _store_hook is None and os.environ.get('GRIDDY_NFL_STORE'):
+        from ..store import GameStoreHook
+        _store_hook = GameStoreHook(os.environ['GRIDDY_NFL_STORE'])
+    return _store_hook
+
+
+def _shared_token_manager() -> Optional[TokenManager]:
+    """One token manager per process, if client credentials are configured"""
+    global _token_manager
+    if _token_manager is None:
+        client_key = os.environ.get('GRIDDY_NFL_CLIENT_KEY')
+        client_secret = os.environ.get('GRIDDY_NFL_CLIENT_SECRET')
+        if not client_key or not client_secret:
+            return None
+        _token_manager = TokenManager(ClientCredentials(
+            client_key,
+            client_secret,
+            device_id=os.environ.get('GRIDDY_NFL_DEVICE_ID', ''),
+            device_info=os.environ.get('GRIDDY_NFL_DEVICE_INFO', DEFAULT_DEVICE_INFO),
+            network_type=os.environ.get('GRIDDY_NFL_NETWORK_TYPE', 'other'),
+        ))
+    return _token_manager
@@ -0,0 +1,366 @@
+"""
+Response cache for slow-changing NFL reference endpoints.
+
+Teams, venues, season weeks and draft info change a few times a season at
+most, but callers request them thousands of times a day. `ResponseCacheHook`
+caches successful GET responses for the operations listed in its TTL table:
+
+    - Fresh entries are served without touching the network
+    - Stale entries that carried an ETag are revalidated with If-None-Match;
+      a 304 refreshes the entry and returns the cached body
+    - Responses marked `Cache-Control: no-store` or `private` are never stored
+
+Entries live in an in-memory LRU (bounded by entry count) and, optionally, in
+an on-disk backend shared between processes, also bounded by entry count
+(oldest files pruned first); expired files are deleted when read. The cache
+key includes the
+request method, the full URL and a digest of the Authorization header, so
+responses are never shared between tokens.
+
+The hook needs access to the SDK configuration (`sdkHooksConfigAccess: true`
+in gen.yaml): `sdk_init` wraps `config.client` and `config.async_client` with
+caching clients, and `before_request` tags each request with its operation id
+so the clients can look up its TTL.
+
+Configuration from the environment (read by registration.py):
+    GRIDDY_NFL_CACHE_DISABLE=1        don't install the cache
+    GRIDDY_NFL_CACHE_DIR=PATH         also persist entries under PATH
+    GRIDDY_NFL_CACHE_DISK_ENTRIES=N   keep at most N files there (default 4096)
+"""
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import httpx
+
+from griddy.nfl.httpclient import AsyncHttpClient, HttpClient
+from griddy.nfl.sdkconfiguration import SDKConfiguration
+
+from .types import BeforeRequestContext, BeforeRequestHook, SDKInitHook
+
+# Default time-to-live, in seconds, per operation id. Operations not listed are never cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    'getAllTeams': 24 * 60 * 60,
+    'getVenues': 24 * 60 * 60,
+    'getSeasonWeeks': 6 * 60 * 60,
+    'getScheduleSeasonWeeks': 6 * 60 * 60,
+    'getDraftInfo': 60 * 60,
+}
+
+# Request extension used to pass the operation id from the hook to the client
+OPERATION_ID_EXTENSION = 'griddy_operation_id'
+
+# Headers kept on cached responses; hop-by-hop and encoding headers are dropped
+# because the stored body is already decoded
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and the metadata needed to revalidate it"""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    stored_at: float
+    ttl: float
+    etag: Optional[str] = None
+    hits: int = field(default=0, compare=False)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    def to_response(self, request: httpx.Request, cache_status: str = 'hit') -> httpx.Response:
+        """Build an httpx.Response for the cached body, marked with an x-griddy-cache header"""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers + [('x-griddy-cache', cache_status)],
+            content=self.content,
+            request=request,
+        )
+
+
+class MemoryBackend:
+    """Thread-safe LRU of cache entries, bounded by entry count"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """
+    Stores cache entries as one pickle file per key under a directory.
+
+    Writes are atomic (temp file + rename), so several processes can share a
+    directory. Expired entries are deleted when read (and returned once more,
+    so they can still be revalidated), and once the directory holds more than
+    max_entries files the oldest, by mtime, are removed. Only point this at a
+    directory you control: entries are pickles.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_entries: int = 4096):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Approximate (other processes write too); prune() recounts
+        self._count = sum(1 for _ in self.directory.glob('*.pickle'))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.pickle"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            return None
+        if not isinstance(entry, CacheEntry):
+            return None
+        if not entry.fresh:
+            # Revalidating or refetching stores a new entry; until then the file is dead weight
+            self._remove(path)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        tmp_name = None
+        try:
+            is_new = not path.exists()
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except OSError:
+            # A failed write only costs a cache miss later
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            return
+        with self._lock:
+            self._count += is_new
+            over = self._count > self.max_entries
+        if over:
+            self.prune()
+
+    def _remove(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._count -= 1
+
+    def prune(self):
+        """Delete the oldest files until at most 90% of max_entries remain"""
+        files = []
+        for path in self.directory.glob('*.pickle'):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        files.sort()
+        excess = len(files) - int(self.max_entries * 0.9)
+        for _, path in files[:max(excess, 0)]:
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._count = len(files) - max(excess, 0)
+
+    def clear(self):
+        for path in self.directory.glob('*.pickle'):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._count = 0
+
+
+class ResponseCache:
+    """LRU + TTL response cache with an optional on-disk second level"""
+
+    def __init__(
+            self,
+            ttls: Optional[Mapping[str, float]] = None,
+            max_entries: int = 512,
+            disk_dir: Optional[Union[str, Path]] = None,
+            disk_max_entries: int = 4096,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.memory = MemoryBackend(max_entries)
+        self.disk = DiskBackend(disk_dir, disk_max_entries) if disk_dir else None
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stores': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def ttl_for(self, request: httpx.Request) -> Optional[float]:
+        """Return the TTL for a request, or None if it must not be cached"""
+        if request.method != 'GET':
+            return None
+        ttl = self.ttls.get(request.extensions.get(OPERATION_ID_EXTENSION, ''))
+        return ttl if ttl and ttl > 0 else None
+
+    @staticmethod
+    def key_for(request: httpx.Request) -> str:
+        """Build the cache key: method, URL and a digest of the credentials"""
+        auth = request.headers.get('authorization', '')
+        auth_digest = hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else '-'
+        return f"{request.method} {request.url} {auth_digest}"
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                self.memory.set(key, entry)
+        return entry
+
+    def store(self, key: str, entry: CacheEntry):
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            self.disk.set(key, entry)
+        self._count('stores')
+
+    def clear(self):
+        """Drop every cached entry"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def prepare(self, request: httpx.Request) -> Tuple[Optional[str], Optional[CacheEntry], Optional[httpx.Response]]:
+        """
+        Look a request up before it is sent.
+
+        Returns:
+            Tuple of (key, entry, response). key is None if the request isn't
+            cacheable. response is set when a fresh entry can be served; when
+            a stale entry has an ETag, If-None-Match is added to the request.
+        """
+        ttl = self.ttl_for(request)
+        if ttl is None:
+            return None, None, None
+
+        key = self.key_for(request)
+        entry = self.lookup(key)
+        if entry is not None and entry.fresh:
+            entry.hits += 1
+            self._count('hits')
+            return key, entry, entry.to_response(request)
+
+        self._count('misses')
+        if entry is not None and entry.etag:
+            request.headers['If-None-Match'] = entry.etag
+        return key, entry, None
+
+    def complete(
+            self,
+            request: httpx.Request,
+            key: str,
+            entry: Optional[CacheEntry],
+            response: httpx.Response,
+    ) -> httpx.Response:
+        """Update the cache from a network response and return what the caller should see"""
+        ttl = self.ttl_for(request) or 0
+        if response.status_code == 304 and entry is not None:
+            refreshed = CacheEntry(
+                entry.status_code, entry.headers, entry.content, time.time(), ttl,
+                response.headers.get('etag', entry.etag),
+            )
+            self.store(key, refreshed)
+            self._count('revalidated')
+            return refreshed.to_response(request, 'revalidated')
+
+        cache_control = response.headers.get('cache-control', '').lower()
+        if response.status_code == 200 and 'no-store' not in cache_control and 'private' not in cache_control:
+            headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+            self.store(key, CacheEntry(200, headers, response.content, time.time(), ttl, response.headers.get('etag')))
+        return response
+
+
+class CachingHttpClient:
+    """HttpClient wrapper that serves and stores cacheable GET responses"""
+
+    def __init__(self, client: HttpClient, cache: ResponseCache):
+        self._client = client
+        self.cache = cache
+
+    def send(self, request: httpx.Request, *, stream: bool = False, **kwargs) -> httpx.Response:
+        key, entry, cached = (None, None, None) if stream else self.cache.prepare(request)
+        if cached is not None:
+            return cached
+        response = self._client.send(request, stream=stream, **kwargs)
+        if key is None:
+            return response
+        response.read()
+        return self.cache.complete(request, key, entry, response)
+
+    def __getattr__(self, name):
+        # build_request, close and anything else go to the wrapped client
+        return getattr(self._client, name)
+
+
+class AsyncCachingHttpClient:
+    """AsyncHttpClient wrapper that serves and stores cacheable GET responses"""
+
+    def __init__(self, client: AsyncHttpClient, cache: ResponseCache):
+        self._client = client
+        self.cache = cache
+
+    async def send(self, request: httpx.Request, *, stream: bool = False, **kwargs) -> httpx.Response:
+        key, entry, cached = (None, None, None) if stream else self.cache.prepare(request)
+        if cached is not None:
+            return cached
+        response = await self._client.send(request, stream=stream, **kwargs)
+        if key is None:
+            return response
+        await response.aread()
+        return self.cache.complete(request, key, entry, response)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class ResponseCacheHook(SDKInitHook, BeforeRequestHook):
+    """Installs a ResponseCache on the SDK's sync and async HTTP clients"""
+
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        self.cache = cache or ResponseCache()
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if config.client is not None and not isinstance(config.client, CachingHttpClient):
+            config.client = CachingHttpClient(config.client, self.cache)
+        if config.async_client is not None and not isinstance(config.async_client, AsyncCachingHttpClient):
+            config.async_client = AsyncCachingHttpClient(config.async_client, self.cache)
+        return config
+
+    def before_request(self, hook_ctx: BeforeRequestContext, request: httpx.Request) -> Union[httpx.Request, Exception]:
+        request.extensions[OPERATION_ID_EXTENSION] = hook_ctx.operation_id
+        return request
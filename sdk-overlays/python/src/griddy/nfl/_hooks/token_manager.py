@@ -0,0 +1,348 @@
+"""
+Access token lifecycle for the NFLAuth bearer scheme.
+
+Without this, every caller has to obtain a token from /identity/v3/token
+itself and pass it to GriddyNFL, which in practice means fetching tokens far
+too often or running until a 401. `TokenManager` owns one token per set of
+client credentials:
+
+    - The token is cached and attached to every request as
+      `Authorization: Bearer ...`
+    - Once it is within `refresh_margin` seconds of expiry, a refresh starts
+      in the background and callers keep using the current token
+    - Only when the token has actually expired do callers wait, and then
+      every waiting thread and asyncio task shares the same in-flight refresh
+    - A 401 from the API invalidates the token and the request is retried
+      once with a new one
+
+Refreshing with /identity/v3/token/refresh requires a signed request (uid,
+uidSignature, signatureTimestamp). Pass a `refresh_signer` that returns those
+fields to use it; without one, the manager requests a new token from
+/identity/v3/token with the client credentials, which the API also accepts.
+
+Like the response cache, the hook needs `sdkHooksConfigAccess: true`:
+`sdk_init` wraps the SDK's sync and async HTTP clients, so async requests
+await a refresh instead of blocking the event loop in a synchronous hook.
+
+Configuration from the environment (read by registration.py):
+    GRIDDY_NFL_CLIENT_KEY, GRIDDY_NFL_CLIENT_SECRET   enable the manager
+    GRIDDY_NFL_DEVICE_ID      device UUID (default: random per process)
+    GRIDDY_NFL_DEVICE_INFO    base64 device info (default: desktop Chrome)
+    GRIDDY_NFL_NETWORK_TYPE   network type (default: other)
+"""
+import json
+import time
+import uuid
+import base64
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+import httpx
+
+from griddy.nfl.httpclient import AsyncHttpClient, HttpClient
+from griddy.nfl.sdkconfiguration import SDKConfiguration
+
+from .types import SDKInitHook
+
+IDENTITY_URL = 'https://api.nfl.com'
+TOKEN_PATH = '/identity/v3/token'
+REFRESH_PATH = '/identity/v3/token/refresh'
+
+DEFAULT_DEVICE_INFO = base64.b64encode(json.dumps(
+    {'model': 'desktop', 'version': 'Chrome', 'osName': 'Windows', 'osVersion': '10'},
+    separators=(',', ':'),
+).encode()).decode()
+
+# expiresIn values below this are durations in seconds, not Unix timestamps
+_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class ClientCredentials:
+    """Client and device information sent to the identity endpoints"""
+
+    client_key: str
+    client_secret: str
+    device_id: str = ''
+    device_info: str = DEFAULT_DEVICE_INFO
+    network_type: str = 'other'
+
+    def to_body(self) -> Dict[str, str]:
+        return {
+            'clientKey': self.client_key,
+            'clientSecret': self.client_secret,
+            'deviceId': self.device_id or str(uuid.uuid4()),
+            'deviceInfo': self.device_info,
+            'networkType': self.network_type,
+        }
+
+
+@dataclass(frozen=True)
+class Token:
+    """An access token and when it expires (Unix time)"""
+
+    access_token: str
+    refresh_token: Optional[str]
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, body: Dict[str, Any], now: float) -> 'Token':
+        expires_in = float(body.get('expiresIn') or 0)
+        expires_at = expires_in if expires_in >= _TIMESTAMP_THRESHOLD else now + expires_in
+        return cls(body['accessToken'], body.get('refreshToken'), expires_at)
+
+    def expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+    def expiring(self, now: float, margin: float) -> bool:
+        return now >= self.expires_at - margin
+
+
+class TokenError(Exception):
+    """Raised when a token can't be obtained from the identity endpoints"""
+
+
+class TokenManager:
+    """Caches an access token and refreshes it once, for all threads and tasks"""
+
+    #: Seconds to wait before retrying a failed background refresh
+    FAILURE_BACKOFF = 10
+
+    def __init__(
+            self,
+            credentials: ClientCredentials,
+            refresh_margin: float = 300,
+            refresh_signer: Optional[Callable[[Token], Dict[str, str]]] = None,
+            identity_url: str = IDENTITY_URL,
+            timeout: float = 30,
+            transport: Optional[httpx.BaseTransport] = None,
+            async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        # Keep one device id for the manager's lifetime
+        if not credentials.device_id:
+            credentials = ClientCredentials(
+                credentials.client_key, credentials.client_secret, str(uuid.uuid4()),
+                credentials.device_info, credentials.network_type,
+            )
+        self.credentials = credentials
+        self.refresh_margin = refresh_margin
+        self.refresh_signer = refresh_signer
+        self.identity_url = identity_url.rstrip('/')
+        self.timeout = timeout
+        self._transport = transport
+        self._async_transport = async_transport
+
+        self._lock = threading.Lock()
+        self._token: Optional[Token] = None
+        self._inflight: Optional[Future] = None
+        self._retry_at = 0.0
+        self._tasks: Set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_token(self) -> str:
+        """Return a valid access token, refreshing it if needed (blocking)"""
+        token, future, role = self._claim_refresh()
+        if role == 'background':
+            threading.Thread(target=self._run_refresh, args=(future,), daemon=True).start()
+        elif role == 'now':
+            self._run_refresh(future)
+        if token is not None:
+            return token.access_token
+        return future.result(timeout=self.timeout * 2).access_token
+
+    async def aget_token(self) -> str:
+        """Return a valid access token, refreshing it if needed (non-blocking)"""
+        token, future, role = self._claim_refresh()
+        if role == 'background':
+            task = asyncio.get_running_loop().create_task(self._arun_refresh(future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: self._abandon(future))
+        elif role == 'now':
+            await self._arun_refresh(future)
+        if token is not None:
+            return token.access_token
+        return (await asyncio.wrap_future(future)).access_token
+
+    def invalidate(self, access_token: Optional[str] = None):
+        """Forget the cached token (only if it is still access_token, when given)"""
+        with self._lock:
+            if self._token is not None and access_token in (None, self._token.access_token):
+                self._token = None
+
+    # ------------------------------------------------------------------
+    # Single-flight refresh
+    # ------------------------------------------------------------------
+
+    def _claim_refresh(self) -> Tuple[Optional[Token], Optional[Future], Optional[str]]:
+        """
+        Decide whether the caller needs a refresh.
+
+        Returns:
+            Tuple of (token, future, role). token is set when the caller can
+            use the cached token right away; otherwise it must wait on future.
+            role is 'now' if the caller must run the refresh and wait for it,
+            'background' if it must start the refresh but can use token, and
+            None if no refresh is needed or another caller is running it.
+        """
+        now = time.time()
+        with self._lock:
+            token = self._token
+            if token is not None and not token.expiring(now, self.refresh_margin):
+                return token, None, None
+            if token is not None and not token.expired(now):
+                if self._inflight is not None or now < self._retry_at:
+                    return token, None, None
+                self._inflight = Future()
+                return token, self._inflight, 'background'
+            if self._inflight is not None:
+                return None, self._inflight, None
+            self._inflight = Future()
+            return None, self._inflight, 'now'
+
+    def _finish(self, future: Future, token: Optional[Token], error: Optional[BaseException]):
+        with self._lock:
+            if token is not None:
+                self._token = token
+            else:
+                # Don't retry background refreshes on every request while the endpoint fails
+                self._retry_at = time.time() + self.FAILURE_BACKOFF
+            self._inflight = None
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(token)
+
+    def _abandon(self, future: Future):
+        """Release a refresh whose task was cancelled before it ran (e.g. asyncio.run() returning)"""
+        if not future.done():
+            self._finish(future, None, asyncio.CancelledError())
+
+    def _run_refresh(self, future: Future):
+        token = None
+        try:
+            with httpx.Client(base_url=self.identity_url, timeout=self.timeout, transport=self._transport) as client:
+                responses = {}
+                for path, body in self._token_requests():
+                    responses[path] = client.post(path, json=body)
+                    token = self._parse(responses[path])
+                    if token is not None:
+                        break
+                else:
+                    raise self._error(responses)
+        except BaseException as e:
+            self._finish(future, None, e)
+        else:
+            self._finish(future, token, None)
+
+    async def _arun_refresh(self, future: Future):
+        token = None
+        try:
+            async with httpx.AsyncClient(
+                    base_url=self.identity_url, timeout=self.timeout, transport=self._async_transport
+            ) as client:
+                responses = {}
+                for path, body in self._token_requests():
+                    responses[path] = await client.post(path, json=body)
+                    token = self._parse(responses[path])
+                    if token is not None:
+                        break
+                else:
+                    raise self._error(responses)
+        except BaseException as e:
+            self._finish(future, None, e)
+        else:
+            self._finish(future, token, None)
+
+    def _token_requests(self):
+        """Yield (path, body) for each way to get a token, in order of preference"""
+        current = self._token
+        if current is not None and current.refresh_token and self.refresh_signer is not None:
+            body = self.credentials.to_body()
+            body['refreshToken'] = current.refresh_token
+            body.update(self.refresh_signer(current))
+            yield REFRESH_PATH, body
+        yield TOKEN_PATH, self.credentials.to_body()
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> Optional[Token]:
+        if response.status_code != 200:
+            return None
+        return Token.from_response(response.json(), time.time())
+
+    @staticmethod
+    def _error(responses: Dict[str, httpx.Response]) -> TokenError:
+        details = ', '.join(f"{path}: HTTP {response.status_code}" for path, response in responses.items())
+        return TokenError(f"Could not obtain an NFL access token ({details})")
+
+
+def _is_identity_request(request: httpx.Request) -> bool:
+    return request.url.path.startswith(TOKEN_PATH)
+
+
+class TokenHttpClient:
+    """HttpClient wrapper that authenticates requests with a TokenManager"""
+
+    def __init__(self, client: HttpClient, manager: TokenManager):
+        self._client = client
+        self.manager = manager
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        if _is_identity_request(request):
+            return self._client.send(request, **kwargs)
+        token = self.manager.get_token()
+        request.headers['Authorization'] = f"Bearer {token}"
+        response = self._client.send(request, **kwargs)
+        if response.status_code == 401:
+            response.close()
+            self.manager.invalidate(token)
+            request.headers['Authorization'] = f"Bearer {self.manager.get_token()}"
+            response = self._client.send(request, **kwargs)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class AsyncTokenHttpClient:
+    """AsyncHttpClient wrapper that authenticates requests with a TokenManager"""
+
+    def __init__(self, client: AsyncHttpClient, manager: TokenManager):
+        self._client = client
+        self.manager = manager
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        if _is_identity_request(request):
+            return await self._client.send(request, **kwargs)
+        token = await self.manager.aget_token()
+        request.headers['Authorization'] = f"Bearer {token}"
+        response = await self._client.send(request, **kwargs)
+        if response.status_code == 401:
+            await response.aclose()
+            self.manager.invalidate(token)
+            request.headers['Authorization'] = f"Bearer {await self.manager.aget_token()}"
+            response = await self._client.send(request, **kwargs)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class TokenManagerHook(SDKInitHook):
+    """Routes the SDK's requests through a TokenManager"""
+
+    def __init__(self, manager: TokenManager):
+        self.manager = manager
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if config.client is not None and not isinstance(config.client, TokenHttpClient):
+            config.client = TokenHttpClient(config.client, self.manager)
+        if config.async_client is not None and not isinstance(config.async_client, AsyncTokenHttpClient):
+            config.async_client = AsyncTokenHttpClient(config.async_client, self.manager)
+        return config
@@ -0,0 +1,223 @@
+"""
+Process-wide pooled HTTP transport for pro.nfl.com and api.nfl.com.
+
+Operations are routed to two hosts through per-operation `servers` entries
+(see scripts/fix_endpoint_servers.py in griddy-sdk-sources). By default every
+GriddyNFL instance builds its own httpx clients, so hundreds of workers each
+open (and TLS-handshake) their own connections. `SharedTransportHook`
+replaces the SDK's default clients with ones backed by a `SharedTransport`:
+
+    - One connection pool per NFL host, with its own connection and
+      keep-alive limits, shared by every SDK instance in the process
+    - HTTP/2 when the `h2` package is installed (`pip install httpx[http2]`),
+      so concurrent requests to a host share a connection
+    - The sync pool is rebuilt after a fork; async pools are kept per event
+      loop, because httpx connections can't move between loops
+
+Clients passed explicitly to GriddyNFL(client=..., async_client=...) are left
+alone. The shared clients are marked as caller-supplied so that an SDK
+instance being garbage collected doesn't close the pool under the others.
+
+An instance can also be given its own transport:
+
+    GriddyNFL(transport=TransportConfig(max_connections=10, host_limits={
+        'https://pro.nfl.com': httpx.Limits(max_connections=4, max_keepalive_connections=4),
+    }))
+
+A TransportConfig gets pools of its own, closed with the instance; a
+SharedTransport is shared with every instance it is passed to.
+
+The hook needs `sdkHooksConfigAccess: true` in gen.yaml, like the cache and
+token hooks, and must be registered before them so they wrap the shared
+clients.
+
+Configuration from the environment (read by registration.py):
+    GRIDDY_NFL_SHARED_TRANSPORT=0      keep per-instance clients
+    GRIDDY_NFL_HTTP2=0                 use HTTP/1.1 even if h2 is installed
+    GRIDDY_NFL_MAX_CONNECTIONS=N       connections per host (default 100)
+"""
+import os
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from griddy.nfl.httpclient import AsyncHttpClient, HttpClient
+from griddy.nfl.sdkconfiguration import SDKConfiguration
+
+from .types import SDKInitHook
+
+NFL_HOSTS = ('https://pro.nfl.com', 'https://api.nfl.com')
+
+
+def http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (requires the h2 package)"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Pool settings applied to each NFL host, with optional per-host limits"""
+
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    connect_timeout: float = 10
+    timeout: float = 30
+    hosts: Tuple[str, ...] = NFL_HOSTS
+    # Origin (e.g. 'https://pro.nfl.com') -> limits replacing the ones above for that host
+    host_limits: Optional[Mapping[str, httpx.Limits]] = field(default=None, hash=False)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def limits_for(self, host: str) -> httpx.Limits:
+        """The pool limits for one host"""
+        return (self.host_limits or {}).get(host) or self.limits
+
+    @property
+    def use_http2(self) -> bool:
+        return self.http2 and http2_available()
+
+    def client_kwargs(self, transport_cls) -> Dict:
+        """Arguments for httpx.Client/AsyncClient: one mounted transport (pool) per host"""
+        return {
+            'follow_redirects': True,
+            'timeout': httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            'limits': self.limits,
+            'http2': self.use_http2,
+            'mounts': {
+                host: transport_cls(http2=self.use_http2, limits=self.limits_for(host))
+                for host in dict.fromkeys(self.hosts + tuple(self.host_limits or ()))
+            },
+        }
+
+
+class SharedTransport:
+    """Owns the process's sync client and one async client per event loop"""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        self._client_pid: Optional[int] = None
+        self._async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = \
+            weakref.WeakKeyDictionary()
+
+    def client(self) -> httpx.Client:
+        """The shared sync client (rebuilt in a forked child)"""
+        with self._lock:
+            if self._client is None or self._client_pid != os.getpid():
+                # A forked child must not reuse the parent's sockets
+                self._client = httpx.Client(**self.config.client_kwargs(httpx.HTTPTransport))
+                self._client_pid = os.getpid()
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared async client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(**self.config.client_kwargs(httpx.AsyncHTTPTransport))
+                self._async_clients[loop] = client
+            return client
+
+    def close(self):
+        """Close the sync pool; async pools are released with their event loops"""
+        with self._lock:
+            if self._client is not None and self._client_pid == os.getpid():
+                self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Close the running loop's async pool"""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+class SharedHttpClient:
+    """HttpClient that sends through the shared sync pool"""
+
+    def __init__(self, transport: SharedTransport, owned: bool = False):
+        self.transport = transport
+        self.owned = owned
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        return self.transport.client().build_request(*args, **kwargs)
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        return self.transport.client().send(request, **kwargs)
+
+    def close(self):
+        # A shared pool outlives any one SDK instance
+        if self.owned:
+            self.transport.close()
+
+
+class AsyncSharedHttpClient:
+    """AsyncHttpClient that sends through the running loop's shared pool"""
+
+    def __init__(self, transport: SharedTransport, owned: bool = False):
+        self.transport = transport
+        self.owned = owned
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        # The generated async methods build their requests inside the event loop
+        return self.transport.async_client().build_request(*args, **kwargs)
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        return await self.transport.async_client().send(request, **kwargs)
+
+    async def aclose(self):
+        if self.owned:
+            await self.transport.aclose()
+
+
+class SharedTransportHook(SDKInitHook):
+    """
+    Swaps the SDK's default HTTP clients for pooled ones.
+
+    The pools are those of GriddyNFL(transport=...) when it is given, else
+    the process-wide transport (None when that is switched off).
+    """
+
+    def __init__(self, transport: Optional[SharedTransport]):
+        self.transport = transport
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        transport, owned = self.transport, False
+        requested = config.__dict__.get('_transport')
+        if isinstance(requested, TransportConfig):
+            transport, owned = SharedTransport(requested), True
+        elif requested is not None:
+            transport = requested
+        if transport is None:
+            return config
+
+        # Pools of the instance's own are closed with it, like the default clients
+        if not config.client_supplied:
+            if config.client is not None:
+                config.client.close()
+            config.client = SharedHttpClient(transport, owned)
+            config.client_supplied = not owned
+        if not config.async_client_supplied:
+            # The default async client hasn't opened any connections; just drop it
+            config.async_client = AsyncSharedHttpClient(transport, owned)
+            config.async_client_supplied = not owned
+        return config
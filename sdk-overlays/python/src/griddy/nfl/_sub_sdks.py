@@ -0,0 +1,109 @@
+"""
+Sub-SDKs of GriddyNFL, created on first attribute access.
+
+Generated from openapi/nfl-com-api.yaml by scripts/sub_sdks.py in
+griddy-sdk-sources; do not edit by hand.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .authentication import Authentication
+    from .betting import Betting
+    from .content import Content
+    from .content_insights import ContentInsights
+    from .defensive_pass_rush_statistics import DefensivePassRushStatistics
+    from .defensive_player_overview import DefensivePlayerOverview
+    from .defensive_statistics import DefensiveStatistics
+    from .experience import Experience
+    from .fantasy_statistics import FantasyStatistics
+    from .filmroom import Filmroom
+    from .football import Football
+    from .player_passing_statistics import PlayerPassingStatistics
+    from .player_receiving_statistics import PlayerReceivingStatistics
+    from .player_rushing_statistics import PlayerRushingStatistics
+    from .player_statistics import PlayerStatistics
+    from .players import Players
+    from .plays import Plays
+    from .schedules import Schedules
+    from .schedules_extended import SchedulesExtended
+    from .scores import Scores
+    from .season_schedule import SeasonSchedule
+    from .secured_videos import SecuredVideos
+    from .stats import Stats
+    from .team_defense_pass_statistics import TeamDefensePassStatistics
+    from .team_defense_rush_statistics import TeamDefenseRushStatistics
+    from .team_defense_statistics import TeamDefenseStatistics
+    from .team_offense_overview_statistics import TeamOffenseOverviewStatistics
+    from .team_offense_pass_statistics import TeamOffensePassStatistics
+    from .teams import Teams
+    from .win_probability import WinProbability
+
+
+class SubSDKs:
+    """Attribute declarations of the sub-SDKs"""
+
+    authentication: "Authentication"
+    betting: "Betting"
+    content: "Content"
+    content_insights: "ContentInsights"
+    defensive_pass_rush_statistics: "DefensivePassRushStatistics"
+    defensive_player_overview: "DefensivePlayerOverview"
+    defensive_statistics: "DefensiveStatistics"
+    experience: "Experience"
+    fantasy_statistics: "FantasyStatistics"
+    filmroom: "Filmroom"
+    football: "Football"
+    player_passing_statistics: "PlayerPassingStatistics"
+    player_receiving_statistics: "PlayerReceivingStatistics"
+    player_rushing_statistics: "PlayerRushingStatistics"
+    player_statistics: "PlayerStatistics"
+    players: "Players"
+    plays: "Plays"
+    schedules: "Schedules"
+    schedules_extended: "SchedulesExtended"
+    scores: "Scores"
+    season_schedule: "SeasonSchedule"
+    secured_videos: "SecuredVideos"
+    stats: "Stats"
+    team_defense_pass_statistics: "TeamDefensePassStatistics"
+    team_defense_rush_statistics: "TeamDefenseRushStatistics"
+    team_defense_statistics: "TeamDefenseStatistics"
+    team_offense_overview_statistics: "TeamOffenseOverviewStatistics"
+    team_offense_pass_statistics: "TeamOffensePassStatistics"
+    teams: "Teams"
+    win_probability: "WinProbability"
+
+
+# Attribute -> (module, class)
+SUB_SDKS = {
+    'authentication': ('griddy.nfl.authentication', 'Authentication'),
+    'betting': ('griddy.nfl.betting', 'Betting'),
+    'content': ('griddy.nfl.content', 'Content'),
+    'content_insights': ('griddy.nfl.content_insights', 'ContentInsights'),
+    'defensive_pass_rush_statistics': ('griddy.nfl.defensive_pass_rush_statistics', 'DefensivePassRushStatistics'),
+    'defensive_player_overview': ('griddy.nfl.defensive_player_overview', 'DefensivePlayerOverview'),
+    'defensive_statistics': ('griddy.nfl.defensive_statistics', 'DefensiveStatistics'),
+    'experience': ('griddy.nfl.experience', 'Experience'),
+    'fantasy_statistics': ('griddy.nfl.fantasy_statistics', 'FantasyStatistics'),
+    'filmroom': ('griddy.nfl.filmroom', 'Filmroom'),
+    'football': ('griddy.nfl.football', 'Football'),
+    'player_passing_statistics': ('griddy.nfl.player_passing_statistics', 'PlayerPassingStatistics'),
+    'player_receiving_statistics': ('griddy.nfl.player_receiving_statistics', 'PlayerReceivingStatistics'),
+    'player_rushing_statistics': ('griddy.nfl.player_rushing_statistics', 'PlayerRushingStatistics'),
+    'player_statistics': ('griddy.nfl.player_statistics', 'PlayerStatistics'),
+    'players': ('griddy.nfl.players', 'Players'),
+    'plays': ('griddy.nfl.plays', 'Plays'),
+    'schedules': ('griddy.nfl.schedules', 'Schedules'),
+    'schedules_extended': ('griddy.nfl.schedules_extended', 'SchedulesExtended'),
+    'scores': ('griddy.nfl.scores', 'Scores'),
+    'season_schedule': ('griddy.nfl.season_schedule', 'SeasonSchedule'),
+    'secured_videos': ('griddy.nfl.secured_videos', 'SecuredVideos'),
+    'stats': ('griddy.nfl.stats', 'Stats'),
+    'team_defense_pass_statistics': ('griddy.nfl.team_defense_pass_statistics', 'TeamDefensePassStatistics'),
+    'team_defense_rush_statistics': ('griddy.nfl.team_defense_rush_statistics', 'TeamDefenseRushStatistics'),
+    'team_defense_statistics': ('griddy.nfl.team_defense_statistics', 'TeamDefenseStatistics'),
+    'team_offense_overview_statistics': ('griddy.nfl.team_offense_overview_statistics', 'TeamOffenseOverviewStatistics'),
+    'team_offense_pass_statistics': ('griddy.nfl.team_offense_pass_statistics', 'TeamOffensePassStatistics'),
+    'teams': ('griddy.nfl.teams', 'Teams'),
+    'win_probability': ('griddy.nfl.win_probability', 'WinProbability'),
+}
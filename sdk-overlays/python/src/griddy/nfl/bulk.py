@@ -0,0 +1,227 @@
+"""
+Concurrent bulk fetching of per-game endpoints.
+
+Building a week (or backfilling a season) means one schedule call followed by
+several calls per game. Made one at a time that takes hours; `bulk_fetch`
+runs them on the async SDK with a bounded number of requests in flight, over
+the SDK's single pooled HTTP client, and yields each result as soon as it
+completes:
+
+    import asyncio
+    from griddy.nfl import GriddyNFL
+    from griddy.nfl.bulk import bulk_fetch, games_for_weeks, pooled_sdk
+
+    async def main():
+        async with pooled_sdk(nfl_auth=token, max_connections=32) as sdk:
+            games = await games_for_weeks(sdk, season=2025, season_type='REG', weeks=range(1, 19))
+            async for result in bulk_fetch(sdk, games, concurrency=32):
+                if result.ok:
+                    store(result.game.id, result.endpoint, result.value)
+                else:
+                    log.warning("%s %s failed: %r", result.game.id, result.endpoint, result.error)
+
+    asyncio.run(main())
+
+A failed call produces a BulkResult with `error` set; the rest of the batch
+carries on. Results arrive in completion order, not input order.
+
+The football/v2 endpoints identify games by UUID (`Game.id`), while
+/api/stats/* use the legacy 10-digit id (e.g. 2025092800). `GameRef` carries
+both; `games_for_week` fills in the legacy id from the game's external ids
+when it is there.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import httpx
+
+from .sdk import GriddyNFL
+
+
+@dataclass(frozen=True)
+class GameRef:
+    """A game, identified by its football/v2 UUID and (optionally) its legacy id"""
+
+    id: Optional[str]
+    legacy_id: Optional[str] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def of(cls, game: Union[str, 'GameRef']) -> 'GameRef':
+        """Accept a GameRef, a UUID, or a legacy numeric id"""
+        if isinstance(game, GameRef):
+            return game
+        game = str(game)
+        return cls(None, game) if game.isdigit() else cls(game)
+
+
+@dataclass
+class BulkResult:
+    """The outcome of one endpoint call for one game"""
+
+    game: GameRef
+    endpoint: str
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _require(value: Optional[str], kind: str, game: GameRef) -> str:
+    if not value:
+        raise ValueError(f"{game} has no {kind} game id")
+    return value
+
+
+# Endpoint name -> coroutine fetching it for one game
+Fetcher = Callable[[GriddyNFL, GameRef], Awaitable[Any]]
+
+ENDPOINTS: Dict[str, Fetcher] = {
+    'boxscore': lambda sdk, game: sdk.football.get_football_box_score_async(
+        game_id=_require(game.id, 'UUID', game)),
+    'playbyplay': lambda sdk, game: sdk.football.get_play_by_play_async(
+        game_id=_require(game.id, 'UUID', game)),
+    'gamecenter': lambda sdk, game: sdk.stats.get_gamecenter_async(
+        game_id=_require(game.legacy_id, 'legacy', game)),
+    'winprobability': lambda sdk, game: sdk.win_probability.get_plays_win_probability_async(
+        game_id=_require(game.legacy_id, 'legacy', game)),
+}
+
+DEFAULT_ENDPOINTS = ('boxscore', 'playbyplay', 'gamecenter')
+
+
+@asynccontextmanager
+async def pooled_sdk(max_connections: int = 32, **sdk_kwargs) -> AsyncIterator[GriddyNFL]:
+    """
+    Create a GriddyNFL whose async client keeps up to max_connections pooled connections.
+
+    Args:
+        max_connections: Connection pool size; match it to bulk_fetch's concurrency
+        **sdk_kwargs: Passed to GriddyNFL (e.g. nfl_auth)
+
+    Yields:
+        The SDK instance; its client is closed on exit
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    async with httpx.AsyncClient(limits=limits) as client:
+        yield GriddyNFL(async_client=client, **sdk_kwargs)
+
+
+def _legacy_id(game: Any) -> Optional[str]:
+    """Find the 10-digit legacy game id among a Game's external ids"""
+    for external_id in getattr(game, 'external_ids', None) or []:
+        value = str(getattr(external_id, 'id', '') or '')
+        if len(value) == 10 and value.isdigit():
+            return value
+    return None
+
+
+async def games_for_week(sdk: GriddyNFL, season: int, season_type: str, week: int) -> List[GameRef]:
+    """
+    List the games of one week.
+
+    Args:
+        sdk: SDK instance
+        season: Season year
+        season_type: PRE, REG or POST
+        week: Week number
+
+    Returns:
+        GameRefs for every game in the week
+    """
+    response = await sdk.football.get_football_games_async(
+        season=season, season_type=season_type, week=week, with_external_ids=True
+    )
+    return [
+        GameRef(str(game.id), _legacy_id(game), getattr(game.status, 'value', game.status))
+        for game in response.games or []
+    ]
+
+
+async def games_for_weeks(
+        sdk: GriddyNFL,
+        season: int,
+        season_type: str,
+        weeks: Iterable[int],
+) -> List[GameRef]:
+    """List the games of several weeks, fetching the weeks concurrently"""
+    schedules = await asyncio.gather(*(games_for_week(sdk, season, season_type, week) for week in weeks))
+    return [game for schedule in schedules for game in schedule]
+
+
+async def bulk_fetch(
+        sdk: GriddyNFL,
+        games: Iterable[Union[str, GameRef]],
+        endpoints: Sequence[str] = DEFAULT_ENDPOINTS,
+        concurrency: int = 16,
+        fetchers: Optional[Dict[str, Fetcher]] = None,
+) -> AsyncIterator[BulkResult]:
+    """
+    Fetch several endpoints for many games, yielding results as they complete.
+
+    At most `concurrency` calls are in flight at once. Work is handed to a
+    fixed pool of workers, so memory stays flat however many games are
+    requested. Leaving the loop early cancels the outstanding calls.
+
+    Args:
+        sdk: SDK instance (see pooled_sdk for a suitably sized connection pool)
+        games: Game UUIDs, legacy ids or GameRefs
+        endpoints: Names from ENDPOINTS (or fetchers) to call for each game
+        concurrency: Maximum number of calls in flight
+        fetchers: Extra or replacement endpoint fetchers, by name
+
+    Yields:
+        One BulkResult per (game, endpoint)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    table = {**ENDPOINTS, **(fetchers or {})}
+    unknown = [name for name in endpoints if name not in table]
+    if unknown:
+        raise ValueError(f"Unknown endpoint(s): {', '.join(unknown)}")
+
+    work = ((GameRef.of(game), name) for game in games for name in endpoints)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    done = object()
+
+    async def worker():
+        for game, name in work:
+            try:
+                value = await table[name](sdk, game)
+            except Exception as e:
+                await results.put(BulkResult(game, name, error=e))
+            else:
+                await results.put(BulkResult(game, name, value))
+        await results.put(done)
+
+    # Workers share one generator, so each (game, endpoint) is taken exactly once
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    remaining = len(workers)
+    try:
+        while remaining:
+            item = await results.get()
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def bulk_fetch_sync(
+        sdk: GriddyNFL,
+        games: Iterable[Union[str, GameRef]],
+        endpoints: Sequence[str] = DEFAULT_ENDPOINTS,
+        concurrency: int = 16,
+) -> List[BulkResult]:
+    """Run bulk_fetch from synchronous code and return every result (in completion order)"""
+    async def collect():
+        return [result async for result in bulk_fetch(sdk, games, endpoints, concurrency)]
+
+    return asyncio.run(collect())
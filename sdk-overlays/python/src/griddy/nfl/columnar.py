@@ -0,0 +1,374 @@
+"""
+Columnar (Arrow / NumPy) export of the paginated stats operations.
+
+The stats endpoints return pages of flat-ish rows (one per player or team),
+which the generated methods validate into a model object per row, only for
+analytics code to pull the fields straight back out into a DataFrame. The
+functions here fetch every page of an operation through the same generated
+method (so auth, hooks and retries are unchanged) but skip the models: each
+page is decoded with json.loads and turned directly into one Arrow record
+batch or into a slice of one NumPy structured array:
+
+    from griddy.nfl.columnar import fetch_arrow, fetch_numpy
+
+    passing = sdk.player_statistics.get_player_passing_stats_by_season
+
+    table = fetch_arrow(passing, season=2025, season_type='REG')
+    frame = table.to_pandas()
+
+    passers = fetch_numpy(passing, season=2025, season_type='REG')
+    passers['yds'].mean()
+
+Columns and their types come from openapi/nfl-com-api.yaml via the generated
+_columnar_schemas module (scripts/columnar_schemas.py). Nested objects are
+flattened into dotted names (`player.displayName`); free-form objects such as
+the `stats` of get_season_player_stats become one column per key seen on the
+first page.
+
+Pages are combined without copying: the Arrow table is made of the pages'
+record batches, and the NumPy array is allocated once from the response's
+`total` and filled page by page. Missing values are nulls in Arrow; NumPy
+has no nulls, so they become NaN (float64), INT64_NA (int64), False (bool)
+or None (string).
+
+pyarrow and numpy are optional: install whichever of them you use.
+`afetch_arrow` and `afetch_numpy` take the SDK's *_async methods.
+"""
+import json
+import math
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ._columnar_schemas import COLUMNAR_SCHEMAS
+from .lazy import alazy_call, lazy_call, to_camel
+
+# Fills missing int64 values in NumPy output
+INT64_NA = -2 ** 63
+
+DEFAULT_PAGE_SIZE = 100
+
+# (name, key path, type)
+Column = Tuple[str, Tuple[str, ...], str]
+
+
+def _require(module: str):
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(f"griddy.nfl.columnar needs {module} for this output; pip install {module}") from e
+
+
+def operation_id(method: Callable) -> str:
+    """The operationId behind a generated method (get_player_passing_stats_by_season_async -> getPlayerPassing...)"""
+    name = getattr(method, '__name__', '')
+    if name.endswith('_async'):
+        name = name[:-len('_async')]
+    return to_camel(name)
+
+
+def layout(operation: str) -> Dict[str, Any]:
+    """The generated column layout of an operation, by operationId"""
+    try:
+        return COLUMNAR_SCHEMAS[operation]
+    except KeyError:
+        raise ValueError(
+            f"{operation} has no columnar layout; supported operations: {', '.join(COLUMNAR_SCHEMAS)}"
+        ) from None
+
+
+def _get(value: Any, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _infer(values: List[Any]) -> str:
+    kinds = {type(value) for value in values if value is not None}
+    if kinds == {bool}:
+        return 'bool'
+    if kinds and kinds <= {int, float}:
+        return 'float64' if float in kinds else 'int64'
+    return 'string'
+
+
+def columns_for(spec: Dict[str, Any], rows: List[Dict[str, Any]]) -> List[Column]:
+    """
+    The columns of an operation's output.
+
+    The layout's own columns, plus one column per key found under its
+    free-form maps in `rows` (normally the first page).
+
+    Args:
+        spec: The operation's layout (see layout())
+        rows: Decoded rows used to discover map keys
+
+    Returns:
+        (name, key path, type) for every column, in output order
+    """
+    columns = [(name, tuple(path), kind) for name, path, kind in spec['columns']]
+    for prefix in spec.get('maps', ()):
+        prefix = tuple(prefix)
+        keys: Dict[str, None] = {}
+        for row in rows:
+            mapping = _get(row, prefix)
+            if isinstance(mapping, dict):
+                keys.update(dict.fromkeys(mapping))
+        for key in keys:
+            path = prefix + (key,)
+            columns.append(('.'.join(path), path, _infer([_get(row, path) for row in rows])))
+    return columns
+
+
+# ----------------------------------------------------------------------
+# Page -> columns
+# ----------------------------------------------------------------------
+
+
+def _coerce(values: List[Any], kind: str) -> List[Any]:
+    """Best-effort conversion of values that don't match their column type (e.g. "12" in an int64 column)"""
+    def convert(value):
+        if value is None:
+            return None
+        try:
+            if kind == 'int64':
+                number = float(value)
+                return int(number) if number.is_integer() else None
+            if kind == 'float64':
+                return float(value)
+            if kind == 'bool':
+                return value if isinstance(value, bool) else str(value).lower() in ('true', '1')
+            return value if isinstance(value, str) else json.dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    return [convert(value) for value in values]
+
+
+def record_batch(rows: List[Dict[str, Any]], columns: List[Column]):
+    """Build a pyarrow.RecordBatch from decoded rows"""
+    pa = _require('pyarrow')
+    types = {'int64': pa.int64(), 'float64': pa.float64(), 'bool': pa.bool_(), 'string': pa.string()}
+    arrays = []
+    for _, path, kind in columns:
+        values = [_get(row, path) for row in rows]
+        try:
+            arrays.append(pa.array(values, type=types[kind]))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array(_coerce(values, kind), type=types[kind]))
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(
+        [pa.field(name, types[kind]) for name, _, kind in columns]
+    ))
+
+
+def numpy_dtype(columns: List[Column]):
+    """The structured dtype for columns (strings are Python objects)"""
+    np = _require('numpy')
+    codes = {'int64': 'i8', 'float64': 'f8', 'bool': '?', 'string': 'O'}
+    return np.dtype([(name, codes[kind]) for name, _, kind in columns])
+
+
+def fill_structured(rows: List[Dict[str, Any]], columns: List[Column], out) -> None:
+    """Write decoded rows into a structured array (or slice of one) of numpy_dtype(columns)"""
+    np = _require('numpy')
+    for name, path, kind in columns:
+        values = [_get(row, path) for row in rows]
+        if kind == 'string':
+            out[name] = _coerce(values, kind)
+            continue
+        if kind == 'int64':
+            values = [INT64_NA if value is None else value for value in values]
+        elif kind == 'bool':
+            values = [bool(value) for value in _coerce(values, kind)]
+        try:
+            out[name] = np.asarray(values, dtype=out.dtype[name])
+        except (TypeError, ValueError, OverflowError):
+            values = _coerce(values, kind)
+            default = {'int64': INT64_NA, 'float64': math.nan, 'bool': False}[kind]
+            out[name] = np.asarray([default if value is None else value for value in values], dtype=out.dtype[name])
+
+
+# ----------------------------------------------------------------------
+# Paging
+# ----------------------------------------------------------------------
+
+
+class _Pager:
+    """Offset/limit bookkeeping shared by the sync and async page loops"""
+
+    def __init__(self, method: Callable, page_size: int, kwargs: Dict[str, Any]):
+        self.spec = layout(operation_id(method))
+        self.kwargs = dict(kwargs)
+        self.limit = self.kwargs.pop('limit', page_size)
+        self.offset = self.kwargs.pop('offset', 0) or 0
+        self.total: Optional[int] = None
+        self.done = False
+
+    def params(self) -> Dict[str, Any]:
+        return {**self.kwargs, 'offset': self.offset, 'limit': self.limit}
+
+    def rows(self, body: bytes) -> List[Dict[str, Any]]:
+        """Decode one page; advances the offset and records the total"""
+        payload = json.loads(body)
+        rows = payload.get(self.spec['results']) or []
+        total = _get(payload, tuple(self.spec['total'] or ()))
+        if isinstance(total, int):
+            self.total = total
+        self.offset += len(rows)
+        self.done = (
+            not rows
+            or len(rows) < self.limit
+            or (self.total is not None and self.offset >= self.total)
+        )
+        return rows
+
+
+def iter_pages(method: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs) -> Iterator[Tuple[List[Dict], _Pager]]:
+    """
+    Fetch every page of a stats operation, yielding its decoded rows.
+
+    Args:
+        method: A generated sync stats method, e.g.
+            sdk.player_statistics.get_player_passing_stats_by_season
+        page_size: Rows per request, unless `limit` is passed
+        **kwargs: The method's arguments; `offset` sets the first row
+
+    Yields:
+        (rows, pager) per page; pager.total is the row count the API reported
+    """
+    pager = _Pager(method, page_size, kwargs)
+    while True:
+        with lazy_call(method, **pager.params()) as response:
+            rows = pager.rows(response.http_response.read())
+        yield rows, pager
+        if pager.done:
+            return
+
+
+async def aiter_pages(
+        method: Callable,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **kwargs,
+) -> AsyncIterator[Tuple[List[Dict], _Pager]]:
+    """Async version of iter_pages, for the SDK's *_async methods"""
+    pager = _Pager(method, page_size, kwargs)
+    while True:
+        async with await alazy_call(method, **pager.params()) as response:
+            rows = pager.rows(await response.http_response.aread())
+        yield rows, pager
+        if pager.done:
+            return
+
+
+# ----------------------------------------------------------------------
+# Collectors
+# ----------------------------------------------------------------------
+
+
+class _ArrowCollector:
+    def __init__(self):
+        self.columns: Optional[List[Column]] = None
+        self.batches = []
+
+    def add(self, rows: List[Dict], pager: _Pager):
+        if self.columns is None:
+            self.columns = columns_for(pager.spec, rows)
+        if rows:
+            self.batches.append(record_batch(rows, self.columns))
+
+    def result(self, pager: _Pager):
+        pa = _require('pyarrow')
+        # The table references the batches' buffers; nothing is copied
+        schema = self.batches[0].schema if self.batches else record_batch([], self.columns).schema
+        return pa.Table.from_batches(self.batches, schema=schema)
+
+
+class _NumpyCollector:
+    def __init__(self):
+        self.columns: Optional[List[Column]] = None
+        self.out = None
+        self.filled = 0
+        self.chunks = []
+
+    def add(self, rows: List[Dict], pager: _Pager):
+        np = _require('numpy')
+        if self.columns is None:
+            self.columns = columns_for(pager.spec, rows)
+            # Allocate the whole result up front when the API says how many rows are coming
+            if pager.total is not None and not pager.done:
+                self.out = np.empty(max(pager.total - (pager.offset - len(rows)), len(rows)),
+                                    dtype=numpy_dtype(self.columns))
+        end = self.filled + len(rows)
+        if self.out is not None and end <= len(self.out):
+            fill_structured(rows, self.columns, self.out[self.filled:end])
+            self.filled = end
+            return
+        chunk = np.empty(len(rows), dtype=numpy_dtype(self.columns))
+        fill_structured(rows, self.columns, chunk)
+        self.chunks.append(chunk)
+
+    def result(self, pager: _Pager):
+        np = _require('numpy')
+        parts = ([self.out[:self.filled]] if self.out is not None else []) + self.chunks
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return np.empty(0, dtype=numpy_dtype(self.columns))
+        # Only when the total was unknown or wrong
+        return np.concatenate(parts)
+
+
+def _collect(collector, method: Callable, page_size: int, kwargs: Dict[str, Any]):
+    pager = None
+    for rows, pager in iter_pages(method, page_size, **kwargs):
+        collector.add(rows, pager)
+    return collector.result(pager)
+
+
+async def _acollect(collector, method: Callable, page_size: int, kwargs: Dict[str, Any]):
+    pager = None
+    async for rows, pager in aiter_pages(method, page_size, **kwargs):
+        collector.add(rows, pager)
+    return collector.result(pager)
+
+
+def fetch_arrow(method: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs):
+    """
+    Fetch every page of a stats operation as a pyarrow.Table.
+
+    Args:
+        method: A generated sync stats method, e.g.
+            sdk.player_statistics.get_player_passing_stats_by_season
+        page_size: Rows per request, unless `limit` is passed
+        **kwargs: The method's arguments
+
+    Returns:
+        A Table with one record batch per page
+    """
+    return _collect(_ArrowCollector(), method, page_size, kwargs)
+
+
+def fetch_numpy(method: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs):
+    """
+    Fetch every page of a stats operation as a NumPy structured array.
+
+    Args:
+        method: A generated sync stats method, e.g.
+            sdk.player_statistics.get_player_passing_stats_by_season
+        page_size: Rows per request, unless `limit` is passed
+        **kwargs: The method's arguments
+
+    Returns:
+        One structured array with a field per column
+    """
+    return _collect(_NumpyCollector(), method, page_size, kwargs)
+
+
+async def afetch_arrow(method: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs):
+    """Async version of fetch_arrow"""
+    return await _acollect(_ArrowCollector(), method, page_size, kwargs)
+
+
+async def afetch_numpy(method: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs):
+    """Async version of fetch_numpy"""
+    return await _acollect(_NumpyCollector(), method, page_size, kwargs)
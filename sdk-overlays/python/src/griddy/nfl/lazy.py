@@ -0,0 +1,593 @@
+"""
+Lazy, validation-on-access responses for very large payloads.
+
+The generated methods validate a whole response into nested models before
+returning, which for weekly-game-details (~490 KB, 14 games with 50+ field
+replays each) costs far more than the network round trip when the caller only
+needs the scores. `lazy_call` runs the same generated method, through the same
+hooks, auth and retries, but stops before validation and returns a
+`LazyResponse`:
+
+    from griddy.nfl.lazy import lazy_call
+
+    response = lazy_call(sdk.football.get_weekly_game_details, season=2025, type='REG', week=5)
+    for game in response.view:
+        print(game.id, game.summary.home_team.score.total)   # validates just these leaves
+
+Views behave like the models they stand in for: attributes use the models'
+snake_case names, nested objects come back as further views, and a leaf is
+validated against its field's type only when it is read. `.validate()` turns
+any view into the full model when one is really needed.
+For paginated methods the view is the page's body (the `result` of the
+wrapper the method returns); call the method again for further pages.
+
+Large arrays can be stream-parsed instead, one element at a time, without
+decoding the rest of the document:
+
+    with lazy_call(sdk.football.get_weekly_game_details, stream=True, season=2025,
+                   type='REG', week=5) as response:
+        for replay in response.iter_items('*', 'replays'):
+            print(replay.title)
+
+`'*'` stands for every element of an array. Error responses are left to the
+generated method, which raises its usual exceptions.
+
+The capture is done by `RawResponseHook` (registered in registration.py, needs
+`sdkHooksConfigAccess: true` in gen.yaml); `alazy_call` is the async version.
+"""
+import json
+import codecs
+import typing
+import contextvars
+import collections.abc
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import httpx
+
+from .httpclient import AsyncHttpClient, HttpClient
+from .sdkconfiguration import SDKConfiguration
+from ._hooks.types import SDKInitHook
+
+# ----------------------------------------------------------------------
+# Model introspection
+# ----------------------------------------------------------------------
+
+
+def to_camel(name: str) -> str:
+    """snake_case attribute name -> camelCase JSON key"""
+    head, *rest = name.split('_')
+    return head + ''.join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and hasattr(annotation, 'model_fields')
+
+
+def _shape(annotation: Any) -> Tuple[Optional[str], Any]:
+    """
+    Classify a field annotation.
+
+    Returns:
+        ('model', Model), ('list', item annotation) or (None, annotation) for
+        leaves; Annotated, Optional and OptionalNullable wrappers are removed
+    """
+    try:
+        return _cached_shape(annotation)
+    except TypeError:
+        # Unhashable annotation metadata
+        return _classify(annotation)
+
+
+def _classify(annotation: Any) -> Tuple[Optional[str], Any]:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _shape(typing.get_args(annotation)[0])
+    if origin is Union:
+        members = [
+            arg for arg in typing.get_args(annotation)
+            if arg is not type(None) and getattr(arg, '__name__', None) != 'Unset'
+        ]
+        return _shape(members[0]) if len(members) == 1 else (None, annotation)
+    if origin in (list, typing.List, Sequence):
+        args = typing.get_args(annotation)
+        return 'list', args[0] if args else Any
+    if _is_model(annotation):
+        return 'model', annotation
+    return None, annotation
+
+
+_cached_shape = lru_cache(maxsize=None)(_classify)
+
+
+@lru_cache(maxsize=None)
+def _fields(model: type) -> Dict[str, Tuple[str, Any]]:
+    """Map a model's attribute names to (JSON key, annotation)"""
+    return {
+        name: (info.alias or name, info.annotation)
+        for name, info in model.model_fields.items()
+    }
+
+
+def _adapter(annotation: Any):
+    try:
+        return _cached_adapter(annotation)
+    except TypeError:
+        from pydantic import TypeAdapter
+        return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def _cached_adapter(annotation: Any):
+    from pydantic import TypeAdapter
+    return TypeAdapter(annotation)
+
+
+def wrap(value: Any, annotation: Any = None) -> Any:
+    """Wrap decoded JSON in a view for `annotation` (a model, List[...] or leaf type)"""
+    kind, target = _shape(annotation) if annotation is not None else (None, None)
+    if isinstance(value, dict) and (kind == 'model' or annotation is None):
+        return LazyObject(value, target if kind == 'model' else None)
+    if isinstance(value, list) and (kind == 'list' or annotation is None):
+        return LazyList(value, target if kind == 'list' else None)
+    if annotation is None or value is None:
+        return value
+    return _adapter(annotation).validate_python(value)
+
+
+class LazyObject(Mapping):
+    """A JSON object that decodes and validates its members on access"""
+
+    __slots__ = ('_data', '_model')
+
+    def __init__(self, data: Dict[str, Any], model: Optional[type] = None):
+        self._data = data
+        self._model = model
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if self._model is not None:
+            field = _fields(self._model).get(name)
+            if field is None:
+                raise AttributeError(f"{self._model.__name__} has no field {name!r}")
+            key, annotation = field
+            return wrap(self._data.get(key), annotation)
+        key = name if name in self._data else to_camel(name)
+        if key not in self._data:
+            raise AttributeError(name)
+        return wrap(self._data[key])
+
+    def __getitem__(self, key: str) -> Any:
+        """Raw JSON key access; values are wrapped but not validated"""
+        return wrap(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        name = self._model.__name__ if self._model is not None else 'object'
+        return f"<LazyObject {name} keys={list(self._data)[:8]}>"
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The decoded JSON behind this view"""
+        return self._data
+
+    def validate(self, model: Optional[type] = None) -> Any:
+        """Validate this object into its full model"""
+        model = model or self._model
+        if model is None:
+            raise TypeError("This view has no model; pass one to validate()")
+        return model.model_validate(self._data)
+
+
+class LazyList(Sequence):
+    """A JSON array whose elements are wrapped as they are read"""
+
+    __slots__ = ('_data', '_item')
+
+    def __init__(self, data: list, item: Any = None):
+        self._data = data
+        self._item = item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyList(self._data[index], self._item)
+        return wrap(self._data[index], self._item)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<LazyList len={len(self._data)}>"
+
+    @property
+    def raw(self) -> list:
+        return self._data
+
+    def validate(self) -> list:
+        """Validate every element into its full model"""
+        if self._item is None:
+            raise TypeError("This view has no item type to validate against")
+        return _adapter(typing.List[self._item]).validate_python(self._data)
+
+
+def loads(content: Union[str, bytes], annotation: Any = None) -> Any:
+    """Decode a JSON document into a lazy view (no validation happens here)"""
+    return wrap(json.loads(content), annotation)
+
+
+# ----------------------------------------------------------------------
+# Streaming arrays
+# ----------------------------------------------------------------------
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can continue a JSON number
+_NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+
+class _Scanner:
+    """Walks a JSON document arriving in chunks, decoding only the values asked for"""
+
+    def __init__(self):
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str):
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        """Skip whitespace; return the next character, or None if more input is needed"""
+        while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+            self.pos += 1
+        return self.buf[self.pos] if self.pos < len(self.buf) else None
+
+    def value(self) -> Tuple[bool, Any]:
+        """Decode the next value; (False, None) if it isn't complete yet"""
+        try:
+            value, end = self._decoder.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            if self.eof:
+                raise
+            return False, None
+        if not self.eof and (end == len(self.buf) or self.buf[end] in _NUMBER_CHARS):
+            # A number (or literal) at the end of the buffer may continue in the next chunk, and one cut
+            # short inside a fraction or exponent (`1.`, `2e`) decodes as its integer part: wait until
+            # the character after it shows where it really ends
+            return False, None
+        self.pos = end
+        return True, value
+
+
+def _walk(path: Tuple[str, ...]):
+    """
+    Coroutine driving a _Scanner to the arrays at `path`.
+
+    Yields 'more' when the scanner needs input, or ('item', value) for each
+    element of a target array.
+    """
+    scanner = yield
+
+    def need():
+        while True:
+            nxt = scanner.peek()
+            if nxt is not None:
+                return nxt
+            yield 'more'
+
+    def read_value():
+        while True:
+            yield from need()
+            done, value = scanner.value()
+            if done:
+                return value
+            yield 'more'
+
+    def walk(rest):
+        first = yield from need()
+        if first != ('[' if not rest or rest[0] == '*' else '{'):
+            # null, a scalar or an unexpected shape: nothing to yield here
+            yield from read_value()
+            return
+        scanner.pos += 1
+        closing = ']' if first == '[' else '}'
+        if (yield from need()) == closing:
+            scanner.pos += 1
+            return
+        while True:
+            if first == '[':
+                if rest:
+                    yield from walk(rest[1:])
+                else:
+                    yield ('item', (yield from read_value()))
+            else:
+                key = yield from read_value()
+                yield from need()
+                scanner.pos += 1  # ':'
+                if key == rest[0]:
+                    yield from walk(rest[1:])
+                else:
+                    yield from read_value()
+            separator = yield from need()
+            scanner.pos += 1
+            if separator == closing:
+                return
+
+    yield from walk(tuple(path))
+
+
+def _iter_texts(chunks: Iterable[Union[bytes, str]]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def iter_array(chunks: Iterable[Union[bytes, str]], *path: str, item: Any = None) -> Iterator[Any]:
+    """
+    Yield the elements of the array(s) at `path` while the document is still being read.
+
+    Args:
+        chunks: The document, in byte or text chunks (e.g. response.iter_bytes())
+        *path: Object keys leading to the array; '*' steps into every element of an array.
+               No path means the document itself is the array.
+        item: Annotation the elements are wrapped with (see wrap)
+
+    Yields:
+        Each element, as a lazy view
+    """
+    scanner = _Scanner()
+    walker = _walk(path)
+    next(walker)
+    texts = _iter_texts(chunks)
+    step = walker.send(scanner)
+    while True:
+        if step == 'more':
+            if scanner.eof:
+                raise ValueError("JSON document ended early")
+            text = next(texts, None)
+            if text is None:
+                scanner.eof = True
+            else:
+                scanner.feed(text)
+        else:
+            yield wrap(step[1], item)
+        try:
+            step = next(walker)
+        except StopIteration:
+            return
+
+
+async def aiter_array(chunks: AsyncIterable[Union[bytes, str]], *path: str, item: Any = None) -> AsyncIterator[Any]:
+    """Async version of iter_array, for response.aiter_bytes()"""
+    scanner = _Scanner()
+    walker = _walk(path)
+    next(walker)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunk_iter = chunks.__aiter__()
+    step = walker.send(scanner)
+    while True:
+        if step == 'more':
+            if scanner.eof:
+                raise ValueError("JSON document ended early")
+            try:
+                chunk = await chunk_iter.__anext__()
+            except StopAsyncIteration:
+                scanner.feed(decoder.decode(b'', final=True))
+                scanner.eof = True
+            else:
+                scanner.feed(chunk if isinstance(chunk, str) else decoder.decode(chunk))
+        else:
+            yield wrap(step[1], item)
+        try:
+            step = next(walker)
+        except StopIteration:
+            return
+
+
+# ----------------------------------------------------------------------
+# Per-call capture
+# ----------------------------------------------------------------------
+
+
+class ResponseCaptured(Exception):
+    """Raised through the generated method once the raw response has been captured"""
+
+
+class _Capture:
+    __slots__ = ('stream', 'response')
+
+    def __init__(self, stream: bool):
+        self.stream = stream
+        self.response: Optional[httpx.Response] = None
+
+
+_capture: contextvars.ContextVar[Optional[_Capture]] = contextvars.ContextVar('griddy_raw_capture', default=None)
+
+
+def _item_annotation(annotation: Any, path: Tuple[str, ...]) -> Any:
+    """Follow `path` through the response annotation to the type of the array's items"""
+    for key in path + ('*',):
+        kind, target = _shape(annotation) if annotation is not None else (None, None)
+        if key == '*' and kind == 'list':
+            annotation = target
+        elif key != '*' and kind == 'model':
+            annotation = next((a for k, a in _fields(target).values() if k == key), None)
+        else:
+            return None
+    return annotation
+
+
+class LazyResponse:
+    """A successful response captured before validation"""
+
+    def __init__(self, http_response: httpx.Response, annotation: Any = None):
+        self.http_response = http_response
+        self.annotation = annotation
+        self._view = None
+
+    @property
+    def status_code(self) -> int:
+        return self.http_response.status_code
+
+    @property
+    def view(self) -> Any:
+        """The whole body as a lazy view (reads the body if streaming)"""
+        if self._view is None:
+            self._view = loads(self.http_response.read(), self.annotation)
+        return self._view
+
+    def validate(self) -> Any:
+        """Validate the whole body, as the generated method would have"""
+        return _adapter(self.annotation).validate_json(self.http_response.read())
+
+    def iter_items(self, *path: str) -> Iterator[Any]:
+        """Stream the elements of the array(s) at `path` (see iter_array)"""
+        return iter_array(self.http_response.iter_bytes(), *path, item=_item_annotation(self.annotation, path))
+
+    def aiter_items(self, *path: str) -> AsyncIterator[Any]:
+        return aiter_array(self.http_response.aiter_bytes(), *path, item=_item_annotation(self.annotation, path))
+
+    def close(self):
+        self.http_response.close()
+
+    async def aclose(self):
+        await self.http_response.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+def _page_result(annotation: Any) -> Any:
+    """
+    The body annotation behind Speakeasy's page wrapper.
+
+    Paginated methods return a model holding the validated body in `result`
+    and a `next` callable for the following page; the response body itself
+    is the `result` type. Other annotations are returned unchanged.
+    """
+    kind, target = _shape(annotation)
+    if kind == 'model':
+        fields = target.model_fields
+        if 'result' in fields and 'next' in fields and \
+                typing.get_origin(fields['next'].annotation) is collections.abc.Callable:
+            return fields['result'].annotation
+    return annotation
+
+
+def _return_annotation(method: Callable) -> Any:
+    try:
+        annotation = typing.get_type_hints(method).get('return')
+    except Exception:
+        return None
+    return None if annotation is None else _page_result(annotation)
+
+
+def lazy_call(method: Callable, *args, stream: bool = False, **kwargs) -> LazyResponse:
+    """
+    Call a generated SDK method, returning its response unvalidated.
+
+    Args:
+        method: A bound sync SDK method, e.g. sdk.football.get_weekly_game_details
+        stream: Leave the body unread, for iter_items; close the response when done
+        *args, **kwargs: The method's arguments
+
+    Returns:
+        LazyResponse for the 2xx response (errors raise as the method normally does)
+    """
+    capture = _Capture(stream)
+    reset = _capture.set(capture)
+    try:
+        method(*args, **kwargs)
+    except ResponseCaptured:
+        return LazyResponse(capture.response, _return_annotation(method))
+    finally:
+        _capture.reset(reset)
+    raise RuntimeError(f"{getattr(method, '__name__', method)} returned without sending a request through "
+                       "the raw response hook; is it registered?")
+
+
+async def alazy_call(method: Callable, *args, stream: bool = False, **kwargs) -> LazyResponse:
+    """Async version of lazy_call, for the SDK's *_async methods"""
+    capture = _Capture(stream)
+    reset = _capture.set(capture)
+    try:
+        await method(*args, **kwargs)
+    except ResponseCaptured:
+        return LazyResponse(capture.response, _return_annotation(method))
+    finally:
+        _capture.reset(reset)
+    raise RuntimeError(f"{getattr(method, '__name__', method)} returned without sending a request through "
+                       "the raw response hook; is it registered?")
+
+
+class CapturingHttpClient:
+    """HttpClient wrapper that hands 2xx responses to an active lazy_call"""
+
+    def __init__(self, client: HttpClient):
+        self._client = client
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        capture = _capture.get()
+        if capture is None or capture.response is not None:
+            return self._client.send(request, **kwargs)
+        kwargs['stream'] = capture.stream
+        response = self._client.send(request, **kwargs)
+        if not 200 <= response.status_code < 300:
+            response.read()
+            return response
+        capture.response = response
+        raise ResponseCaptured()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class AsyncCapturingHttpClient:
+    """AsyncHttpClient wrapper that hands 2xx responses to an active alazy_call"""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        capture = _capture.get()
+        if capture is None or capture.response is not None:
+            return await self._client.send(request, **kwargs)
+        kwargs['stream'] = capture.stream
+        response = await self._client.send(request, **kwargs)
+        if not 200 <= response.status_code < 300:
+            await response.aread()
+            return response
+        capture.response = response
+        raise ResponseCaptured()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class RawResponseHook(SDKInitHook):
+    """Lets lazy_call/alazy_call capture responses before the SDK validates them"""
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if config.client is not None and not isinstance(config.client, CapturingHttpClient):
+            config.client = CapturingHttpClient(config.client)
+        if config.async_client is not None and not isinstance(config.async_client, AsyncCapturingHttpClient):
+            config.async_client = AsyncCapturingHttpClient(config.async_client)
+        return config
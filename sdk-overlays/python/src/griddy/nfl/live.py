@@ -0,0 +1,262 @@
+"""
+Delta polling for live scores and live game summaries.
+
+During game windows `/api/scores/live/games` (getLiveGameScores) and
+`/football/v2/stats/live/game-summaries` (getLiveGameStats) are polled every
+few seconds, yet between two polls most games don't change at all. A
+`LivePoller` keeps the last snapshot of every game and emits only what
+changed, as `GameDelta`s listing the changed fields:
+
+    from griddy.nfl.live import LivePoller
+
+    poller = LivePoller(sdk, season=2025, season_type='REG', week=5)
+    for deltas in poller:                  # or: async for deltas in poller
+        for delta in deltas:
+            for change in delta.changes:
+                print(delta.game_id, '.'.join(change.path), change.old, '->', change.new)
+
+The first poll reports every game as 'added'. The poll interval follows the
+state of the week's games: fast while any game is in play, slower when the
+live games are at halftime or not started yet, and slowest when every game is
+final (iteration stops then, unless `stop_when_final=False`).
+"""
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from .sdk import GriddyNFL
+
+# Game states, in order of polling urgency
+LIVE = 'live'
+BREAK = 'break'
+PREGAME = 'pregame'
+FINAL = 'final'
+
+# getLiveGameScores reports `status`, getLiveGameStats reports `phase`
+_STATES = {
+    'IN_PROGRESS': LIVE,
+    'INGAME': LIVE,
+    'HALFTIME': BREAK,
+    'SUSPENDED': BREAK,
+    'SCHEDULED': PREGAME,
+    'PREGAME': PREGAME,
+    'FINAL': FINAL,
+    'CANCELLED': FINAL,
+    'POSTPONED': FINAL,
+}
+
+
+@dataclass(frozen=True)
+class PollIntervals:
+    """Seconds between polls, by the most urgent state among the week's games"""
+
+    live: float = 5
+    halftime: float = 30
+    pregame: float = 60
+    final: float = 300
+    error: float = 15
+
+    def for_state(self, state: str) -> float:
+        return {LIVE: self.live, BREAK: self.halftime, PREGAME: self.pregame}.get(state, self.final)
+
+
+@dataclass(frozen=True)
+class Source:
+    """How to poll one live endpoint and read its games"""
+
+    name: str
+    resource: str
+    method: str
+    items_field: str
+    state_field: str
+
+
+SOURCES: Dict[str, Source] = {
+    'scores': Source('scores', 'scores', 'get_live_game_scores', 'games', 'status'),
+    'summaries': Source('summaries', 'football', 'get_live_game_stats', 'data', 'phase'),
+}
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """One changed value; path is the key path into the game's payload"""
+
+    path: Tuple[str, ...]
+    old: Any
+    new: Any
+
+
+@dataclass
+class GameDelta:
+    """What changed for one game between two polls"""
+
+    game_id: str
+    kind: str  # 'added', 'changed' or 'removed'
+    changes: List[FieldChange] = field(default_factory=list)
+    snapshot: Optional[Dict[str, Any]] = None
+
+
+def diff(old: Any, new: Any, path: Tuple[str, ...] = ()) -> List[FieldChange]:
+    """
+    Compare two JSON-like values.
+
+    Dicts are compared key by key (recursively); anything else, lists included,
+    is compared as a whole.
+
+    Returns:
+        The changed leaves, in key order
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in list(old) + [key for key in new if key not in old]:
+            changes.extend(diff(old.get(key), new.get(key), path + (key,)))
+        return changes
+    return [] if old == new else [FieldChange(path, old, new)]
+
+
+def _to_dict(item: Any) -> Dict[str, Any]:
+    """Turn a response model into plain JSON data, keyed by API field names"""
+    if hasattr(item, 'model_dump'):
+        return item.model_dump(mode='json', by_alias=True)
+    return dict(item)
+
+
+def game_state(game: Dict[str, Any], state_field: str) -> str:
+    """Classify a game snapshot as live, break, pregame or final"""
+    value = str(game.get(state_field) or '')
+    if value.startswith('FINAL'):
+        return FINAL
+    return _STATES.get(value, PREGAME)
+
+
+class LivePoller:
+    """Polls a live endpoint for one week and yields the changes between polls"""
+
+    def __init__(
+            self,
+            sdk: GriddyNFL,
+            season: int,
+            season_type: str,
+            week: int,
+            source: str = 'summaries',
+            intervals: PollIntervals = PollIntervals(),
+            stop_when_final: bool = True,
+            max_errors: int = 5,
+    ):
+        """
+        Args:
+            sdk: SDK instance
+            season: Season year
+            season_type: PRE, REG or POST
+            week: Week number
+            source: 'summaries' (getLiveGameStats) or 'scores' (getLiveGameScores)
+            intervals: Poll intervals by game state
+            stop_when_final: Stop iterating once every game is final
+            max_errors: Consecutive failed polls tolerated before the error is raised
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Unknown source {source!r}; expected one of {', '.join(SOURCES)}")
+        self.sdk = sdk
+        self.params = {'season': season, 'season_type': season_type, 'week': week}
+        self.source = SOURCES[source]
+        self.intervals = intervals
+        self.stop_when_final = stop_when_final
+        self.max_errors = max_errors
+        self.snapshots: Dict[str, Dict[str, Any]] = {}
+        self._errors = 0
+
+    # ------------------------------------------------------------------
+    # One poll
+    # ------------------------------------------------------------------
+
+    def _endpoint(self, suffix: str = ''):
+        return getattr(getattr(self.sdk, self.source.resource), self.source.method + suffix)
+
+    def update(self, response: Any) -> List[GameDelta]:
+        """Record a response from the source endpoint and return the deltas against the last one"""
+        items = getattr(response, self.source.items_field, None) or []
+        current = {}
+        for item in items:
+            game = _to_dict(item)
+            current[str(game.get('gameId'))] = game
+
+        deltas = []
+        for game_id, game in current.items():
+            previous = self.snapshots.get(game_id)
+            if previous is None:
+                deltas.append(GameDelta(game_id, 'added', diff({}, game), game))
+            else:
+                changes = diff(previous, game)
+                if changes:
+                    deltas.append(GameDelta(game_id, 'changed', changes, game))
+        for game_id in self.snapshots.keys() - current.keys():
+            deltas.append(GameDelta(game_id, 'removed'))
+        self.snapshots = current
+        return deltas
+
+    def poll(self) -> List[GameDelta]:
+        """Poll the endpoint once (blocking)"""
+        return self.update(self._endpoint()(**self.params))
+
+    async def apoll(self) -> List[GameDelta]:
+        """Poll the endpoint once (async)"""
+        return self.update(await self._endpoint('_async')(**self.params))
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        """The most urgent state among the current games (final when there are none)"""
+        states = {game_state(game, self.source.state_field) for game in self.snapshots.values()}
+        for state in (LIVE, BREAK, PREGAME):
+            if state in states:
+                return state
+        return FINAL
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.snapshots) and self.state == FINAL
+
+    def next_interval(self) -> float:
+        """Seconds to wait before the next poll"""
+        if self._errors:
+            return self.intervals.error
+        return self.intervals.for_state(self.state)
+
+    def _failed(self, error: Exception):
+        self._errors += 1
+        if self._errors >= self.max_errors:
+            raise error
+
+    def __iter__(self) -> Iterator[List[GameDelta]]:
+        """Poll until every game is final, yielding each non-empty batch of deltas"""
+        while True:
+            try:
+                deltas = self.poll()
+            except Exception as e:
+                self._failed(e)
+            else:
+                self._errors = 0
+                if deltas:
+                    yield deltas
+                if self.stop_when_final and self.finished:
+                    return
+            time.sleep(self.next_interval())
+
+    async def __aiter__(self) -> AsyncIterator[List[GameDelta]]:
+        """Async version of iteration; sleeps without blocking the event loop"""
+        while True:
+            try:
+                deltas = await self.apoll()
+            except Exception as e:
+                self._failed(e)
+            else:
+                self._errors = 0
+                if deltas:
+                    yield deltas
+                if self.stop_when_final and self.finished:
+                    return
+            await asyncio.sleep(self.next_interval())
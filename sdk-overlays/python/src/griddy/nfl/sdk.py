@@ -0,0 +1,175 @@
+"""
+GriddyNFL, the SDK's entry point.
+
+Hand-owned (the generator output is not copied over it). Sub-SDKs are
+created on first attribute access: `sdk.teams` imports griddy.nfl.teams and
+its models only when it is used, so a job calling one endpoint doesn't pay for
+importing all thirty tags. The attributes come from _sub_sdks.py, which
+griddy-sdk-sources' scripts/sub_sdks.py regenerates from the spec's tags.
+"""
+import sys
+import weakref
+import importlib
+from typing import Any, Callable, Dict, Optional, Union, cast
+
+import httpx
+
+from griddy.nfl import models, utils
+from griddy.nfl._hooks import SDKHooks
+from griddy.nfl._hooks.transport import SharedTransport, TransportConfig
+from griddy.nfl.types import OptionalNullable, UNSET
+
+from ._sub_sdks import SUB_SDKS, SubSDKs
+from .basesdk import BaseSDK
+from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
+from .sdkconfiguration import SDKConfiguration
+from .utils.logger import Logger, get_default_logger
+from .utils.retries import RetryConfig
+
+
+class GriddyNFL(SubSDKs, BaseSDK):
+    _sub_sdk_map = SUB_SDKS
+
+    def __init__(
+            self,
+            nfl_auth: Optional[Union[Optional[str], Callable[[], Optional[str]]]] = None,
+            server_idx: Optional[int] = None,
+            server_url: Optional[str] = None,
+            url_params: Optional[Dict[str, str]] = None,
+            client: Optional[HttpClient] = None,
+            async_client: Optional[AsyncHttpClient] = None,
+            retry_config: OptionalNullable[RetryConfig] = UNSET,
+            timeout_ms: Optional[int] = None,
+            debug_logger: Optional[Logger] = None,
+            transport: Optional[Union[TransportConfig, SharedTransport]] = None,
+    ) -> None:
+        """
+        Instantiate the SDK.
+
+        Args:
+            nfl_auth: The bearer token, or a callable returning it, used for authentication
+            server_idx: The index of the server to use for all methods
+            server_url: The server URL to use for all methods
+            url_params: Parameters to optionally template the server URL with
+            client: The HTTP client to use for all synchronous methods
+            async_client: The async HTTP client to use for all asynchronous methods
+            retry_config: The retry configuration to use for all supported methods
+            timeout_ms: Optional request timeout applied to each operation in milliseconds
+            debug_logger: Logger for request and response debugging
+            transport: Connection pool settings for the default clients: a
+                TransportConfig for pools of this instance's own, or a
+                SharedTransport to share pools with other instances (default:
+                the process-wide pools, see _hooks/transport.py)
+        """
+        client_supplied = True
+        if client is None:
+            client = httpx.Client(follow_redirects=True)
+            client_supplied = False
+
+        assert issubclass(type(client), HttpClient), "The provided client must implement the HttpClient protocol."
+
+        async_client_supplied = True
+        if async_client is None:
+            async_client = httpx.AsyncClient(follow_redirects=True)
+            async_client_supplied = False
+
+        assert issubclass(type(async_client), AsyncHttpClient), \
+            "The provided async_client must implement the AsyncHttpClient protocol."
+
+        if debug_logger is None:
+            debug_logger = get_default_logger()
+
+        security: Any = None
+        if callable(nfl_auth):
+            # pylint: disable=unnecessary-lambda-assignment
+            security = lambda: models.Security(nfl_auth=nfl_auth())
+        else:
+            security = models.Security(nfl_auth=nfl_auth)
+
+        if server_url is not None and url_params is not None:
+            server_url = utils.template_url(server_url, url_params)
+
+        BaseSDK.__init__(
+            self,
+            SDKConfiguration(
+                client=client,
+                client_supplied=client_supplied,
+                async_client=async_client,
+                async_client_supplied=async_client_supplied,
+                security=security,
+                server_url=server_url,
+                server_idx=server_idx,
+                retry_config=retry_config,
+                timeout_ms=timeout_ms,
+                debug_logger=debug_logger,
+            ),
+            parent_ref=self,
+        )
+
+        hooks = SDKHooks()
+
+        # pylint: disable=protected-access
+        self.sdk_configuration.__dict__['_hooks'] = hooks
+        # Read by SharedTransportHook
+        self.sdk_configuration.__dict__['_transport'] = transport
+
+        self.sdk_configuration = hooks.sdk_init(self.sdk_configuration)
+
+        weakref.finalize(
+            self,
+            close_clients,
+            cast(ClientOwner, self.sdk_configuration),
+            self.sdk_configuration.client,
+            self.sdk_configuration.client_supplied,
+            self.sdk_configuration.async_client,
+            self.sdk_configuration.async_client_supplied,
+        )
+
+    @staticmethod
+    def dynamic_import(modname: str, retries: int = 3):
+        """Import a sub-SDK module, retrying if another thread left it half-initialized"""
+        for attempt in range(retries):
+            try:
+                return importlib.import_module(modname)
+            except KeyError:
+                sys.modules.pop(modname, None)
+                if attempt == retries - 1:
+                    break
+        raise KeyError(f"Failed to import module '{modname}' after {retries} attempts")
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not set yet: a sub-SDK is created once and then cached on the instance
+        if name in self._sub_sdk_map:
+            module_path, class_name = self._sub_sdk_map[name]
+            try:
+                module = self.dynamic_import(module_path)
+                klass = getattr(module, class_name)
+            except ImportError as e:
+                raise AttributeError(f"Failed to import module {module_path} for attribute {name}: {e}") from e
+            except AttributeError as e:
+                raise AttributeError(f"Failed to find class {class_name} in module {module_path} "
+                                     f"for attribute {name}: {e}") from e
+            instance = klass(self.sdk_configuration, parent_ref=self)
+            setattr(self, name, instance)
+            return instance
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._sub_sdk_map))
+
+    def __enter__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_val, _exc_tb):
+        if self.sdk_configuration.client is not None and not self.sdk_configuration.client_supplied:
+            self.sdk_configuration.client.close()
+        self.sdk_configuration.client = None
+
+    async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
+        if self.sdk_configuration.async_client is not None and not self.sdk_configuration.async_client_supplied:
+            await self.sdk_configuration.async_client.aclose()
+        self.sdk_configuration.async_client = None
@@ -0,0 +1,368 @@
+"""
+Local SQLite store for the responses of completed games.
+
+Once a game is final its box score, play-by-play, gamecenter and win
+probability responses never change, yet analysis jobs download them again on
+every run. `GameStoreHook` keeps them in a SQLite database:
+
+    - A response is stored only when its game is known to be final: the
+      payload itself says so (e.g. `game.status`, `schedule.score.phase`), or
+      an earlier response or schedule listing marked the game final
+    - Later requests for the same operation, game and query parameters are
+      answered from the store (marked `x-griddy-store: hit`) without touching
+      the network, in every process pointed at the same database
+    - Bodies are zlib-compressed, and each row records the schema version of
+      the SDK that stored it; rows from another version are ignored and
+      replaced, so a regenerated SDK never parses an old payload shape
+
+Enable it by pointing GRIDDY_NFL_STORE at a database file (registration.py
+reads it). The hook needs `sdkHooksConfigAccess: true` in gen.yaml.
+
+Backfilling a season, with at most --concurrency requests in flight:
+
+    python -m griddy.nfl.store backfill --db games.sqlite --season 2024 --weeks 1-18
+
+The backfill authenticates with GRIDDY_NFL_ACCESS_TOKEN, or through the token
+manager when GRIDDY_NFL_CLIENT_KEY and GRIDDY_NFL_CLIENT_SECRET are set.
+"""
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import asyncio
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from .httpclient import AsyncHttpClient, HttpClient
+from .sdkconfiguration import SDKConfiguration
+from ._hooks.response_cache import OPERATION_ID_EXTENSION, _DROPPED_HEADERS
+from ._hooks.types import BeforeRequestContext, BeforeRequestHook, SDKInitHook
+
+# Operations whose responses are stored once their game is final
+STORED_OPERATIONS = {
+    'getFootballBoxScore',
+    'getPlayByPlay',
+    'getGamecenter',
+    'getStatsBoxscore',
+    'getPlaysWinProbability',
+}
+
+_PATH_GAME_ID = re.compile(r'/games/([^/]+)/')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    operation_id   TEXT NOT NULL,
+    game_id        TEXT NOT NULL,
+    variant        TEXT NOT NULL,
+    schema_version TEXT NOT NULL,
+    status_code    INTEGER NOT NULL,
+    headers        TEXT NOT NULL,
+    content        BLOB NOT NULL,
+    stored_at      REAL NOT NULL,
+    PRIMARY KEY (operation_id, game_id, variant)
+);
+CREATE TABLE IF NOT EXISTS final_games (
+    game_id   TEXT PRIMARY KEY,
+    marked_at REAL NOT NULL
+);
+"""
+
+
+def _status_value(value: Any) -> str:
+    return str(getattr(value, 'value', value) or '').upper()
+
+
+def payload_is_final(data: Any) -> bool:
+    """Whether a response body reports its game as final"""
+    if isinstance(data, list):
+        return bool(data) and all(payload_is_final(item) for item in data)
+    if not isinstance(data, dict):
+        return False
+    game = data.get('game') if isinstance(data.get('game'), dict) else {}
+    schedule = data.get('schedule') if isinstance(data.get('schedule'), dict) else {}
+    score = schedule.get('score') if isinstance(schedule.get('score'), dict) else {}
+    for value in (game.get('status'), game.get('phase'), score.get('phase'), data.get('status'), data.get('phase')):
+        if _status_value(value).startswith('FINAL'):
+            return True
+    return False
+
+
+def payload_game_ids(data: Any) -> List[str]:
+    """Every id (UUID or legacy) a response body gives for its game"""
+    if not isinstance(data, dict):
+        return []
+    ids = []
+    game = data.get('game') if isinstance(data.get('game'), dict) else {}
+    schedule = data.get('schedule') if isinstance(data.get('schedule'), dict) else {}
+    ids += [game.get('id'), schedule.get('gameId'), schedule.get('smartId'), data.get('gameId')]
+    ids += [external.get('id') for external in game.get('externalIds') or [] if isinstance(external, dict)]
+    return [str(game_id) for game_id in ids if game_id]
+
+
+def request_game_key(request: httpx.Request) -> Optional[Tuple[str, str, str]]:
+    """
+    Identify a storable request.
+
+    Returns:
+        Tuple of (operation_id, game_id, variant), where variant holds the
+        other query parameters, or None if the request can't be stored
+    """
+    operation_id = request.extensions.get(OPERATION_ID_EXTENSION, '')
+    if request.method != 'GET' or operation_id not in STORED_OPERATIONS:
+        return None
+    params = request.url.params
+    game_ids = params.get_list('gameId') or params.get_list('fapiGameId')
+    if len(game_ids) > 1:
+        # Batch requests mix games; only single-game responses are stored
+        return None
+    if game_ids:
+        game_id = game_ids[0]
+    else:
+        match = _PATH_GAME_ID.search(request.url.path)
+        if match is None:
+            return None
+        game_id = match.group(1)
+    variant = '&'.join(f"{k}={v}" for k, v in sorted(params.multi_items()) if k not in ('gameId', 'fapiGameId'))
+    return operation_id, game_id, variant
+
+
+class GameStore:
+    """SQLite-backed store of final-game responses (one connection per thread)"""
+
+    def __init__(self, path: Union[str, Path], schema_version: str = ''):
+        self.path = str(path)
+        self.schema_version = schema_version
+        self._local = threading.local()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def mark_final(self, game_ids: Iterable[str]):
+        """Record games as final, by any of their ids"""
+        now = time.time()
+        self._connection().executemany(
+            'INSERT OR IGNORE INTO final_games (game_id, marked_at) VALUES (?, ?)',
+            [(str(game_id), now) for game_id in game_ids if game_id],
+        )
+
+    def is_final(self, game_id: str) -> bool:
+        row = self._connection().execute('SELECT 1 FROM final_games WHERE game_id = ?', (game_id,)).fetchone()
+        return row is not None
+
+    def get(self, operation_id: str, game_id: str, variant: str = '') -> Optional[Tuple[int, list, bytes]]:
+        """Return (status_code, headers, content) if stored by this schema version"""
+        row = self._connection().execute(
+            'SELECT status_code, headers, content FROM responses '
+            'WHERE operation_id = ? AND game_id = ? AND variant = ? AND schema_version = ?',
+            (operation_id, game_id, variant, self.schema_version),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), zlib.decompress(row[2])
+
+    def put(self, operation_id: str, game_id: str, variant: str, status_code: int, headers: list, content: bytes):
+        self._connection().execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (operation_id, game_id, variant, self.schema_version, status_code,
+             json.dumps(headers), zlib.compress(content, 6), time.time()),
+        )
+
+    def lookup(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """Serve a request from the store, if it holds the response"""
+        key = request_game_key(request)
+        stored = self.get(*key) if key is not None else None
+        if stored is None:
+            return None
+        status_code, headers, content = stored
+        return httpx.Response(status_code, headers=headers + [['x-griddy-store', 'hit']], content=content, request=request)
+
+    def record(self, request: httpx.Request, response: httpx.Response):
+        """Store a response (already read) if its game is final"""
+        key = request_game_key(request)
+        if key is None or response.status_code != 200:
+            return
+        try:
+            data = response.json()
+        except ValueError:
+            return
+        operation_id, game_id, variant = key
+        if payload_is_final(data):
+            self.mark_final([game_id, *payload_game_ids(data)])
+        elif not self.is_final(game_id):
+            return
+        headers = [[k, v] for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+        self.put(operation_id, game_id, variant, response.status_code, headers, response.content)
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class StoreHttpClient:
+    """HttpClient wrapper that serves and records final-game responses"""
+
+    def __init__(self, client: HttpClient, store: GameStore):
+        self._client = client
+        self.store = store
+
+    def send(self, request: httpx.Request, *, stream: bool = False, **kwargs) -> httpx.Response:
+        stored = None if stream else self.store.lookup(request)
+        if stored is not None:
+            return stored
+        response = self._client.send(request, stream=stream, **kwargs)
+        if not stream and request_game_key(request) is not None:
+            response.read()
+            self.store.record(request, response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class AsyncStoreHttpClient:
+    """AsyncHttpClient wrapper that serves and records final-game responses"""
+
+    def __init__(self, client: AsyncHttpClient, store: GameStore):
+        self._client = client
+        self.store = store
+
+    async def send(self, request: httpx.Request, *, stream: bool = False, **kwargs) -> httpx.Response:
+        # SQLite reads and writes are local and short, so they run inline
+        stored = None if stream else self.store.lookup(request)
+        if stored is not None:
+            return stored
+        response = await self._client.send(request, stream=stream, **kwargs)
+        if not stream and request_game_key(request) is not None:
+            await response.aread()
+            self.store.record(request, response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class GameStoreHook(SDKInitHook, BeforeRequestHook):
+    """Installs a GameStore on the SDK's sync and async HTTP clients"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = path
+        self.store: Optional[GameStore] = None
+
+    def sdk_init(self, config: SDKConfiguration) -> SDKConfiguration:
+        if self.store is None:
+            # Tie stored payloads to the spec and generator versions that produced this SDK
+            version = f"{getattr(config, 'openapi_doc_version', '')}/{getattr(config, 'gen_version', '')}"
+            self.store = GameStore(self.path, version)
+        if config.client is not None and not isinstance(config.client, StoreHttpClient):
+            config.client = StoreHttpClient(config.client, self.store)
+        if config.async_client is not None and not isinstance(config.async_client, AsyncStoreHttpClient):
+            config.async_client = AsyncStoreHttpClient(config.async_client, self.store)
+        return config
+
+    def before_request(self, hook_ctx: BeforeRequestContext, request: httpx.Request) -> Union[httpx.Request, Exception]:
+        request.extensions[OPERATION_ID_EXTENSION] = hook_ctx.operation_id
+        return request
+
+
+# ----------------------------------------------------------------------
+# Backfill
+# ----------------------------------------------------------------------
+
+BACKFILL_ENDPOINTS = ('boxscore', 'playbyplay', 'gamecenter', 'winprobability')
+
+
+def parse_weeks(value: str) -> List[int]:
+    """Parse "1-18" or "1,2,5" into week numbers"""
+    weeks = []
+    for part in value.split(','):
+        start, _, end = part.strip().partition('-')
+        weeks.extend(range(int(start), int(end or start) + 1))
+    return weeks
+
+
+async def backfill(
+        sdk,
+        store: GameStore,
+        season: int,
+        season_type: str = 'REG',
+        weeks: Iterable[int] = range(1, 19),
+        endpoints: Iterable[str] = BACKFILL_ENDPOINTS,
+        concurrency: int = 8,
+) -> Tuple[int, int]:
+    """
+    Fetch every stored endpoint for the season's final games into the store.
+
+    The SDK must have the store hook installed (GRIDDY_NFL_STORE), so that
+    responses already stored are served locally and new ones are recorded.
+
+    Returns:
+        Tuple of (succeeded, failed) calls
+    """
+    from .bulk import bulk_fetch, games_for_weeks
+
+    games = await games_for_weeks(sdk, season, season_type, weeks)
+    final = [game for game in games if _status_value(game.status).startswith('FINAL')]
+    store.mark_final(game_id for game in final for game_id in (game.id, game.legacy_id))
+
+    succeeded = failed = 0
+    async for result in bulk_fetch(sdk, final, tuple(endpoints), concurrency):
+        if result.ok:
+            succeeded += 1
+        else:
+            failed += 1
+            print(f"{result.game.id} {result.endpoint}: {result.error!r}", file=sys.stderr)
+    print(f"{len(final)} of {len(games)} games final; {succeeded} responses fetched, {failed} failed")
+    return succeeded, failed
+
+
+def main():
+    """Main entry point for the store command line"""
+    parser = argparse.ArgumentParser(description='Manage the local store of final-game responses')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fill = subparsers.add_parser('backfill', help='Store every final game of a season')
+    fill.add_argument('--db', default=os.environ.get('GRIDDY_NFL_STORE'), help='SQLite database path')
+    fill.add_argument('--season', type=int, required=True, help='Season year')
+    fill.add_argument('--season-type', default='REG', choices=['PRE', 'REG', 'POST'], help='Season type')
+    fill.add_argument('--weeks', type=parse_weeks, default=list(range(1, 19)), help='Weeks, e.g. 1-18 or 1,2,5')
+    fill.add_argument('--endpoints', default=','.join(BACKFILL_ENDPOINTS), help='Comma-separated endpoints')
+    fill.add_argument('--concurrency', type=int, default=8, help='Maximum requests in flight')
+
+    args = parser.parse_args()
+    if not args.db:
+        parser.error('--db is required (or set GRIDDY_NFL_STORE)')
+
+    # registration.py installs the store hook from this variable
+    os.environ['GRIDDY_NFL_STORE'] = args.db
+    from ._hooks import registration
+    from .sdk import GriddyNFL
+
+    async def run():
+        sdk = GriddyNFL(nfl_auth=os.environ.get('GRIDDY_NFL_ACCESS_TOKEN', ''))
+        return await backfill(
+            sdk, registration._shared_store_hook().store, args.season, args.season_type, args.weeks,
+            [name.strip() for name in args.endpoints.split(',') if name.strip()], args.concurrency,
+        )
+
+    _, failed = asyncio.run(run())
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()